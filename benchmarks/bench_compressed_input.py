@@ -0,0 +1,75 @@
+## Compare reading a table from a plain file with reading it from gzip, bzip2, xz (and zstandard, if available)
+## compressed copies, with the row iterator and with the vectorized read_columns of the TableReader.
+## The table is the Steckel 2012 supplement, scaled up by a factor (default 20).
+## Usage: python benchmarks/bench_compressed_input.py [scale]
+
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from idg2sl.table_reader import TableReader
+
+data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+scale = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+columns = ['GeneID', 'HCT-116.Z-score', 'HKE-3.Z-score', 'D.Z-score']
+numeric = columns[1:]
+
+
+def get_zstd_open():
+    try:
+        from compression import zstd
+        return zstd.open
+    except ImportError:
+        pass
+    try:
+        import zstandard
+        return zstandard.open
+    except ImportError:
+        return None
+
+
+def iterate(fname):
+    return sum(1 for _ in TableReader(fname, columns))
+
+
+def read_columns(fname):
+    return len(TableReader(fname, columns).read_columns(numeric=numeric)['GeneID'])
+
+
+with open(os.path.join(data_dir, 'steckel-2012-KRAS.tsv')) as f:
+    header = f.readline()
+    body = f.read()
+text = header + body * scale
+tmpdir = tempfile.mkdtemp()
+try:
+    formats = [('plain', '', open), ('gzip', '.gz', gzip.open), ('bzip2', '.bz2', bz2.open), ('xz', '.xz', lzma.open)]
+    zstd_open = get_zstd_open()
+    if zstd_open is None:
+        print("[INFO] zstandard is not available, skipping .zst")
+    else:
+        formats.append(('zstd', '.zst', zstd_open))
+    t_plain = None
+    for label, suffix, open_function in formats:
+        # each format in its own directory, so that the plain file name resolves to the compressed copy
+        fname = os.path.join(tmpdir, label, 'steckel.tsv')
+        os.mkdir(os.path.dirname(fname))
+        with open_function(fname + suffix, 'wt') as f:
+            f.write(text)
+        size = os.path.getsize(fname + suffix)
+        n = iterate(fname)
+        if read_columns(fname) != n:
+            raise ValueError("read_columns and the iterator read a different number of rows")
+        t_iter = min(timeit.repeat(lambda: iterate(fname), number=1, repeat=3))
+        t_columns = min(timeit.repeat(lambda: read_columns(fname), number=1, repeat=3))
+        if t_plain is None:
+            t_plain = (t_iter, t_columns)
+        print("[INFO] %-6s %8.1f KB  iterate %7.1f ms (%.2fx)  read_columns %7.1f ms (%.2fx)  %d rows" %
+              (label, size / 1024, 1000 * t_iter, t_iter / t_plain[0], 1000 * t_columns,
+               t_columns / t_plain[1], n))
+finally:
+    shutil.rmtree(tmpdir)
@@ -0,0 +1,73 @@
+## Compare the sort-based marking of the maximum entry of each gene pair with the single-pass EvidenceAggregator,
+## on groups with thousands of entries, on many small groups, and on a mix like the output of the parsers (mostly
+## one entry per gene pair). The sort only handles numeric effect sizes for which a larger |effect| is better;
+## the single pass also handles p- and q-values and non-numeric effects, with the scoring inlined in its loop, and
+## skips the groups with one entry.
+## Usage: python benchmarks/bench_evidence_aggregation.py [groups] [entries per group]
+
+import os
+import random
+import sys
+import timeit
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from idg2sl.synthetic_lethal_interaction import SyntheticLethalInteraction
+from idg2sl.parsers.sl_constants import SlConstants
+from idg2sl.gene_pair import GenePair
+from idg2sl.evidence_aggregation import EvidenceAggregator
+
+
+def make_groups(group_sizes):
+    random.seed(42)
+    sli_dict = {}
+    for g, group_size in enumerate(group_sizes):
+        geneB = 'GENE%d' % g
+        sli_dict[GenePair('KRAS', geneB)] = [
+            SyntheticLethalInteraction(gene_A_symbol='KRAS', gene_A_id=SlConstants.KRAS_GENE_ID, gene_B_symbol=geneB,
+                                       gene_B_id='NCBIGene:%d' % (100000 + g),
+                                       gene_A_pert=SlConstants.ACTIVATING_MUTATION, gene_B_pert=SlConstants.SI_RNA,
+                                       effect_type=SlConstants.ZSCORE, effect_size=random.gauss(0, 2),
+                                       assay=SlConstants.RNA_INTERFERENCE_ASSAY, pmid='1', SL=False)
+            for _ in range(group_size)]
+    return sli_dict
+
+
+def sort_based(sli_dict):
+    # the previous implementation of SL_DatasetParser._mark_maximum_entries (on copies of the lists)
+    sli_list = []
+    for k, vlist in sli_dict.items():
+        vlist = list(vlist)
+        vlist.sort(key=lambda x: abs(x.effect_size), reverse=True)
+        sli = vlist[0]
+        sli.set_maximum()
+        sli_list.append(sli)
+        for s in vlist[1:]:
+            sli_list.append(s)
+    return sli_list
+
+
+def single_pass(sli_dict):
+    # the current implementation of SL_DatasetParser._mark_maximum_entries
+    return EvidenceAggregator.mark_maximum_in_groups(sli_dict.values())
+
+
+if len(sys.argv) > 2:
+    scenarios = [("%s groups of %s entries" % (sys.argv[1], sys.argv[2]), [int(sys.argv[2])] * int(sys.argv[1]))]
+else:
+    random.seed(1)
+    scenarios = [("20 groups of 5000 entries", [5000] * 20),
+                 ("2000 groups of 10 entries", [10] * 2000),
+                 ("10000 groups, 90% with one entry", [1 if random.random() < 0.9 else random.randint(2, 20)
+                                                      for _ in range(10000)])]
+for label, group_sizes in scenarios:
+    sli_dict = make_groups(group_sizes)
+    best_old = [s.get_effect_size() for s in sort_based(sli_dict) if s.is_maximum()]
+    best_new = [s.get_effect_size() for s in single_pass(sli_dict) if s.is_maximum()]
+    if best_old != best_new:
+        raise ValueError("The two methods chose different maximum entries")
+    n = sum(group_sizes)
+    t_sort = min(timeit.repeat(lambda: sort_based(sli_dict), number=1, repeat=5))
+    t_single = min(timeit.repeat(lambda: single_pass(sli_dict), number=1, repeat=5))
+    print("[INFO] %s" % label)
+    print("[INFO]   sort by |effect|: %8.1f ms %10.0f entries/s" % (1000 * t_sort, n / t_sort))
+    print("[INFO]   single pass:      %8.1f ms %10.0f entries/s (%.2fx)" % (1000 * t_single, n / t_single,
+                                                                          t_sort / t_single))
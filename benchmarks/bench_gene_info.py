@@ -0,0 +1,48 @@
+## Compare load time and memory of the HGNC protein-coding index and the NCBI gene_info index.
+## Usage: python benchmarks/bench_gene_info.py [protein-coding_gene.txt] [Homo_sapiens.gene_info.gz]
+
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from idg2sl import HgncParser, GeneInfoParser
+
+hgnc_fname = sys.argv[1] if len(sys.argv) > 1 else 'protein-coding_gene.txt'
+gene_info_fname = sys.argv[2] if len(sys.argv) > 2 else os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'test', 'data', 'Homo_sapiens.gene_info.gz')
+for fname in (hgnc_fname, gene_info_fname):
+    if not os.path.isfile(fname):
+        raise ValueError("Could not find %s" % fname)
+
+
+def measure_memory(build):
+    tracemalloc.start()
+    index = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return index, size
+
+
+tmpdir = tempfile.mkdtemp()
+hgnc_cache = os.path.join(tmpdir, 'hgnc.hgnc-index')
+gene_info_cache = os.path.join(tmpdir, 'gene_info.hgnc-index')
+loaders = [
+    ("HGNC TSV", lambda: HgncParser(hgnc_fname)),
+    ("HGNC cache", lambda: HgncParser.load(hgnc_fname, cache_fname=hgnc_cache)),
+    ("gene_info.gz", lambda: GeneInfoParser(gene_info_fname)),
+    ("gene_info.gz (human)", lambda: GeneInfoParser(gene_info_fname, taxa=[GeneInfoParser.HUMAN])),
+    ("gene_info cache", lambda: GeneInfoParser.load(gene_info_fname, cache_fname=gene_info_cache)),
+]
+HgncParser.load(hgnc_fname, cache_fname=hgnc_cache)
+GeneInfoParser.load(gene_info_fname, cache_fname=gene_info_cache)
+repeat = 5
+for name, build in loaders:
+    t = min(timeit.repeat(build, number=1, repeat=repeat))
+    index, size = measure_memory(build)
+    n = len(index.get_entrez_dictionary())
+    print("[INFO] %-22s %8.2f ms %8.2f MB %7d symbols" % (name, 1000 * t, size / 1e6, n))
+os.remove(hgnc_cache)
+os.remove(gene_info_cache)
+os.rmdir(tmpdir)
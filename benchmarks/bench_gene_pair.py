@@ -0,0 +1,63 @@
+## Compare grouping the entries of a large dataset by gene pair with a GenePair of the two symbols as the key of a
+## defaultdict(list) (as the parsers did) with GenePairGroups (a packed integer GenePairKey of the two NCBI Gene ids),
+## one entry at a time and as a batch, and the memory of the groups.
+## Usage: python benchmarks/bench_gene_pair.py [number of records (default 1000000)]
+
+import os
+import sys
+import timeit
+import tracemalloc
+from collections import defaultdict
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from idg2sl import SyntheticLethalInteraction
+from idg2sl import SlConstants
+from idg2sl.gene_pair import GenePair, GenePairGroups
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+n_genes = 20000
+records = SyntheticLethalInteraction.from_columns(
+    {'gene_A_symbol': ['GENE%d' % (i % 4) for i in range(n)],
+     'gene_A_id': ['NCBIGene:%d' % (500000 + i % 4) for i in range(n)],
+     'gene_B_symbol': ['GENE%d' % (i % n_genes) for i in range(n)],
+     'gene_B_id': ['NCBIGene:%d' % (100000 + i % n_genes) for i in range(n)],
+     'effect_size': [((i * 7919) % 1000) / 100.0 - 5 for i in range(n)]},
+    gene_A_pert=SlConstants.SI_RNA, gene_B_pert=SlConstants.SI_RNA, effect_type=SlConstants.ZSCORE,
+    assay=SlConstants.RNA_INTERFERENCE_ASSAY, pmid='1', SL=True)
+
+
+def by_gene_pair():
+    sli_dict = defaultdict(list)
+    for sli in records:
+        gene_pair = GenePair(sli.get_gene_A_symbol(), sli.get_gene_B_symbol())
+        sli_dict[gene_pair].append(sli)
+    return sli_dict
+
+
+def by_pair_key_per_row():
+    sli_dict = GenePairGroups()
+    for sli in records:
+        sli_dict.add(sli)
+    return sli_dict
+
+
+def by_pair_key():
+    sli_dict = GenePairGroups()
+    sli_dict.add_all(records)
+    return sli_dict
+
+
+def get_memory(function):
+    tracemalloc.start()
+    groups = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, len(groups)
+
+
+if [len(g) for g in by_gene_pair().values()] != [len(g) for g in by_pair_key().values()]:
+    raise ValueError("GenePair and GenePairKey gave different groups")
+for label, function in [("GenePair", by_gene_pair), ("GenePairGroups.add", by_pair_key_per_row),
+                        ("GenePairGroups.add_all", by_pair_key)]:
+    t = min(timeit.repeat(function, number=1, repeat=3))
+    size, n_groups = get_memory(function)
+    print("[INFO] %-23s %d records, %d groups: %.2f s, %.1f MB" % (label, n, n_groups, t, size / 1e6))
@@ -0,0 +1,23 @@
+## Compare the time needed to build the HGNC index from the TSV file with the time needed to load the
+## compiled on-disk index. Usage: python benchmarks/bench_hgnc_index.py [protein-coding_gene.txt]
+
+import os
+import sys
+import tempfile
+import timeit
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from idg2sl import HgncParser
+
+hgnc_fname = sys.argv[1] if len(sys.argv) > 1 else 'protein-coding_gene.txt'
+if not os.path.isfile(hgnc_fname):
+    raise ValueError("Could not find %s. Please run parse_human_SLI.py first or pass the path of the HGNC file"
+                     % hgnc_fname)
+cache_fname = os.path.join(tempfile.mkdtemp(), 'bench.hgnc-index')
+HgncParser.load(hgnc_fname, cache_fname=cache_fname)  # write the cache
+repeat = 10
+t_tsv = min(timeit.repeat(lambda: HgncParser(hgnc_fname), number=1, repeat=repeat))
+t_cache = min(timeit.repeat(lambda: HgncParser.load(hgnc_fname, cache_fname=cache_fname), number=1, repeat=repeat))
+print("[INFO] Parse TSV:     %8.2f ms" % (1000 * t_tsv))
+print("[INFO] Load cache:    %8.2f ms" % (1000 * t_cache))
+print("[INFO] Speedup:       %8.1fx" % (t_tsv / t_cache))
+os.remove(cache_fname)
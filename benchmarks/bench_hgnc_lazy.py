@@ -0,0 +1,46 @@
+## Compare the time and memory needed for the symbol to NCBI Gene mapping alone with the time and memory
+## needed for all three HGNC mappings, from the TSV file and from the compiled on-disk index.
+## Usage: python benchmarks/bench_hgnc_lazy.py [protein-coding_gene.txt]
+
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from idg2sl import HgncParser
+
+hgnc_fname = sys.argv[1] if len(sys.argv) > 1 else 'protein-coding_gene.txt'
+if not os.path.isfile(hgnc_fname):
+    raise ValueError("Could not find %s. Please run parse_human_SLI.py first or pass the path of the HGNC file"
+                     % hgnc_fname)
+cache_fname = os.path.join(tempfile.mkdtemp(), 'bench.hgnc-index')
+HgncParser.load(hgnc_fname, cache_fname=cache_fname)  # write the cache
+
+
+def entrez_only(parser):
+    parser.get_entrez_dictionary()
+    return parser
+
+
+def all_mappings(parser):
+    parser.get_entrez_dictionary()
+    parser.get_ensembl_dictionary()
+    parser.get_synonym_dictionary()
+    return parser
+
+
+cases = [("TSV, Entrez only", lambda: entrez_only(HgncParser(hgnc_fname))),
+         ("TSV, all mappings", lambda: all_mappings(HgncParser(hgnc_fname))),
+         ("cache, Entrez only", lambda: entrez_only(HgncParser.load(hgnc_fname, cache_fname=cache_fname))),
+         ("cache, all mappings", lambda: all_mappings(HgncParser.load(hgnc_fname, cache_fname=cache_fname)))]
+repeat = 10
+for name, build in cases:
+    t = min(timeit.repeat(build, number=1, repeat=repeat))
+    tracemalloc.start()
+    parser = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del parser
+    print("[INFO] %-20s %8.2f ms %8.2f MB" % (name, 1000 * t, size / 1e6))
+os.remove(cache_fname)
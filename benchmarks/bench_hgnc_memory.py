@@ -0,0 +1,99 @@
+## Compare memory use and lookup latency of the HGNC index built with plain defaultdicts of strings (the
+## original HgncParser implementation, reproduced below) and of the compact, read-only HgncParser tables.
+## Usage: python benchmarks/bench_hgnc_memory.py [protein-coding_gene.txt]
+
+import csv
+import gc
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+from collections import defaultdict
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from idg2sl import HgncParser
+# HgncParser reads the file with NumPy (see TableReader), which is imported here so that the memory of the
+# module is not counted as memory of the tables
+import numpy
+
+
+def parse_with_dicts(fname):
+    symbol2entrez = defaultdict(str)
+    symbol2ensembl = defaultdict(str)
+    synonym2symbol = defaultdict(str)
+    with open(fname, 'r') as csvfile:
+        csvreader = csv.DictReader(csvfile, delimiter='\t')
+        for row in csvreader:
+            symbol = row['symbol']
+            for ps in row['prev_symbol'].replace('"', "").split('|') + row['alias_symbol'].replace('"', "").split('|'):
+                if ps in synonym2symbol:
+                    synonym2symbol[ps] = "MULTIPLE"
+                else:
+                    synonym2symbol[ps] = symbol
+            symbol2entrez[symbol] = row['entrez_id']
+            symbol2ensembl[symbol] = row['ensembl_gene_id']
+    return symbol2entrez, symbol2ensembl, synonym2symbol
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def lookup_latency(lookups, keys):
+    return min(timeit.repeat(lambda: [lookups(k) for k in keys], number=1, repeat=5)) / len(keys)
+
+
+def count_growth(d, keys):
+    n = len(d)
+    for k in keys:
+        try:
+            d[k]
+        except KeyError:
+            pass
+    return len(d) - n
+
+
+hgnc_fname = sys.argv[1] if len(sys.argv) > 1 else 'protein-coding_gene.txt'
+if not os.path.isfile(hgnc_fname):
+    raise ValueError("Could not find %s. Please run parse_human_SLI.py first or pass the path of the HGNC file"
+                     % hgnc_fname)
+(old_entrez, old_ensembl, old_synonym), old_size = measure(lambda: parse_with_dicts(hgnc_fname))
+
+
+def build_tables():
+    # the mappings are built on first use (see HgncParser), so they are requested while the memory is traced
+    parser = HgncParser(hgnc_fname)
+    return parser, parser.get_entrez_dictionary(), parser.get_ensembl_dictionary(), parser.get_synonym_dictionary()
+
+
+(hgnc, new_entrez, new_ensembl, new_synonym), new_size = measure(build_tables)
+
+random.seed(42)
+symbols = random.sample(list(old_entrez), min(5000, len(old_entrez)))
+synonyms = random.sample([s for s in old_synonym if s], min(5000, len(old_synonym) - 1))
+missing = ['NOTAGENE%d' % i for i in range(1000)]
+print("[INFO] %d symbols, %d synonyms" % (len(new_entrez), len(new_synonym)))
+print("[INFO] Memory, dicts of strings: %8.2f MB" % (old_size / 1e6))
+print("[INFO] Memory, compact tables:   %8.2f MB (%.1fx smaller)" % (new_size / 1e6, old_size / new_size))
+for name, keys, lookup in [('symbol -> NCBI Gene', symbols, lambda d, e, s, k: e.get(k)),
+                           ('symbol -> Ensembl', symbols, lambda d, e, s, k: d.get(k)),
+                           ('synonym -> symbol', synonyms, lambda d, e, s, k: s.get(k)),
+                           ('unknown symbol', missing, lambda d, e, s, k: k in e or k in s)]:
+    t_old = lookup_latency(lambda k: lookup(old_ensembl, old_entrez, old_synonym, k), keys)
+    t_new = lookup_latency(lambda k: lookup(new_ensembl, new_entrez, new_synonym, k), keys)
+    print("[INFO] Lookup %-20s dicts: %6.0f ns, compact: %6.0f ns" % (name, 1e9 * t_old, 1e9 * t_new))
+# the formatted ids are kept once they were looked up; after looking up every symbol, the maps hold all ids
+tracemalloc.start()
+for s in old_entrez:
+    if old_entrez[s] != new_entrez[s] or old_ensembl[s] != new_ensembl[s]:
+        raise ValueError("Mismatch for %s" % s)
+print("[INFO] Memory added by looking up all ids: %.2f MB" % (tracemalloc.get_traced_memory()[0] / 1e6))
+tracemalloc.stop()
+print("[INFO] Entries added by d[unknown]:  dicts: %d, compact: %d" % (count_growth(old_entrez, missing),
+                                                                     count_growth(new_entrez, missing)))
@@ -0,0 +1,67 @@
+## Build a PairEvidenceIndex over the entries of several studies in one pass and compare looking up the studies,
+## cell lines and assays of a gene pair in the index with a scan over all entries.
+## Usage: python benchmarks/bench_pair_evidence.py [number of records (default 1000000)]
+
+import os
+import sys
+import time
+import timeit
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from idg2sl import SyntheticLethalInteraction
+from idg2sl import SlConstants
+from idg2sl import PairEvidenceIndex
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+n_genes = 20000
+n_studies = 40
+studies = []
+for s in range(n_studies):
+    # each study has a fixed gene A and lists gene A as gene B in every other study
+    size = n // n_studies
+    gene_A = ('GENE%d' % (n_genes + s % 8), 'NCBIGene:%d' % (500000 + s % 8))
+    genes_B = [('GENE%d' % ((i * 7 + s) % n_genes), 'NCBIGene:%d' % (100000 + (i * 7 + s) % n_genes))
+               for i in range(size)]
+    columns = {'gene_B_symbol': [g[0] for g in genes_B], 'gene_B_id': [g[1] for g in genes_B],
+               'effect_size': [((i * 7919) % 1000) / 100.0 - 5 for i in range(size)],
+               'SL': [i % 5 == 0 for i in range(size)]}
+    if s % 2 == 1:
+        columns['gene_A_symbol'], columns['gene_B_symbol'] = columns['gene_B_symbol'], [gene_A[0]] * size
+        columns['gene_A_id'], columns['gene_B_id'] = columns['gene_B_id'], [gene_A[1]] * size
+        fields = {}
+    else:
+        fields = {'gene_A_symbol': gene_A[0], 'gene_A_id': gene_A[1]}
+    studies.append(SyntheticLethalInteraction.from_columns(
+        columns, gene_A_pert=SlConstants.SI_RNA, gene_B_pert=SlConstants.SI_RNA, effect_type=SlConstants.ZSCORE,
+        assay=SlConstants.RNA_INTERFERENCE_ASSAY, cell_line='cell line %d' % (s % 5), pmid=str(30000000 + s),
+        **fields))
+
+start = time.perf_counter()
+index = PairEvidenceIndex()
+for study in studies:
+    index.add_all(study)
+print("[INFO] %d records, %d gene pairs indexed in %.2f s" %
+      (sum(map(len, studies)), len(index), time.perf_counter() - start))
+query = ('NCBIGene:500000', 'NCBIGene:100000')
+
+
+def scan():
+    pmids, cell_lines, assays = set(), set(), set()
+    for study in studies:
+        for sli in study:
+            if {sli.gene_A_id, sli.gene_B_id} == set(query):
+                pmids.add(sli.pmid)
+                cell_lines.add(sli.cell_line)
+                assays.add(sli.assay)
+    return pmids, cell_lines, assays
+
+
+def lookup():
+    evidence = index.get_evidence(*query)
+    return set(evidence.get_pmids()), set(evidence.get_cell_lines()), set(evidence.get_assays())
+
+
+if scan() != lookup():
+    raise ValueError("The scan and the index gave different results")
+t_scan = min(timeit.repeat(scan, number=1, repeat=3))
+t_lookup = min(timeit.repeat(lookup, number=1000, repeat=3)) / 1000
+print("[INFO] evidence of one pair: scan %.1f ms, index %.4f ms" % (1000 * t_scan, 1000 * t_lookup))
@@ -0,0 +1,40 @@
+## Compare creating the SyntheticLethalInteraction objects of a large import one at a time (each call to the
+## constructor checks its arguments) with SyntheticLethalInteraction.from_columns (the batch is checked once, the
+## objects are then created without checks).
+## Usage: python benchmarks/bench_sli_factory.py [number of records (default 1000000)]
+
+import os
+import sys
+import timeit
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from idg2sl import SyntheticLethalInteraction
+from idg2sl import SlConstants
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+n_genes = 20000
+symbols = ['GENE%d' % (i % n_genes) for i in range(n)]
+ids = ['NCBIGene:%d' % (100000 + i % n_genes) for i in range(n)]
+zscores = [((i * 7919) % 1000) / 100.0 - 5 for i in range(n)]
+sl = [z <= -3 for z in zscores]
+fields = dict(gene_A_symbol='KRAS', gene_A_id=SlConstants.KRAS_GENE_ID, gene_A_pert=SlConstants.ACTIVATING_MUTATION,
+              gene_B_pert=SlConstants.SI_RNA, effect_type=SlConstants.ZSCORE, assay=SlConstants.RNA_INTERFERENCE_ASSAY,
+              cell_line=SlConstants.HCT_116, cellosaurus_id=SlConstants.HCT_116_CELLOSAURUS,
+              cancer_type=SlConstants.COLORECTAL_CARCINOMA, ncit_id=SlConstants.COLORECTAL_CARCINOMA_NCIT,
+              pmid='22613949')
+
+
+def one_at_a_time():
+    return [SyntheticLethalInteraction(gene_B_symbol=symbol, gene_B_id=gene_id, effect_size=zscore, SL=is_sl, **fields)
+            for symbol, gene_id, zscore, is_sl in zip(symbols, ids, zscores, sl)]
+
+
+def batch():
+    return SyntheticLethalInteraction.from_columns({'gene_B_symbol': symbols, 'gene_B_id': ids,
+                                                    'effect_size': zscores, 'SL': sl}, **fields)
+
+
+if [sli.get_tsv_line() for sli in one_at_a_time()[:1000]] != [sli.get_tsv_line() for sli in batch()[:1000]]:
+    raise ValueError("The constructor and from_columns gave different interactions")
+t_single = min(timeit.repeat(one_at_a_time, number=1, repeat=3))
+t_batch = min(timeit.repeat(batch, number=1, repeat=3))
+print("[INFO] %d records: constructor %.2f s, from_columns %.2f s (%.1fx)" % (n, t_single, t_batch, t_single / t_batch))
@@ -0,0 +1,92 @@
+## Compare the memory used by SyntheticLethalInteraction records with the original implementation (attributes in a
+## per-instance __dict__, no interning; reproduced below) for a genome-wide combinatorial import. The categorical
+## fields of each record are split from a table row, as in the parsers, so that every record starts with its own
+## copies of these strings. Each variant runs in a separate process and its peak resident memory is reported.
+## Usage: python benchmarks/bench_sli_memory.py [number of records (default 10000000)]
+
+import os
+import resource
+import subprocess
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from idg2sl import SyntheticLethalInteraction
+from idg2sl import SlConstants
+
+
+class DictInteraction:
+    """
+    The attributes of the original SyntheticLethalInteraction (without the checks of the constructor)
+    """
+    def __init__(self, gene_A_symbol, gene_A_id, gene_B_symbol, gene_B_id, gene_A_pert, gene_B_pert, effect_type,
+                 effect_size, species_id="9606", cell_line="", cellosaurus_id="", cancer_type="", ncit_id="",
+                 assay=None, pmid=None, background_dependency_status=SlConstants.N_A,
+                 background_dependency_gene_symbol=SlConstants.N_A,
+                 background_dependency_gene_id=SlConstants.N_A, SL=None):
+        self.gene_A_symbol = gene_A_symbol
+        self.gene_A_id = gene_A_id
+        self.gene_B_symbol = gene_B_symbol
+        self.gene_B_id = gene_B_id
+        self.gene_A_pert = gene_A_pert
+        self.gene_B_pert = gene_B_pert
+        self.assay = assay
+        self.pmid = pmid
+        self.species_id = species_id
+        self.cell_line = cell_line
+        self.cellosaurus_id = cellosaurus_id
+        self.cancer_type = cancer_type
+        self.ncit_id = ncit_id
+        self.effect_type = effect_type
+        self.effect_size = effect_size
+        self._background_dependency_status = background_dependency_status
+        self._background_dependency_gene_symbol = background_dependency_gene_symbol
+        self._background_dependency_gene_id = background_dependency_gene_id
+        self.SL = SL
+        self.maximum_value = False
+
+
+VARIANTS = {'dict': DictInteraction, 'slots': SyntheticLethalInteraction}
+ROW = "\t".join([SlConstants.SG_RNA, SlConstants.SG_RNA, SlConstants.ZSCORE, "9606", SlConstants.HCT_116,
+                 SlConstants.HCT_116_CELLOSAURUS, SlConstants.COLON_ADENOCARCINOMA,
+                 SlConstants.COLON_ADENOCARCINOMA_NCIT, SlConstants.RNA_INTERFERENCE_ASSAY, '30033366'])
+
+
+def build(variant, n):
+    record_class = VARIANTS[variant]
+    n_genes = 20000
+    symbols = ['GENE%d' % i for i in range(n_genes)]
+    ids = ['NCBIGene:%d' % (100000 + i) for i in range(n_genes)]
+    records = []
+    for i in range(n):
+        a = i % n_genes
+        b = (a + 1 + i // n_genes) % n_genes
+        if a == b:
+            b = (b + 1) % n_genes
+        pert_a, pert_b, effect_type, species, cell, cellosaurus, cancer, ncit, assay, pmid = ROW.split('\t')
+        records.append(record_class(gene_A_symbol=symbols[a], gene_A_id=ids[a], gene_B_symbol=symbols[b],
+                                    gene_B_id=ids[b], gene_A_pert=pert_a, gene_B_pert=pert_b,
+                                    effect_type=effect_type, effect_size=(i % 1000) / 100.0, species_id=species,
+                                    cell_line=cell, cellosaurus_id=cellosaurus, cancer_type=cancer, ncit_id=ncit,
+                                    assay=assay, pmid=pmid, SL=i % 3 == 0))
+    return records
+
+
+def run_child(variant, n):
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    records = build(variant, n)
+    seconds = time.perf_counter() - start
+    # ru_maxrss is in kilobytes on Linux
+    used = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline) * 1024
+    print("[INFO] %-6s %d records: %8.1f MB (%5.0f bytes/record), built in %.1f s" %
+          (variant, len(records), used / 2**20, used / len(records), seconds))
+
+
+if len(sys.argv) > 2 and sys.argv[1] == '--child':
+    run_child(sys.argv[2], int(sys.argv[3]))
+else:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    for variant in VARIANTS:
+        result = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', variant, str(n)])
+        if result.returncode != 0:
+            print("[WARNING] %s failed with exit code %d (out of memory?)" % (variant, result.returncode))
@@ -0,0 +1,81 @@
+## Compare whole-database operations on a list of SyntheticLethalInteraction objects with the same operations on
+## a columnar SliTable: a filter (positive entries of one study with |effect| >= 2), a group-by (number of entries
+## per study and SL flag) and the strongest score of each gene B.
+## Usage: python benchmarks/bench_sli_table.py [number of records (default 1000000)]
+
+import os
+import sys
+import time
+import timeit
+from collections import defaultdict
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from idg2sl import SyntheticLethalInteraction
+from idg2sl import SlConstants
+from idg2sl import SliTable
+from idg2sl.evidence_aggregation import EvidenceAggregator
+import numpy as np
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+n_genes = 20000
+pmids = ['%d' % (30000000 + i) for i in range(40)]
+records = [SyntheticLethalInteraction(gene_A_symbol='KRAS', gene_A_id=SlConstants.KRAS_GENE_ID,
+                                      gene_B_symbol='GENE%d' % (i % n_genes),
+                                      gene_B_id='NCBIGene:%d' % (100000 + i % n_genes),
+                                      gene_A_pert=SlConstants.ACTIVATING_MUTATION, gene_B_pert=SlConstants.SI_RNA,
+                                      effect_type=SlConstants.ZSCORE, effect_size=((i * 7919) % 1000) / 100.0 - 5,
+                                      assay=SlConstants.RNA_INTERFERENCE_ASSAY, pmid=pmids[i % len(pmids)],
+                                      SL=i % 3 == 0)
+           for i in range(n)]
+start = time.perf_counter()
+table = SliTable.from_records(records)
+len(table.get_column('SL'))
+print("[INFO] %d records, SliTable built in %.2f s" % (n, time.perf_counter() - start))
+
+
+def filter_objects():
+    return [sli for sli in records
+            if sli.is_positive_SLI() and sli.get_pmid() == pmids[0] and abs(sli.get_effect_size()) >= 2]
+
+
+def filter_table():
+    mask = table.get_column('SL') & table.equals('pmid', pmids[0]) & (np.abs(table.get_column('effect_size')) >= 2)
+    return table.filter(mask)
+
+
+def group_objects():
+    counts = defaultdict(int)
+    for sli in records:
+        counts[(sli.get_pmid(), sli.is_positive_SLI())] += 1
+    return counts
+
+
+def group_table():
+    return {key: len(rows) for key, rows in table.group_by(['pmid', 'SL']).items()}
+
+
+def best_objects():
+    best = {}
+    for sli in records:
+        score = EvidenceAggregator.get_score(sli)
+        gene = sli.get_gene_B_id()
+        if gene not in best or score > best[gene]:
+            best[gene] = score
+    return best
+
+
+def best_table():
+    genes = table.get_column('gene_B_id')
+    unique_genes, inverse = np.unique(genes, return_inverse=True)
+    best = np.full(len(unique_genes), -np.inf)
+    np.maximum.at(best, inverse, table.get_scores())
+    return dict(zip(unique_genes.tolist(), best.tolist()))
+
+
+if len(filter_objects()) != len(filter_table()) or dict(group_objects()) != group_table():
+    raise ValueError("The list and the table gave different results")
+for label, by_objects, by_table in [("filter", filter_objects, filter_table), ("group by", group_objects, group_table),
+                                    ("best score per gene", best_objects, best_table)]:
+    t_objects = min(timeit.repeat(by_objects, number=1, repeat=3))
+    t_table = min(timeit.repeat(by_table, number=1, repeat=3))
+    print("[INFO] %-20s objects %8.1f ms  SliTable %8.1f ms (%.1fx)" %
+          (label, 1000 * t_objects, 1000 * t_table, t_objects / t_table))
@@ -0,0 +1,54 @@
+## Compare csv.DictReader with the TableReader (tuples and NumPy columns) on a scaled-up study table.
+## Usage: python benchmarks/bench_table_reader.py [table.tsv] [scale]
+
+import csv
+import os
+import sys
+import tempfile
+import timeit
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from idg2sl.table_reader import TableReader
+
+fname = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'steckel-2012-KRAS.tsv')
+scale = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+columns = ['GeneID', 'HCT-116.Z-score', 'HKE-3.Z-score', 'D.Z-score']
+with open(fname) as f:
+    header = f.readline()
+    body = f.read()
+fd, big_fname = tempfile.mkstemp(suffix='.tsv')
+with os.fdopen(fd, 'w') as f:
+    f.write(header)
+    for _ in range(scale):
+        f.write(body)
+n_rows = scale * body.count('\n')
+
+
+def dict_reader():
+    total = 0.0
+    with open(big_fname) as csvfile:
+        for row in csv.DictReader(csvfile, delimiter='\t'):
+            total += float(row['HCT-116.Z-score']) + float(row['HKE-3.Z-score']) + float(row['D.Z-score'])
+    return total
+
+
+def table_reader():
+    total = 0.0
+    for symbol, hct, hke, delta in TableReader(big_fname, columns):
+        total += float(hct) + float(hke) + float(delta)
+    return total
+
+
+def numeric_columns():
+    table = TableReader(big_fname, columns).read_columns(numeric=columns[1:])
+    return (table['HCT-116.Z-score'] + table['HKE-3.Z-score'] + table['D.Z-score']).sum()
+
+
+repeat = 5
+t_dict = min(timeit.repeat(dict_reader, number=1, repeat=repeat))
+print("[INFO] %d rows" % n_rows)
+print("[INFO] csv.DictReader:      %8.1f ms %10.0f rows/s" % (1000 * t_dict, n_rows / t_dict))
+for name, f in (("TableReader tuples:", table_reader), ("TableReader columns:", numeric_columns)):
+    t = min(timeit.repeat(f, number=1, repeat=repeat))
+    print("[INFO] %-22s %8.1f ms %10.0f rows/s (%.1fx)" % (name, 1000 * t, n_rows / t, t_dict / t))
+os.remove(big_fname)
@@ -0,0 +1,100 @@
+## Compare the row-by-row threshold loops of the Steckel 2012, Josse 2014 and Turner 2008 parsers with the
+## vectorized masks (TableReader.read_columns and TableReader.select_rows) on the real tables and on copies
+## that are scaled up by a factor (default 100). Josse 2014 (through its spec, see SpecParser) selects its rows
+## with a mask. Steckel 2012 and Turner 2008 keep every row (the negatives too), so their masks give the SL
+## column, and only the conversion and comparison of the numbers is vectorized. Lord 2008 (133 rows) keeps its
+## row loop.
+## Usage: python benchmarks/bench_vectorized_filters.py [scale]
+
+import os
+import sys
+import tempfile
+import timeit
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from idg2sl.table_reader import TableReader
+
+data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+scale = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+
+def steckel_loop(fname):
+    rows = []
+    reader = TableReader(fname, ['GeneID', 'HCT-116.Z-score', 'HKE-3.Z-score', 'D.Z-score'])
+    for symbol, hct116, hke3, delta in reader:
+        hct116 = float(hct116)
+        hke3 = float(hke3)
+        delta = float(delta)
+        if delta >= 3.3 and hke3 < 2:
+            sl = True
+        else:
+            sl = False
+        rows.append((symbol, hct116, delta, sl))
+    return rows
+
+
+def steckel_masks(fname):
+    zscore_columns = ['HCT-116.Z-score', 'HKE-3.Z-score', 'D.Z-score']
+    table = TableReader(fname, ['GeneID'] + zscore_columns).read_columns(numeric=zscore_columns)
+    table['SL'] = (table['D.Z-score'] >= 3.3) & (table['HKE-3.Z-score'] < 2)
+    return TableReader.select_rows(table, ['GeneID', 'HCT-116.Z-score', 'D.Z-score', 'SL'])
+
+
+def josse_loop(fname):
+    rows = []
+    for symbol, pval in TableReader(fname, ['Symbol', 'RSA.p-value']):
+        pval = float(pval)
+        if pval < 0.5:
+            continue
+        rows.append((symbol, pval))
+    return rows
+
+
+def josse_masks(fname):
+    table = TableReader(fname, ['Symbol', 'RSA.p-value']).read_columns(numeric=['RSA.p-value'])
+    return TableReader.select_rows(table, ['Symbol', 'RSA.p-value'], ~(table['RSA.p-value'] < 0.5))
+
+
+def turner_loop(fname):
+    rows = []
+    for symbol, zscore in TableReader(fname, ['SMARTpool', 'Z score']):
+        zscore = float(zscore)
+        rows.append((symbol, zscore, zscore <= -3.0))
+    return rows
+
+
+def turner_masks(fname):
+    table = TableReader(fname, ['SMARTpool', 'Z score']).read_columns(numeric=['Z score'])
+    table['SL'] = table['Z score'] <= -3.0
+    return TableReader.select_rows(table, ['SMARTpool', 'Z score', 'SL'])
+
+
+def scaled_copy(fname, factor):
+    with open(fname) as f:
+        header = f.readline()
+        body = f.read()
+    if not body.endswith('\n'):
+        body += '\n'
+    fd, big_fname = tempfile.mkstemp(suffix='.tsv')
+    with os.fdopen(fd, 'w') as f:
+        f.write(header)
+        for _ in range(factor):
+            f.write(body)
+    return big_fname
+
+
+benchmarks = [('Steckel 2012', 'steckel-2012-KRAS.tsv', steckel_loop, steckel_masks),
+              ('Josse 2014', 'josse_2014-supplement-1.tsv', josse_loop, josse_masks),
+              ('Turner 2008', 'turner-PARP1-2008.tsv', turner_loop, turner_masks)]
+for label, table_name, loop, masks in benchmarks:
+    fname = os.path.join(data_dir, table_name)
+    for factor in (1, scale):
+        path = fname if factor == 1 else scaled_copy(fname, factor)
+        if loop(path) != masks(path):
+            raise ValueError("The loop and the masks select different rows of %s" % path)
+        repeat = 5 if factor == 1 else 3
+        t_loop = min(timeit.repeat(lambda: loop(path), number=1, repeat=repeat))
+        t_masks = min(timeit.repeat(lambda: masks(path), number=1, repeat=repeat))
+        print("[INFO] %-12s x%-4d loop %8.1f ms  masks %8.1f ms (%.2fx)" %
+              (label, factor, 1000 * t_loop, 1000 * t_masks, t_loop / t_masks))
+        if path != fname:
+            os.remove(path)
@@ -0,0 +1,21 @@
+## Rebuild SL_data.tsv, the degree distribution plot and the KGX node and edge files, running only the
+## stages whose inputs (data files, parser code, configuration, HGNC snapshot) changed since the last build.
+## Usage: python build_artifacts.py [--dry-run] [--force] [target ...]
+
+import argparse
+from idg2sl.build_graph import BuildGraph
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description="Incrementally rebuild SL_data.tsv and the derived files")
+    argparser.add_argument('targets', nargs='*', help="stage names or output files (default: everything)")
+    argparser.add_argument('--dry-run', '-n', action='store_true', help="only print what would be rebuilt")
+    argparser.add_argument('--force', action='store_true', help="rebuild the targets even if they are up to date")
+    argparser.add_argument('--list', action='store_true', help="list the build stages and exit")
+    args = argparser.parse_args()
+    graph = BuildGraph.get_default()
+    if args.list:
+        for stage in graph.stages:
+            print("%s\t%s\t%s" % (stage.name, ", ".join(stage.outputs), " ".join(stage.command[1:])))
+    else:
+        graph.build(args.targets if len(args.targets) > 0 else None, dry_run=args.dry_run, force=args.force)
@@ -1,49 +1,33 @@
 from .synthetic_lethal_interaction import SyntheticLethalInteraction
-from idg2sl.parsers.manual_entry_1 import ManualEntry1
-from .parsers.manual_entry_2 import ManualEntry2
-from .parsers.manual_entry_3 import ManualEntry3
 from .parsers.sl_constants import SlConstants
-from .parsers.astsaturov_2010_parser import Astsaturov2010Parser
-from .parsers.baldwin_2010_parser import Baldwin2010Parser
-from .parsers.blomen_2015_parser import Blomen2015Parser
-from .parsers.bommi_2008_parser import Bommi2008Parser
-from .parsers.brough_2018_parser import Brough2018Parser
-from .parsers.chakraborty_2017_parser import Chakraborty2017Parser
-from .parsers.chin_2020_parser import Chin2020Parser
-from .parsers.dai_2013_parser import Dai2013Parser
-from .parsers.etemadmoghadam_2013_parser import Etemadmoghadam2013Parser
-from .parsers.han_2017_parser import Han2017Parser
-from .parsers.jerby_arnon_2014_parser import JerbyArnon2014Parser
-from .parsers.josse_2014_parser import Josse2014Parser
-from .parsers.kang_2015_parser import Kang2015Parser
-from .parsers.kessler_2012_parser import Kessler2012Parser
-from .parsers.kim_2011_parser import Kim2011Parser
-from .parsers.krastev_2011_parser import Krastev2011Parser
-from .parsers.lord_2008_parser import Lord2008Parser
-from .parsers.luo_2009 import Luo2009Parser
-from .parsers.martin_2010_parser import Martin2010and2011Parser
-from .parsers.mengwasser2019_parser import Mengwasser2019Parser
-from .parsers.mohni_2014_parser import Mohni2014Parser
-from .parsers.mondal_2019_parser import Mondal2019Parser
-from .parsers.najm_2018_parser import Najm2018Parser
-from .parsers.oser_2019_parser import Oser2019Parser
-from .parsers.patidar_2020_parser import Patidar2020Parser
-from .parsers.schick_2019_parser import Schick2019Parser
-from .parsers.shen_2015_parser import Shen2015Parser
-from .parsers.shen_2017_parser import Shen2017Parser
-from .parsers.srivas_2016_parser import Srivas2016Parser
-from .parsers.steckel_2012_parser import Steckel2012Parser
-from .parsers.sullivan_2012_parser import Sullivan2012Parser
-from .parsers.sun_2019_parser import Sun2019Parser
-from .parsers.toyoshima_2008_parser import Toyoshima2008Parser
-from .parsers.turner_2008_parser import Turner2008Parser
-from .parsers.wang_2016_parser import Wang2016Parser
-from .parsers.wang_2017_parser import Wang2017Parser
-from .parsers.wang_2019_parser import Wang2019Parser
-from .parsers.williamson_2016_parser import Williamson2016Parser
-from .parsers.vizeacoumar_2013_parser import Vizeacoumar2013Parser
 from .hgnc_parser import HgncParser
+from .gene_info_parser import GeneInfoParser
 from idg2sl.sl_dataset_parser import SL_DatasetParser
+from .parser_runner import ParserRunner, ParserResult
+from .parse_cache import ParseResultCache
+from .parser_registry import ParserRegistry, ParserSpec, register_parser
+from .build_graph import BuildGraph, BuildStage
+from .pair_evidence import PairEvidence, PairEvidenceIndex
+
+
+def __getattr__(name):
+    if name == 'SliTable':
+        # imported on first use because it needs NumPy, which is slow to import
+        from .sli_table import SliTable
+        globals()[name] = SliTable
+        return SliTable
+    # The parser classes are imported on first use (see ParserRegistry), so that import idg2sl stays fast
+    registry = ParserRegistry.get_default()
+    if not name.startswith('__') and name in registry.get_names():
+        parser_class = registry.get_spec(name).load()
+        globals()[name] = parser_class
+        return parser_class
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(__all__))
+
 
 __all__ = ["SyntheticLethalInteraction",
            "SL_DatasetParser",
@@ -88,6 +72,18 @@ __all__ = ["SyntheticLethalInteraction",
            "Wang2019Parser",
            "Williamson2016Parser",
            "HgncParser",
+           "GeneInfoParser",
+           "ParserRunner",
+           "ParserResult",
+           "ParseResultCache",
+           "ParserRegistry",
+           "ParserSpec",
+           "register_parser",
+           "BuildGraph",
+           "BuildStage",
+           "SliTable",
+           "PairEvidence",
+           "PairEvidenceIndex",
            "ManualEntry1",
            "ManualEntry2",
            "ManualEntry3"]
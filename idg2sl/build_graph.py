@@ -0,0 +1,267 @@
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from .hgnc_cache import HgncIndexCache
+from .hgnc_snapshot import HgncSnapshotStore
+
+
+class BuildStage:
+    """
+    One step of the build, e.g., running parse_human_SLI.py to produce SL_data.tsv. inputs are glob patterns
+    relative to the root directory of the build (a pattern without wildcards is a single file, which may be
+    the output of an earlier stage), and input_functions are functions that return further input paths (e.g.,
+    the HGNC snapshot, whose path is only known at build time). command is run in the directory cwd (relative
+    to the root directory).
+    """
+    def __init__(self, name, inputs, outputs, command, cwd='.', input_functions=()):
+        self.name = name
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.command = list(command)
+        self.cwd = cwd
+        self.input_functions = list(input_functions)
+
+    def __repr__(self):
+        return "BuildStage(%s: %s)" % (self.name, ", ".join(self.outputs))
+
+
+class BuildGraph:
+    """
+    A make-style build of SL_data.tsv and the artifacts derived from it. Each stage knows its inputs (data
+    files, parser code, configuration, the HGNC snapshot and the outputs of earlier stages), and a stage is
+    only run if one of its outputs is missing or the content of one of its inputs changed since the last
+    successful run. The SHA-256 of each input is recorded in a state file (.build-state.json in the root
+    directory) together with its size and modification time, so that unchanged files are not hashed again
+    and touching a file without changing it does not trigger a rebuild.
+    Stages must be added after the stages that produce their inputs.
+    """
+    STATE_FILE = '.build-state.json'
+    STATE_VERSION = 1
+
+    def __init__(self, root='.'):
+        self.root = os.path.abspath(root)
+        self.stages = []
+        self._producers = {}
+        self._state = None
+
+    def add_stage(self, stage):
+        for name in stage.outputs:
+            if name in self._producers:
+                raise ValueError("%s is produced by both %s and %s" % (name, self._producers[name].name, stage.name))
+        if any(s.name == stage.name for s in self.stages):
+            raise ValueError("Duplicate build stage %s" % stage.name)
+        self.stages.append(stage)
+        for name in stage.outputs:
+            self._producers[os.path.normpath(name)] = stage
+
+    def get_stage(self, target):
+        """
+        Returns the stage with the name target or the stage that produces the file target
+        """
+        for stage in self.stages:
+            if stage.name == target:
+                return stage
+        producer = self._producers.get(os.path.normpath(target))
+        if producer is None:
+            raise ValueError("Unknown build target %s (stages: %s)" % (target, ", ".join(s.name for s in self.stages)))
+        return producer
+
+    def _path(self, name):
+        return os.path.join(self.root, name)
+
+    def get_upstream(self, stage):
+        """
+        Returns the stages that produce inputs of stage
+        """
+        upstream = []
+        for pattern in stage.inputs:
+            producer = self._producers.get(os.path.normpath(pattern))
+            if producer is not None and producer not in upstream:
+                if self.stages.index(producer) >= self.stages.index(stage):
+                    raise ValueError("Stage %s uses %s before it is produced by %s" % (stage.name, pattern, producer.name))
+                upstream.append(producer)
+        return upstream
+
+    def get_input_files(self, stage):
+        """
+        Returns the sorted paths (relative to the root directory if possible) of all inputs of stage
+        """
+        files = set()
+        for pattern in stage.inputs:
+            if glob.has_magic(pattern):
+                matches = glob.glob(self._path(pattern), recursive=True)
+                files.update(os.path.relpath(m, self.root) for m in matches if os.path.isfile(m))
+            else:
+                files.add(os.path.normpath(pattern))
+        for function in stage.input_functions:
+            for fname in function():
+                fname = os.path.abspath(self._path(fname))
+                files.add(os.path.relpath(fname, self.root) if fname.startswith(self.root + os.sep) else fname)
+        return sorted(files)
+
+    def _load_state(self):
+        if self._state is None:
+            try:
+                with open(self._path(BuildGraph.STATE_FILE)) as f:
+                    state = json.load(f)
+                if state.get('version') != BuildGraph.STATE_VERSION:
+                    state = None
+            except (OSError, ValueError):
+                state = None
+            self._state = state or {'version': BuildGraph.STATE_VERSION, 'files': {}, 'stages': {}}
+        return self._state
+
+    def _save_state(self):
+        fd, tmp_fname = tempfile.mkstemp(dir=self.root, prefix='.build-state-')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self._state, f, indent=1, sort_keys=True)
+        os.replace(tmp_fname, self._path(BuildGraph.STATE_FILE))
+
+    def _sha256(self, fname):
+        """
+        Returns the SHA-256 of fname, or None if the file does not exist. The hash is reused if the size and
+        modification time of the file did not change.
+        """
+        path = self._path(fname)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        files = self._load_state()['files']
+        stamp = [st.st_size, st.st_mtime_ns]
+        entry = files.get(fname)
+        if entry is None or entry[:2] != stamp:
+            entry = stamp + [HgncIndexCache.sha256(path)]
+            files[fname] = entry
+        return entry[2]
+
+    def get_reasons(self, stage, rebuilt=()):
+        """
+        Returns a list with the reasons why stage is stale (empty if it is up to date). rebuilt are the stages
+        that will run before stage (in a dry run, their outputs are considered changed).
+        """
+        reasons = []
+        for name in stage.outputs:
+            if not os.path.exists(self._path(name)):
+                reasons.append("%s is missing" % name)
+        for producer in self.get_upstream(stage):
+            if producer in rebuilt:
+                reasons.append("%s will be rebuilt" % producer.name)
+        recorded = self._load_state()['stages'].get(stage.name)
+        if recorded is None:
+            reasons.append("no previous build")
+            return reasons
+        current = {}
+        for fname in self.get_input_files(stage):
+            current[fname] = self._sha256(fname)
+            if current[fname] is None:
+                reasons.append("input %s is missing" % fname)
+            elif fname not in recorded:
+                reasons.append("new input %s" % fname)
+            elif recorded[fname] != current[fname]:
+                reasons.append("%s changed" % fname)
+        for fname in recorded:
+            if fname not in current:
+                reasons.append("input %s was removed" % fname)
+        return reasons
+
+    def _select(self, targets):
+        # the stages of targets and all stages upstream of them, in build order
+        if targets is None:
+            return list(self.stages)
+        selected = []
+        pending = [self.get_stage(t) for t in targets]
+        while len(pending) > 0:
+            stage = pending.pop()
+            if stage not in selected:
+                selected.append(stage)
+                pending.extend(self.get_upstream(stage))
+        selected.sort(key=self.stages.index)
+        return selected
+
+    def get_plan(self, targets=None, force=False):
+        """
+        Returns (stage, reasons) pairs of the stages that must be run to bring targets (stage names or output
+        files, all stages by default) up to date, in build order. With force=True, all selected stages are run.
+        """
+        plan = []
+        rebuilt = []
+        for stage in self._select(targets):
+            reasons = ["forced"] if force else self.get_reasons(stage, rebuilt)
+            if len(reasons) > 0:
+                plan.append((stage, reasons))
+                rebuilt.append(stage)
+        return plan
+
+    def build(self, targets=None, dry_run=False, force=False):
+        """
+        Run the stale stages for targets. With dry_run=True, the stages that would be run are only printed.
+        With force=True, all selected stages are run. Returns the list of stages that were (or would be) run.
+        """
+        if dry_run:
+            plan = self.get_plan(targets, force)
+            for stage, reasons in plan:
+                print("[INFO] Would rebuild %s (%s): %s" % (stage.name, ", ".join(stage.outputs), "; ".join(reasons)))
+            if len(plan) == 0:
+                print("[INFO] Everything is up to date")
+            return [stage for stage, _ in plan]
+        run = []
+        for stage in self._select(targets):
+            # The reasons are only determined when the stage is reached, so that a stage is not run if an
+            # upstream stage was run but produced the same output as before
+            reasons = ["forced"] if force else self.get_reasons(stage)
+            if len(reasons) == 0:
+                continue
+            print("[INFO] Rebuilding %s (%s): %s" % (stage.name, ", ".join(stage.outputs), "; ".join(reasons)))
+            print("[INFO] $ %s" % " ".join(stage.command))
+            result = subprocess.run(stage.command, cwd=self._path(stage.cwd))
+            if result.returncode != 0:
+                raise ValueError("Build stage %s failed with exit code %d" % (stage.name, result.returncode))
+            missing = [name for name in stage.outputs if not os.path.exists(self._path(name))]
+            if len(missing) > 0:
+                raise ValueError("Build stage %s did not produce %s" % (stage.name, ", ".join(missing)))
+            state = self._load_state()
+            state['stages'][stage.name] = {f: self._sha256(f) for f in self.get_input_files(stage)}
+            self._save_state()
+            run.append(stage)
+        if len(run) == 0:
+            print("[INFO] Everything is up to date")
+        return run
+
+    @staticmethod
+    def get_hgnc_snapshot(root='.'):
+        """
+        Returns the HGNC file that parse_human_SLI.py would use, without network access: the copy in the root
+        directory if there is one, otherwise the current snapshot of the store. If the file has not been
+        downloaded yet, the (missing) local path is returned, so that the stage that downloads it is stale.
+        """
+        local_fname = os.path.join(root, 'protein-coding_gene.txt')
+        if os.path.exists(local_fname):
+            return [local_fname]
+        try:
+            return [HgncSnapshotStore(offline=True).get()]
+        except ValueError:
+            return [local_fname]
+
+    @staticmethod
+    def get_default(root='.'):
+        """
+        The build of this repository: SL_data.tsv (parse_human_SLI.py), the degree distribution plot
+        (summarize_SL_data.py) and the KGX node and edge files (transform/transform_sldb_to_kgx.py)
+        """
+        python = sys.executable
+        graph = BuildGraph(root)
+        graph.add_stage(BuildStage('SL_data', ['data/**/*', 'idg2sl/**/*.py', 'idg2sl/specs/*.yaml',
+                                               'parse_human_SLI.py'],
+                                   ['SL_data.tsv', 'SL_pairs.tsv'], [python, 'parse_human_SLI.py'],
+                                   input_functions=[lambda: BuildGraph.get_hgnc_snapshot(graph.root)]))
+        graph.add_stage(BuildStage('summary', ['SL_data.tsv', 'summarize_SL_data.py'],
+                                   ['sliDegreeDistribution.pdf'], [python, 'summarize_SL_data.py']))
+        graph.add_stage(BuildStage('kgx', ['SL_data.tsv', 'transform/transform_sldb_to_kgx.py',
+                                           'transform/sl_data_config.py', 'transform/sl_data_config.yaml'],
+                                   ['transform/sl_data_config_nodes.tsv', 'transform/sl_data_config_edges.tsv'],
+                                   [python, 'transform_sldb_to_kgx.py'], cwd='transform'))
+        return graph
@@ -0,0 +1,57 @@
+import bz2
+import gzip
+import lzma
+import os
+
+
+class CompressedInput:
+    """
+    Open the input files of the parsers transparently if they are stored compressed. A parser refers to a file
+    by its plain name (e.g., data/steckel-2012-KRAS.tsv); if that file does not exist, the first of
+    data/steckel-2012-KRAS.tsv.gz, .bz2, .xz and .zst that exists is read instead, with streaming decompression.
+    Reading .zst files requires Python 3.14 (compression.zstd) or the zstandard package.
+    """
+    SUFFIXES = ('.gz', '.bz2', '.xz', '.zst')
+
+    @staticmethod
+    def find(fname):
+        """
+        Returns the path of the file that is read for fname (fname itself or a compressed version of it), or
+        None if there is no such file
+        """
+        if os.path.exists(fname):
+            return fname
+        for suffix in CompressedInput.SUFFIXES:
+            if os.path.exists(fname + suffix):
+                return fname + suffix
+        return None
+
+    @staticmethod
+    def open(fname, encoding=None, newline=None):
+        """
+        Open fname (or its compressed version, see find) as a text file. If there is no such file, the plain
+        file is opened, which raises a FileNotFoundError.
+        """
+        path = CompressedInput.find(fname) or fname
+        if path.endswith('.gz'):
+            return gzip.open(path, 'rt', encoding=encoding, newline=newline)
+        elif path.endswith('.bz2'):
+            return bz2.open(path, 'rt', encoding=encoding, newline=newline)
+        elif path.endswith('.xz'):
+            return lzma.open(path, 'rt', encoding=encoding, newline=newline)
+        elif path.endswith('.zst'):
+            return CompressedInput._open_zstd(path, encoding, newline)
+        return open(path, 'r', encoding=encoding, newline=newline)
+
+    @staticmethod
+    def _open_zstd(path, encoding, newline):
+        try:
+            from compression import zstd
+            return zstd.open(path, 'rt', encoding=encoding, newline=newline)
+        except ImportError:
+            pass
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("Reading %s requires Python 3.14 or the zstandard package" % path)
+        return zstandard.open(path, 'rt', encoding=encoding, newline=newline)
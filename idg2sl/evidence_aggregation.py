@@ -0,0 +1,277 @@
+import math
+import numbers
+from .parsers.sl_constants import SlConstants
+
+
+class EvidenceReducer:
+    """
+    Reduces the entries of a group to one value in a single pass. add is called with each entry and its numeric
+    effect size (None if the effect size is not a number, see EvidenceAggregator.get_numeric_effect), and
+    get_result returns the value after the last entry. A new reducer is created for each group, so a reducer
+    can keep its state in attributes.
+    """
+    def add(self, sli, value):
+        raise NotImplementedError
+
+    def get_result(self):
+        raise NotImplementedError
+
+
+class BestEntryReducer(EvidenceReducer):
+    """
+    The entry with the strongest evidence (see EvidenceAggregator.get_directed_score); the first of several
+    entries with the same score, and the first entry if no entry has a numeric effect size
+    """
+    def __init__(self):
+        self.best = None
+        self.best_score = None
+
+    def add(self, sli, value):
+        score = EvidenceAggregator.get_directed_score(value, sli.effect_type)
+        # strictly greater, so that the first of several entries with the same score is kept
+        if self.best is None or score > self.best_score:
+            self.best = sli
+            self.best_score = score
+
+    def get_result(self):
+        return self.best
+
+
+class CountReducer(EvidenceReducer):
+    """
+    The number of entries
+    """
+    def __init__(self):
+        self.count = 0
+
+    def add(self, sli, value):
+        self.count += 1
+
+    def get_result(self):
+        return self.count
+
+
+class MeanReducer(EvidenceReducer):
+    """
+    The mean of the numeric effect sizes (None if there is none)
+    """
+    def __init__(self):
+        self.n = 0
+        self.total = 0.0
+
+    def add(self, sli, value):
+        if value is not None:
+            self.n += 1
+            self.total += value
+
+    def get_result(self):
+        if self.n == 0:
+            return None
+        return self.total / self.n
+
+
+class MinEffectReducer(EvidenceReducer):
+    """
+    The smallest numeric effect size of one effect type (e.g., the smallest q-value), None if there is none
+    """
+    def __init__(self, effect_type):
+        self.effect_type = effect_type
+        self.minimum = None
+
+    def add(self, sli, value):
+        if value is not None and sli.effect_type == self.effect_type:
+            if self.minimum is None or value < self.minimum:
+                self.minimum = value
+
+    def get_result(self):
+        return self.minimum
+
+
+class EvidenceSummary:
+    """
+    Summary of the SyntheticLethalInteraction objects of one group (e.g., all entries of one gene pair in a
+    study), computed in a single pass over the entries. reducers is a dictionary from the name of each result
+    to a function that returns a new EvidenceReducer; the results are available with get(name) and as
+    attributes. The default reducers (DEFAULT_REDUCERS) are
+     - best: the entry with the strongest evidence (see BestEntryReducer)
+     - count: the number of entries
+     - mean: the mean of the numeric effect sizes (also get_mean())
+     - min_qvalue and min_pvalue: the smallest q-value and p-value (None if there is no such entry)
+    """
+    DEFAULT_REDUCERS = {'best': BestEntryReducer,
+                        'count': CountReducer,
+                        'mean': MeanReducer,
+                        'min_qvalue': lambda: MinEffectReducer(SlConstants.QVAL),
+                        'min_pvalue': lambda: MinEffectReducer(SlConstants.PVAL)}
+
+    def __init__(self, entries, reducers=None):
+        if reducers is None:
+            reducers = EvidenceSummary.DEFAULT_REDUCERS
+        reducers = {name: create() for name, create in reducers.items()}
+        adders = [r.add for r in reducers.values()]
+        get_numeric_effect = EvidenceAggregator.get_numeric_effect
+        for sli in entries:
+            value = get_numeric_effect(sli.effect_size)
+            for add in adders:
+                add(sli, value)
+        self._results = {name: r.get_result() for name, r in reducers.items()}
+        for name, result in self._results.items():
+            setattr(self, name, result)
+
+    def get(self, name):
+        return self._results[name]
+
+    def get_mean(self):
+        return self._results.get('mean')
+
+
+class EvidenceAggregator:
+    """
+    Groups SyntheticLethalInteraction objects by a key (usually a GenePairKey) and reduces each group in a single
+    pass, i.e., without sorting the entries of a group.
+    The strength of the evidence of an entry depends on its effect type: for p-values and q-values, smaller
+    values are better; for all other effect types (Z-scores, fold changes, ...), values with a larger absolute
+    value are better. Effect sizes that are not numbers (e.g., 'true' or n/a) are counted but never preferred
+    over a numeric effect size. get_directed_score implements this rule; _get_best_entry inlines it for the
+    marking of the maximum entries, which runs for every entry of every parser.
+    """
+    SMALLER_IS_BETTER = frozenset([SlConstants.PVAL, SlConstants.QVAL])
+
+    def __init__(self, reducers=None):
+        """
+        reducers are the reducers of the summaries (see EvidenceSummary), by default EvidenceSummary.DEFAULT_REDUCERS
+        """
+        self._groups = {}
+        self._reducers = reducers
+
+    def add(self, key, sli):
+        entries = self._groups.get(key)
+        if entries is None:
+            self._groups[key] = [sli]
+        else:
+            entries.append(sli)
+
+    def add_groups(self, groups):
+        """
+        Add a dictionary from key to a list of entries (as built by the parsers with a defaultdict(list))
+        """
+        for key, entries in groups.items():
+            if key in self._groups:
+                self._groups[key].extend(entries)
+            else:
+                self._groups[key] = list(entries)
+
+    def __len__(self):
+        return len(self._groups)
+
+    def get_summary(self, key):
+        return EvidenceSummary(self._groups[key], self._reducers)
+
+    def get_summaries(self):
+        """
+        Returns a dictionary from each key to the EvidenceSummary of its group (in the order of insertion)
+        """
+        return {key: EvidenceSummary(entries, self._reducers) for key, entries in self._groups.items()}
+
+    @staticmethod
+    def get_best_index(entries):
+        """
+        Returns the index of the first of the entries with the strongest evidence (the best entry of
+        EvidenceSummary)
+        """
+        if len(entries) == 1:
+            return 0
+        return entries.index(EvidenceAggregator._get_best_entry(entries))
+
+    @staticmethod
+    def _get_best_entry(entries):
+        """
+        Returns the first of the entries with the strongest evidence, in one loop with get_score inlined (the first
+        entry if no entry has a numeric effect size). NaN is never larger than the best score, so it needs no check.
+        """
+        smaller_is_better = EvidenceAggregator.SMALLER_IS_BETTER
+        get_numeric_effect = EvidenceAggregator.get_numeric_effect
+        best = entries[0]
+        best_score = -math.inf
+        for sli in entries:
+            value = sli.effect_size
+            if value.__class__ is not float:
+                value = get_numeric_effect(value)
+                if value is None:
+                    continue
+            if value < 0 or sli.effect_type in smaller_is_better:
+                value = -value
+            if value > best_score:
+                best = sli
+                best_score = value
+        return best
+
+    def mark_maximum_entries(self):
+        """
+        Calls set_maximum on the best entry of each group. Returns a list with all entries; the entries of a
+        group are adjacent, with the best entry first and the others in the order in which they were added.
+        """
+        return EvidenceAggregator.mark_maximum_in_groups(self._groups.values())
+
+    @staticmethod
+    def mark_maximum_in_groups(groups):
+        """
+        As mark_maximum_entries, for an iterable of lists of entries (e.g., the values of a dictionary from
+        GenePairKey to a list), without copying the lists into an aggregator
+        """
+        get_best_entry = EvidenceAggregator._get_best_entry
+        sli_list = []
+        append = sli_list.append
+        extend = sli_list.extend
+        for entries in groups:
+            best = entries[0] if len(entries) == 1 else get_best_entry(entries)
+            best.set_maximum()
+            append(best)
+            if best is entries[0]:
+                extend(entries[1:])
+            else:
+                i = entries.index(best)
+                extend(entries[:i])
+                extend(entries[i + 1:])
+        return sli_list
+
+    @staticmethod
+    def get_numeric_effect(effect_size):
+        """
+        Returns effect_size as a float, or None if it is not a number (e.g., 'true', 'n/a', None or NaN)
+        """
+        if effect_size.__class__ is float:
+            # most effect sizes are floats, which do not need the (slower) check of the abstract type
+            value = effect_size
+        elif isinstance(effect_size, numbers.Real):
+            value = float(effect_size)
+        elif isinstance(effect_size, str):
+            try:
+                value = float(effect_size)
+            except ValueError:
+                return None
+        else:
+            return None
+        if value != value:
+            return None  # NaN
+        return value
+
+    @staticmethod
+    def get_score(sli):
+        """
+        Returns the strength of the evidence of sli (larger is better), -inf if its effect size is not numeric
+        """
+        value = EvidenceAggregator.get_numeric_effect(sli.effect_size)
+        return EvidenceAggregator.get_directed_score(value, sli.effect_type)
+
+    @staticmethod
+    def get_directed_score(value, effect_type):
+        """
+        Returns the strength of the evidence of a numeric effect size value (None for an effect size that is not
+        a number, which gets -inf) of the type effect_type
+        """
+        if value is None:
+            return -math.inf
+        if effect_type in EvidenceAggregator.SMALLER_IS_BETTER:
+            return -value
+        return abs(value)
@@ -0,0 +1,177 @@
+from .compressed_input import CompressedInput
+from .hgnc_cache import HgncIndexCache
+from .symbol_tables import SymbolIndex, FrozenIdMap, FrozenSynonymMap
+
+
+class GeneInfoIndex:
+    """
+    The symbol, synonym and id mappings of one taxon of an NCBI gene_info file. This class has the same
+    get_*_dictionary methods as the HgncParser and can be used wherever the HGNC index is used.
+    """
+    def __init__(self, taxon, symbols, symbol2entrez, symbol2ensembl, synonym2symbol):
+        self.taxon = taxon
+        self.symbols = symbols
+        self.symbol2entrez = symbol2entrez
+        self.symbol2ensembl = symbol2ensembl
+        self.synonym2symbol = synonym2symbol
+
+    def get_entrez_dictionary(self):
+        return self.symbol2entrez
+
+    def get_ensembl_dictionary(self):
+        return self.symbol2ensembl
+
+    def get_synonym_dictionary(self):
+        return self.synonym2symbol
+
+
+class _TaxonRows:
+    """
+    Collects the fields of the rows of one taxon while the file is streamed
+    """
+    def __init__(self):
+        self.symbols = []
+        self.entrez_ids = []
+        self.ensembl_ids = []
+        self.synonym2row = {}
+
+    def add(self, fields):
+        # fields: GeneID, Symbol, LocusTag, Synonyms, dbXrefs, rest of the line
+        geneid, symbol, _, synonyms, dbxrefs = fields[:5]
+        i = len(self.symbols)
+        self.symbols.append(symbol)
+        self.entrez_ids.append(geneid)
+        ensembl = ''
+        for xref in dbxrefs.split('|'):
+            if xref.startswith('Ensembl:'):
+                ensembl = xref[len('Ensembl:'):]
+                break
+        self.ensembl_ids.append(ensembl)
+        if synonyms == '-':
+            return
+        synonym2row = self.synonym2row
+        for s in synonyms.split('|'):
+            if s in synonym2row:
+                synonym2row[s] = -1  # MULTIPLE
+            else:
+                synonym2row[s] = i
+
+    def to_index(self, taxon):
+        index = SymbolIndex(self.symbols)
+        template = GeneInfoParser.ENSEMBL_TEMPLATES.get(taxon, GeneInfoParser.DEFAULT_ENSEMBL_TEMPLATE)
+        return GeneInfoIndex(taxon, index,
+                             FrozenIdMap.from_strings(index, self.entrez_ids, GeneInfoParser.ENTREZ_TEMPLATE),
+                             FrozenIdMap.from_strings(index, self.ensembl_ids, template),
+                             FrozenSynonymMap.from_dict(index, self.synonym2row))
+
+
+class GeneInfoParser:
+    """
+    Parse an NCBI gene_info file (e.g., Homo_sapiens.gene_info.gz or All_Mammalia.gene_info.gz) into one
+    GeneInfoIndex per taxon. Compressed files are streamed line by line and are never decompressed to disk.
+    In contrast to the HGNC protein-coding gene file, gene_info also covers non-coding genes and other species.
+    The parser itself behaves like the index of the default taxon (human), so that it can be passed to
+    SL_DatasetParser.set_hgnc_index. gene_info does not distinguish previous symbols from aliases, so all
+    synonyms are reported as aliases.
+    """
+    HUMAN = '9606'
+    ENTREZ_TEMPLATE = '%d'
+    ENSEMBL_TEMPLATES = {'9606': 'ENSG%011d', '10090': 'ENSMUSG%011d', '10116': 'ENSRNOG%011d'}
+    DEFAULT_ENSEMBL_TEMPLATE = 'ENSG%011d'
+    _version = None
+
+    def __init__(self, fname, taxa=None, default_taxon=HUMAN):
+        """
+        taxa is a collection of NCBI taxon ids (e.g., {'9606', '10090'}); by default all taxa in the file are indexed
+        """
+        self.fname = fname
+        self.default_taxon = default_taxon
+        if taxa is not None:
+            taxa = set(str(t) for t in taxa)
+        rows_by_taxon = {}
+        with CompressedInput.open(fname, encoding='utf-8') as f:
+            header = next(f, '')
+            if not header.startswith('#tax_id'):
+                raise ValueError("%s is not a gene_info file (header: %s)" % (fname, header[:40]))
+            for line in f:
+                taxon, rest = line.split('\t', 1)
+                if taxa is not None and taxon not in taxa:
+                    continue
+                rows = rows_by_taxon.get(taxon)
+                if rows is None:
+                    rows = _TaxonRows()
+                    rows_by_taxon[taxon] = rows
+                rows.add(rest.split('\t', 5))
+        self.indexes = {taxon: rows.to_index(taxon) for taxon, rows in rows_by_taxon.items()}
+
+    def _to_sections(self):
+        sections = {}
+        for taxon, idx in self.indexes.items():
+            sections[taxon] = (idx.symbols.to_sections(),
+                               idx.symbol2entrez.to_sections(),
+                               idx.symbol2ensembl.to_sections(),
+                               idx.synonym2symbol.to_sections())
+        return sections
+
+    @staticmethod
+    def _from_sections(fname, default_taxon, sections):
+        parser = GeneInfoParser.__new__(GeneInfoParser)
+        parser.fname = fname
+        parser.default_taxon = default_taxon
+        parser.indexes = {}
+        for taxon, (symbols, entrez, ensembl, synonym) in sections.items():
+            index = SymbolIndex(*symbols)
+            template = GeneInfoParser.ENSEMBL_TEMPLATES.get(taxon, GeneInfoParser.DEFAULT_ENSEMBL_TEMPLATE)
+            synonyms, targets, kinds = synonym
+            parser.indexes[taxon] = GeneInfoIndex(
+                taxon, index,
+                FrozenIdMap(index, *entrez, template=GeneInfoParser.ENTREZ_TEMPLATE),
+                FrozenIdMap(index, *ensembl, template=template),
+                FrozenSynonymMap(index, synonyms, targets, kinds))
+        return parser
+
+    @staticmethod
+    def load(fname, taxa=None, default_taxon=HUMAN, cache_fname=None):
+        """
+        Return a GeneInfoParser for fname, using a compiled on-disk index if it is up to date (see HgncParser.load).
+        By default, the index is stored next to the gene_info file; indexes of a subset of taxa get their own file.
+        """
+        if cache_fname is None:
+            suffix = '' if taxa is None else '.' + '-'.join(sorted(str(t) for t in taxa))
+            cache_fname = fname + suffix + '.hgnc-index'
+        cache = HgncIndexCache(fname, cache_fname)
+        sections = cache.read()
+        if sections is not None:
+            return GeneInfoParser._from_sections(fname, default_taxon, sections)
+        parser = GeneInfoParser(fname, taxa=taxa, default_taxon=default_taxon)
+        try:
+            cache.write(parser._to_sections())
+        except OSError as e:
+            print("[WARNING] Could not write gene_info index cache %s: %s" % (cache.cache_fname, e))
+        return parser
+
+    def get_taxa(self):
+        return sorted(self.indexes.keys())
+
+    def get_taxon_index(self, taxon):
+        taxon = str(taxon)
+        if taxon not in self.indexes:
+            raise ValueError("No genes of taxon %s in %s" % (taxon, self.fname))
+        return self.indexes[taxon]
+
+    def get_version(self):
+        """
+        Returns the SHA-256 of the gene_info file together with the default taxon
+        """
+        if self._version is None:
+            self._version = "%s:%s" % (HgncIndexCache.sha256(self.fname), self.default_taxon)
+        return self._version
+
+    def get_entrez_dictionary(self):
+        return self.get_taxon_index(self.default_taxon).get_entrez_dictionary()
+
+    def get_ensembl_dictionary(self):
+        return self.get_taxon_index(self.default_taxon).get_ensembl_dictionary()
+
+    def get_synonym_dictionary(self):
+        return self.get_taxon_index(self.default_taxon).get_synonym_dictionary()
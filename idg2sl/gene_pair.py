@@ -1,3 +1,5 @@
+import operator
+
 
 class GenePair:
     """
@@ -18,3 +20,167 @@ class GenePair:
         # Not strictly necessary, but to avoid having both x==y and x!=y
         # True at the same time
         return not (self == other)
+
+
+_NCBIGENE_PREFIX = 'NCBIGene:'
+
+
+class GenePairKey:
+    """
+    A gene pair as a single integer: the NCBI Gene ids of the two genes are packed into one 64-bit value (31 bits
+    per gene), so that hashing and comparing a key is as cheap as for an int and the keys of a whole table fit in
+    an int64 array.
+    The (undirected) key is canonical, i.e., it does not depend on the order of the genes, so that A-B and B-A
+    from different studies are the same key. The directed key keeps the order and has the DIRECTED bit set, so
+    that directed and undirected keys are never equal.
+    """
+    BITS = 31
+    MAX_ID = (1 << BITS) - 1
+    DIRECTED = 1 << (2 * BITS)
+
+    @staticmethod
+    def get_gene_number(gene_id):
+        """
+        Returns the number of an NCBI Gene id, which can be a CURIE (NCBIGene:3845) or an int
+        """
+        if isinstance(gene_id, str):
+            if not gene_id.startswith(_NCBIGENE_PREFIX):
+                raise ValueError("Gene id (%s) did not start with NCBIGene" % gene_id)
+            try:
+                number = int(gene_id[len(_NCBIGENE_PREFIX):])
+            except ValueError:
+                raise ValueError("Gene id (%s) does not have an NCBI Gene number" % gene_id) from None
+        else:
+            number = int(gene_id)
+        if number < 0 or number > GenePairKey.MAX_ID:
+            raise ValueError("Gene id (%s) cannot be packed into a GenePairKey" % gene_id)
+        return number
+
+    @staticmethod
+    def undirected(gene_A_id, gene_B_id):
+        a = GenePairKey.get_gene_number(gene_A_id)
+        b = GenePairKey.get_gene_number(gene_B_id)
+        if a > b:
+            a, b = b, a
+        return a << GenePairKey.BITS | b
+
+    @staticmethod
+    def directed(gene_A_id, gene_B_id):
+        a = GenePairKey.get_gene_number(gene_A_id)
+        b = GenePairKey.get_gene_number(gene_B_id)
+        return GenePairKey.DIRECTED | a << GenePairKey.BITS | b
+
+    @staticmethod
+    def from_sli(sli, directed=False):
+        if directed:
+            return GenePairKey.directed(sli.gene_A_id, sli.gene_B_id)
+        return GenePairKey.undirected(sli.gene_A_id, sli.gene_B_id)
+
+    @staticmethod
+    def is_directed(key):
+        return key & GenePairKey.DIRECTED != 0
+
+    @staticmethod
+    def unpack(key):
+        """
+        Returns the gene numbers of a key (for an undirected key, the smaller number first)
+        """
+        return (key >> GenePairKey.BITS) & GenePairKey.MAX_ID, key & GenePairKey.MAX_ID
+
+    @staticmethod
+    def get_curies(key):
+        return tuple(_NCBIGENE_PREFIX + str(number) for number in GenePairKey.unpack(key))
+
+    @staticmethod
+    def pack_arrays(gene_A_numbers, gene_B_numbers, directed=False):
+        """
+        Returns the keys of arrays of gene numbers (e.g., the gene_A_id and gene_B_id columns of a SliTable) as
+        an int64 array
+        """
+        import numpy as np
+        a = np.asarray(gene_A_numbers, dtype=np.int64)
+        b = np.asarray(gene_B_numbers, dtype=np.int64)
+        if len(a) > 0 and (min(a.min(), b.min()) < 0 or max(a.max(), b.max()) > GenePairKey.MAX_ID):
+            raise ValueError("Gene ids must be between 0 and %d to be packed into a GenePairKey" % GenePairKey.MAX_ID)
+        if directed:
+            return (a << GenePairKey.BITS) | b | GenePairKey.DIRECTED
+        return (np.minimum(a, b) << GenePairKey.BITS) | np.maximum(a, b)
+
+
+_BITS = GenePairKey.BITS
+_DIRECTED = GenePairKey.DIRECTED
+
+
+class GenePairGroups(dict):
+    """
+    A dictionary from a GenePairKey to the list of the SyntheticLethalInteraction objects of the pair, as used by
+    the parsers to collect the entries of which one per pair is marked as the maximum (see
+    SL_DatasetParser._mark_maximum_entries). The keys are directed by default, so that the groups of a dataset
+    are the same as with a GenePair of the symbols of gene A and gene B.
+    The gene numbers of the ids that were added are kept with the groups (a dataset has the same ids in many
+    entries), and are freed with them.
+    """
+    def __init__(self, directed=True):
+        super().__init__()
+        self.directed = directed
+        self._numbers = {}
+
+    def _get_gene_number(self, gene_id, slis):
+        number = self._numbers.get(gene_id)
+        if number is None:
+            try:
+                number = GenePairKey.get_gene_number(gene_id)
+            except ValueError as e:
+                sli = next(sli for sli in slis if gene_id in (sli.gene_A_id, sli.gene_B_id))
+                raise ValueError("%s in the entry %s" % (e, GenePairGroups.get_entry_string(sli))) from None
+            self._numbers[gene_id] = number
+        return number
+
+    @staticmethod
+    def get_entry_string(sli):
+        return "%s (%s) - %s (%s) of PMID:%s" % (sli.gene_A_symbol, sli.gene_A_id, sli.gene_B_symbol, sli.gene_B_id,
+                                                 sli.pmid)
+
+    def add(self, sli):
+        # GenePairKey.from_sli, inlined for ids that were added before
+        a = self._numbers.get(sli.gene_A_id)
+        b = self._numbers.get(sli.gene_B_id)
+        if a is None or b is None:
+            a = self._get_gene_number(sli.gene_A_id, (sli,))
+            b = self._get_gene_number(sli.gene_B_id, (sli,))
+        if self.directed:
+            key = _DIRECTED | a << _BITS | b
+        elif a < b:
+            key = a << _BITS | b
+        else:
+            key = b << _BITS | a
+        entries = self.get(key)
+        if entries is None:
+            self[key] = [sli]
+        else:
+            entries.append(sli)
+
+    def add_all(self, slis):
+        """
+        Adds a batch of entries; the keys of the batch are packed at once. A ValueError names the first entry
+        with an id that cannot be packed.
+        """
+        import numpy as np
+        slis = list(slis)
+        n = len(slis)
+        numbers = self._numbers
+        ids_A = list(map(operator.attrgetter('gene_A_id'), slis))
+        ids_B = list(map(operator.attrgetter('gene_B_id'), slis))
+        # each distinct id is converted once
+        for gene_id in set(ids_A).union(ids_B).difference(numbers):
+            self._get_gene_number(gene_id, slis)
+        a = np.fromiter(map(numbers.__getitem__, ids_A), dtype=np.int64, count=n)
+        b = np.fromiter(map(numbers.__getitem__, ids_B), dtype=np.int64, count=n)
+        keys = GenePairKey.pack_arrays(a, b, directed=self.directed).tolist()
+        get = self.get
+        for key, sli in zip(keys, slis):
+            entries = get(key)
+            if entries is None:
+                self[key] = [sli]
+            else:
+                entries.append(sli)
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import threading
+from collections.abc import Mapping
+
+
+class HgncIndexCache:
+    """
+    On-disk compiled version of the dictionaries built by the HgncParser.
+    The cache file starts with a magic string and a JSON header that records the size, modification time and
+    SHA-256 hash of the HGNC source file, the cache format version and the Python version (pickle protocol).
+    The header is followed by one pickled section per dictionary. Sections are read when they are first used.
+    If the source file changes (new size or content), the cache is stale and read() returns None.
+    """
+    MAGIC = b'IDG2SLHG'
+    FORMAT_VERSION = 4
+    _LENGTH = struct.Struct('<I')
+
+    def __init__(self, source_fname, cache_fname=None):
+        self.source_fname = source_fname
+        if cache_fname is None:
+            cache_fname = source_fname + '.hgnc-index'
+        self.cache_fname = cache_fname
+
+    def _source_key(self, with_hash=True):
+        st = os.stat(self.source_fname)
+        key = {'format': HgncIndexCache.FORMAT_VERSION,
+               'python': "%d.%d" % sys.version_info[:2],
+               'size': st.st_size,
+               'mtime_ns': st.st_mtime_ns}
+        if with_hash:
+            key['sha256'] = HgncIndexCache.sha256(self.source_fname)
+        return key
+
+    @staticmethod
+    def sha256(fname):
+        h = hashlib.sha256()
+        with open(fname, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+        return h.hexdigest()
+
+    def _is_current(self, header):
+        key = self._source_key(with_hash=False)
+        for k in ('format', 'python', 'size'):
+            if header.get(k) != key[k]:
+                return False
+        if header.get('mtime_ns') == key['mtime_ns']:
+            return True
+        # The file was touched or copied; it is only stale if the content changed
+        return header.get('sha256') == HgncIndexCache.sha256(self.source_fname)
+
+    def _read_header(self, f):
+        """
+        Returns the JSON header of the open cache file f (None if f is not a cache file)
+        """
+        if f.read(len(HgncIndexCache.MAGIC)) != HgncIndexCache.MAGIC:
+            return None
+        header_len = HgncIndexCache._LENGTH.unpack(f.read(HgncIndexCache._LENGTH.size))[0]
+        header = json.loads(f.read(header_len).decode('utf-8'))
+        header['start'] = len(HgncIndexCache.MAGIC) + HgncIndexCache._LENGTH.size + header_len
+        return header
+
+    def read(self):
+        """
+        Returns a mapping with the cached sections, or None if there is no valid cache for the source file.
+        Only the header is read here; each section is read and unpickled when it is accessed for the first time
+        (see LazySections), and no file is kept open in between.
+        """
+        if not os.path.exists(self.cache_fname):
+            return None
+        try:
+            with open(self.cache_fname, 'rb') as f:
+                header = self._read_header(f)
+                size = os.fstat(f.fileno()).st_size
+            if header is None or not self._is_current(header):
+                return None
+            for offset, length in header['sections'].values():
+                if header['start'] + offset + length > size:
+                    raise ValueError("Truncated cache file %s" % self.cache_fname)
+            return LazySections(self, header)
+        except (OSError, ValueError, struct.error, KeyError, TypeError):
+            return None
+
+    def read_section(self, header, name):
+        """
+        Returns the unpickled section name of the cache file, or raises a KeyError if the file no longer has
+        the section or was replaced by the cache of a different version of the source file
+        """
+        try:
+            with open(self.cache_fname, 'rb') as f:
+                current = self._read_header(f)
+                if current is None or any(current.get(k) != header.get(k) for k in ('format', 'python', 'sha256')):
+                    raise KeyError(name)
+                offset, length = current['sections'][name]
+                f.seek(current['start'] + offset)
+                data = f.read(length)
+        except (OSError, ValueError, struct.error, TypeError):
+            raise KeyError(name)
+        if len(data) != length:
+            raise KeyError(name)
+        return pickle.loads(data)
+
+    def write(self, sections):
+        """
+        Write the sections (a dictionary of picklable objects) to the cache file.
+        The file is written to a temporary file first and then renamed, so that readers never see partial files.
+        """
+        header = self._source_key(with_hash=True)
+        header['sections'] = {}
+        payloads = []
+        offset = 0
+        for name, obj in sections.items():
+            data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+            header['sections'][name] = [offset, len(data)]
+            payloads.append(data)
+            offset += len(data)
+        header_bytes = json.dumps(header).encode('utf-8')
+        cache_dir = os.path.dirname(os.path.abspath(self.cache_fname))
+        fd, tmp_fname = tempfile.mkstemp(dir=cache_dir, prefix='.hgnc-index-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(HgncIndexCache.MAGIC)
+                f.write(HgncIndexCache._LENGTH.pack(len(header_bytes)))
+                f.write(header_bytes)
+                for data in payloads:
+                    f.write(data)
+            os.replace(tmp_fname, self.cache_fname)
+        except BaseException:
+            if os.path.exists(tmp_fname):
+                os.remove(tmp_fname)
+            raise
+
+
+class LazySections(Mapping):
+    """
+    The sections of a cache file. A section is read from the file and unpickled when it is accessed for the
+    first time. Accessing a section that the file does not have (or no longer has) raises a KeyError.
+    """
+    def __init__(self, cache, header):
+        self._cache = cache
+        self._header = header
+        self._loaded = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name):
+        with self._lock:
+            if name not in self._loaded:
+                if name not in self._header['sections']:
+                    raise KeyError(name)
+                self._loaded[name] = self._cache.read_section(self._header, name)
+            return self._loaded[name]
+
+    def __contains__(self, name):
+        return name in self._header['sections']
+
+    def is_loaded(self, name):
+        return name in self._loaded
+
+    def __iter__(self):
+        return iter(self._header['sections'])
+
+    def __len__(self):
+        return len(self._header['sections'])
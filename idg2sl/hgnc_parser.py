@@ -1,35 +1,196 @@
-import csv
-from collections import defaultdict
+import threading
+from .hgnc_cache import HgncIndexCache
+from .table_reader import TableReader
+from .symbol_tables import SymbolIndex, FrozenIdMap, FrozenSynonymMap
+
 
 class HgncParser:
+    """
+    Parse the HGNC protein-coding gene file into three read-only mappings: symbol to NCBI Gene id,
+    symbol to Ensembl gene id, and previous/alias symbol to the current symbol ('MULTIPLE' if ambiguous).
+    Symbols are interned, synonyms are stored in a plain dictionary and the ids in typed arrays
+    (see symbol_tables.py), and lookups of unknown symbols never add entries to the mappings.
+    The file is read in a single pass that only keeps the raw columns; each mapping is built from these
+    columns (or from the on-disk index, see load) when it is used for the first time.
+    """
+    ENTREZ_TEMPLATE = '%d'
+    ENSEMBL_TEMPLATE = 'ENSG%011d'
+    COLUMNS = ('symbol', 'entrez_id', 'ensembl_gene_id', 'prev_symbol', 'alias_symbol')
+    _version = None
+
     def __init__(self, fname):
         self.fname = fname
-        self.symbol2entrez = defaultdict(str)
-        self.symbol2ensembl = defaultdict(str)
-        self.synonym2symbol = defaultdict(str)
-        with open(fname, 'r') as csvfile: 
-            csvreader = csv.DictReader(csvfile, delimiter='\t')
-            for row in csvreader: 
-                # hgnc_id = row['hgnc_id']
-                symbol = row['symbol']
-                entrez_id = row['entrez_id']
-                ensembl_gene_id = row['ensembl_gene_id']
-                prevsymstr = row['prev_symbol'].replace('"', "")
-                prev_symbols = prevsymstr.split('|')
-                for ps in prev_symbols:
-                    if ps in self.synonym2symbol:
-                        self.synonym2symbol[ps] = "MULTIPLE"
+        columns = TableReader(fname, HgncParser.COLUMNS).read_columns()
+        self._init_lazy(columns, None)
+
+    def _init_lazy(self, columns, sections, cache=None):
+        """
+        The mappings are built from the sections of the on-disk index or, for the sections that it does not
+        have, from the raw columns of the HGNC file. If cache is given, the index is (re)written with all
+        mappings built so far whenever a mapping is built from the columns.
+        """
+        self._columns = columns
+        self._sections = sections
+        self._cache = cache
+        self._index = None
+        self._entrez = None
+        self._ensembl = None
+        self._synonym = None
+        self._lock = threading.RLock()
+
+    def _get_section(self, name):
+        """
+        Returns the section name of the on-disk index, or None if there is none (the mapping is then built
+        from the columns)
+        """
+        if self._sections is None or name not in self._sections:
+            return None
+        try:
+            return self._sections[name]
+        except KeyError:
+            # the index file was replaced or removed after it was opened
+            return None
+
+    def _pop_column(self, name):
+        if self._columns is None:
+            self._columns = TableReader(self.fname, HgncParser.COLUMNS).read_columns()
+            if self._index is not None:
+                # the symbols were read from the on-disk index
+                del self._columns['symbol']
+        return self._columns.pop(name)
+
+    def _save(self):
+        """
+        Writes the mappings built so far (and the sections of the current index that were not built yet) to the
+        on-disk index
+        """
+        if self._cache is None:
+            return
+        sections = {'symbols': self._get_index().to_sections()}
+        for name, mapping in (('entrez', self._entrez), ('ensembl', self._ensembl), ('synonym', self._synonym)):
+            section = mapping.to_sections() if mapping is not None else self._get_section(name)
+            if section is not None:
+                sections[name] = section
+        try:
+            self._cache.write(sections)
+        except OSError as e:
+            print("[WARNING] Could not write HGNC index cache %s: %s" % (self._cache.cache_fname, e))
+
+    def _get_index(self):
+        with self._lock:
+            if self._index is None:
+                section = self._get_section('symbols')
+                if section is not None:
+                    self._index = SymbolIndex(*section)
+                else:
+                    self._index = SymbolIndex(self._pop_column('symbol'))
+            return self._index
+
+    @property
+    def symbol2entrez(self):
+        if self._entrez is None:
+            with self._lock:
+                if self._entrez is None:
+                    section = self._get_section('entrez')
+                    if section is not None:
+                        self._entrez = FrozenIdMap(self._get_index(), *section, template=HgncParser.ENTREZ_TEMPLATE)
                     else:
-                        self.synonym2symbol[ps] = symbol
-                alias_symbol_str = row['alias_symbol'].replace('"', "")
-                alias_symbols = alias_symbol_str.split('|')
-                for ps in alias_symbols:
-                    if ps in self.synonym2symbol:
-                        self.synonym2symbol[ps] = "MULTIPLE"
+                        self._entrez = FrozenIdMap.from_strings(self._get_index(), self._pop_column('entrez_id'),
+                                                                HgncParser.ENTREZ_TEMPLATE)
+                        self._save()
+        return self._entrez
+
+    @property
+    def symbol2ensembl(self):
+        if self._ensembl is None:
+            with self._lock:
+                if self._ensembl is None:
+                    section = self._get_section('ensembl')
+                    if section is not None:
+                        self._ensembl = FrozenIdMap(self._get_index(), *section,
+                                                    template=HgncParser.ENSEMBL_TEMPLATE)
                     else:
-                        self.synonym2symbol[ps] = symbol
-                self.symbol2entrez[symbol] = entrez_id
-                self.symbol2ensembl[symbol] = ensembl_gene_id
+                        self._ensembl = FrozenIdMap.from_strings(self._get_index(),
+                                                                 self._pop_column('ensembl_gene_id'),
+                                                                 HgncParser.ENSEMBL_TEMPLATE)
+                        self._save()
+        return self._ensembl
+
+    @property
+    def synonym2symbol(self):
+        if self._synonym is None:
+            with self._lock:
+                if self._synonym is None:
+                    section = self._get_section('synonym')
+                    if section is not None:
+                        synonyms, targets, kinds = section
+                        self._synonym = FrozenSynonymMap(self._get_index(), synonyms, targets, kinds)
+                    else:
+                        self._synonym = self._build_synonyms(self._pop_column('prev_symbol'),
+                                                             self._pop_column('alias_symbol'))
+                        self._save()
+        return self._synonym
+
+    def _build_synonyms(self, prev_column, alias_column):
+        synonym2row = {}
+        previous_symbols = set()
+        for i, (prevsymstr, alias_symbol_str) in enumerate(zip(prev_column, alias_column)):
+            prev_symbols = prevsymstr.replace('"', "").split('|')
+            previous_symbols.update(prev_symbols)
+            for ps in prev_symbols + alias_symbol_str.replace('"', "").split('|'):
+                if ps == '':
+                    continue
+                if ps in synonym2row:
+                    synonym2row[ps] = -1  # MULTIPLE
+                else:
+                    synonym2row[ps] = i
+        return FrozenSynonymMap.from_dict(self._get_index(), synonym2row, previous_symbols)
+
+    @staticmethod
+    def _from_sections(fname, sections, cache=None):
+        parser = HgncParser.__new__(HgncParser)
+        parser.fname = fname
+        parser._init_lazy(None, sections, cache)
+        return parser
+
+    @staticmethod
+    def load(fname, cache_fname=None):
+        """
+        Return an HgncParser for fname, using the compiled on-disk index if it is up to date. Otherwise, the
+        HGNC file is parsed; in both cases, each mapping is only built when it is used for the first time, and
+        the mappings that are built from the HGNC file are added to the index. By default, the index is stored
+        next to the HGNC file (fname + '.hgnc-index').
+        """
+        cache = HgncIndexCache(fname, cache_fname)
+        sections = cache.read()
+        if sections is not None:
+            return HgncParser._from_sections(fname, sections, cache)
+        parser = HgncParser(fname)
+        parser._cache = cache
+        return parser
+
+    def __reduce__(self):
+        # An HgncParser is sent to another process (e.g., a worker of the ParserRunner) by its file name, and the
+        # receiving process loads it again (from the on-disk index if this parser came from load)
+        cache_fname = None if self._cache is None else self._cache.cache_fname
+        return HgncParser._restore, (self.fname, cache_fname, self._version)
+
+    @staticmethod
+    def _restore(fname, cache_fname, version):
+        if cache_fname is None:
+            parser = HgncParser(fname)
+        else:
+            parser = HgncParser.load(fname, cache_fname)
+        parser._version = version
+        return parser
+
+    def get_version(self):
+        """
+        Returns the SHA-256 of the HGNC file, which identifies the HGNC release (e.g., for the ParseResultCache)
+        """
+        if self._version is None:
+            self._version = HgncIndexCache.sha256(self.fname)
+        return self._version
 
     def get_entrez_dictionary(self):
         return self.symbol2entrez
@@ -38,4 +199,4 @@ class HgncParser:
         return self.symbol2ensembl
 
     def get_synonym_dictionary(self):
-        return self.synonym2symbol
\ No newline at end of file
+        return self.synonym2symbol
@@ -0,0 +1,200 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+import urllib.error
+
+
+class HgncSnapshotStore:
+    """
+    Local, content-addressed store of downloaded HGNC files that can be shared by several working copies.
+    Each snapshot is stored once as objects/<sha256[:2]>/<sha256>; named references (refs/<name>.json) record
+    the SHA-256, URL, ETag and Last-Modified header of the download. By default, the store lives in the
+    directory given by the IDG2SL_CACHE_DIR environment variable or in ~/.cache/idg2sl.
+    A reference that was checked less than max_age seconds ago is used without network access. Otherwise, the
+    file is re-fetched with a conditional request, so the file is only downloaded again if it changed upstream.
+    In offline mode (offline=True or IDG2SL_OFFLINE=1) the store never uses the network.
+    A specific release can be pinned by passing its SHA-256 (or a unique prefix) as the ref (or setting
+    IDG2SL_HGNC_SNAPSHOT).
+    """
+    DEFAULT_URL = 'https://ftp.ebi.ac.uk/pub/databases/genenames/hgnc/tsv/locus_groups/protein-coding_gene.txt'
+    DEFAULT_REF = 'protein-coding_gene'
+    DEFAULT_MAX_AGE = 7 * 24 * 3600
+    _HEX = re.compile(r'^[0-9a-f]{6,64}$')
+
+    def __init__(self, cache_dir=None, url=DEFAULT_URL, offline=None, timeout=60, max_age=DEFAULT_MAX_AGE):
+        if cache_dir is None:
+            cache_dir = HgncSnapshotStore.get_default_cache_dir()
+        if offline is None:
+            offline = os.environ.get('IDG2SL_OFFLINE', '').lower() in ('1', 'true', 'yes')
+        self.cache_dir = cache_dir
+        self.url = url
+        self.offline = offline
+        self.timeout = timeout
+        self.max_age = max_age
+
+    @staticmethod
+    def get_default_cache_dir():
+        return os.environ.get('IDG2SL_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'idg2sl'))
+
+    def get(self, ref=None, refresh=False):
+        """
+        Returns the path of the snapshot for ref (a reference name or a pinned SHA-256), downloading or
+        refreshing it if necessary. refresh=True checks upstream even if the reference is younger than max_age.
+        """
+        if ref is None:
+            ref = os.environ.get('IDG2SL_HGNC_SNAPSHOT', HgncSnapshotStore.DEFAULT_REF)
+        if HgncSnapshotStore._HEX.match(ref) and not os.path.exists(self._ref_path(ref)):
+            return self.get_object_path(self.resolve_pinned(ref))
+        info = self.read_ref(ref)
+        if info is not None and os.path.exists(self.get_object_path(info['sha256'])):
+            fresh = time.time() - info.get('checked', 0) < self.max_age
+            if self.offline or (fresh and not refresh):
+                return self.get_object_path(info['sha256'])
+        elif self.offline:
+            raise ValueError("No HGNC snapshot '%s' in %s and offline mode is on" % (ref, self.cache_dir))
+        else:
+            info = None
+        return self._fetch(ref, info)
+
+    def _fetch(self, ref, info):
+        # urllib.request (with http.client, ssl and email) is only imported if the network is actually used
+        import urllib.request
+        url = info['url'] if info is not None else self.url
+        request = urllib.request.Request(url)
+        if info is not None:
+            if info.get('etag'):
+                request.add_header('If-None-Match', info['etag'])
+            if info.get('last_modified'):
+                request.add_header('If-Modified-Since', info['last_modified'])
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                print("[INFO] Downloading %s" % url)
+                sha256 = self._store_stream(response)
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and info is not None:
+                info['checked'] = time.time()
+                self._write_ref(ref, info)
+                return self.get_object_path(info['sha256'])
+            return self._fetch_failed(ref, url, info, e)
+        except (urllib.error.URLError, OSError) as e:
+            return self._fetch_failed(ref, url, info, e)
+        self._write_ref(ref, {'sha256': sha256, 'url': url, 'etag': etag, 'last_modified': last_modified,
+                              'checked': time.time()})
+        return self.get_object_path(sha256)
+
+    def _fetch_failed(self, ref, url, info, error):
+        if info is not None:
+            print("[WARNING] Could not refresh %s (%s), using the local snapshot %s" % (url, error, info['sha256']))
+            return self.get_object_path(info['sha256'])
+        raise ValueError("Failed to download %s: %s" % (url, error))
+
+    def add_file(self, fname, ref=DEFAULT_REF):
+        """
+        Import a local copy of the HGNC file as a snapshot (e.g., to seed the store of an offline machine).
+        Returns the SHA-256 of the file.
+        """
+        with open(fname, 'rb') as f:
+            sha256 = self._store_stream(f)
+        self._write_ref(ref, {'sha256': sha256, 'url': self.url, 'etag': None, 'last_modified': None,
+                              'checked': time.time()})
+        return sha256
+
+    def _store_stream(self, stream):
+        """
+        Copy stream into the object store and return its SHA-256. The data are written to a temporary file
+        that is renamed to its final name, so that concurrent readers never see partial files.
+        """
+        tmp_dir = os.path.join(self.cache_dir, 'tmp')
+        os.makedirs(tmp_dir, exist_ok=True)
+        h = hashlib.sha256()
+        fd, tmp_fname = tempfile.mkstemp(dir=tmp_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for block in iter(lambda: stream.read(1 << 20), b''):
+                    h.update(block)
+                    f.write(block)
+            sha256 = h.hexdigest()
+            object_path = self.get_object_path(sha256)
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            if os.path.exists(object_path):
+                os.remove(tmp_fname)
+            else:
+                os.replace(tmp_fname, object_path)
+        except BaseException:
+            if os.path.exists(tmp_fname):
+                os.remove(tmp_fname)
+            raise
+        return sha256
+
+    def get_object_path(self, sha256):
+        return os.path.join(self.cache_dir, 'objects', sha256[:2], sha256)
+
+    def resolve_pinned(self, prefix):
+        """
+        Returns the full SHA-256 of the stored snapshot whose SHA-256 starts with prefix
+        """
+        objects_dir = os.path.join(self.cache_dir, 'objects', prefix[:2])
+        matches = []
+        if os.path.isdir(objects_dir):
+            matches = [name for name in os.listdir(objects_dir) if name.startswith(prefix) and '.' not in name]
+        if len(matches) != 1:
+            raise ValueError("Pinned HGNC snapshot %s matches %d snapshots in %s" %
+                             (prefix, len(matches), self.cache_dir))
+        return matches[0]
+
+    def _ref_path(self, ref):
+        return os.path.join(self.cache_dir, 'refs', ref + '.json')
+
+    def read_ref(self, ref):
+        """
+        Returns the information stored for the reference ref, or None if there is no such reference
+        """
+        try:
+            with open(self._ref_path(ref)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_ref(self, ref, info):
+        ref_path = self._ref_path(ref)
+        os.makedirs(os.path.dirname(ref_path), exist_ok=True)
+        fd, tmp_fname = tempfile.mkstemp(dir=os.path.dirname(ref_path), prefix='.ref-')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(info, f, indent=2)
+        os.replace(tmp_fname, ref_path)
+
+    def get_refs(self):
+        refs_dir = os.path.join(self.cache_dir, 'refs')
+        if not os.path.isdir(refs_dir):
+            return []
+        return sorted(name[:-len('.json')] for name in os.listdir(refs_dir) if name.endswith('.json'))
+
+    def remove_unreferenced(self):
+        """
+        Delete the snapshots (and their compiled indexes) that no reference points to. Returns the number of
+        deleted snapshots.
+        """
+        referenced = set()
+        for ref in self.get_refs():
+            info = self.read_ref(ref)
+            if info is not None:
+                referenced.add(info['sha256'])
+        removed = 0
+        objects_dir = os.path.join(self.cache_dir, 'objects')
+        if not os.path.isdir(objects_dir):
+            return removed
+        for subdir in os.listdir(objects_dir):
+            for name in os.listdir(os.path.join(objects_dir, subdir)):
+                sha256 = name.split('.', 1)[0]
+                if sha256 not in referenced:
+                    os.remove(os.path.join(objects_dir, subdir, name))
+                    if name == sha256:
+                        removed += 1
+        shutil.rmtree(os.path.join(self.cache_dir, 'tmp'), ignore_errors=True)
+        return removed
@@ -0,0 +1,195 @@
+from .evidence_aggregation import EvidenceAggregator
+from .gene_pair import GenePairKey, GenePairGroups
+
+
+class PairEvidence:
+    """
+    The evidence of all studies for one (unordered) gene pair:
+     - pmids, cell_lines and assays: the distinct values, in the order in which they were first seen (dictionaries
+       are used as ordered sets; empty cell lines are skipped)
+     - n_positive and n_negative: the number of positive (SL) and negative entries
+     - best_effects: a dictionary from each effect type to the effect size with the strongest evidence (see
+       EvidenceAggregator.get_directed_score), for the entries with a numeric effect size
+    """
+    __slots__ = ('key', 'pmids', 'cell_lines', 'assays', 'n_positive', 'n_negative', 'best_effects')
+
+    def __init__(self, key):
+        self.key = key
+        self.pmids = {}
+        self.cell_lines = {}
+        self.assays = {}
+        self.n_positive = 0
+        self.n_negative = 0
+        self.best_effects = {}
+
+    def add_entries(self, entries):
+        pmids = self.pmids
+        cell_lines = self.cell_lines
+        assays = self.assays
+        best_effects = self.best_effects
+        get_numeric_effect = EvidenceAggregator.get_numeric_effect
+        get_directed_score = EvidenceAggregator.get_directed_score
+        n_positive = 0
+        for sli in entries:
+            pmids[sli.pmid] = None
+            if sli.cell_line:
+                cell_lines[sli.cell_line] = None
+            assays[sli.assay] = None
+            if sli.SL:
+                n_positive += 1
+            value = get_numeric_effect(sli.effect_size)
+            if value is None:
+                continue
+            effect_type = sli.effect_type
+            best = best_effects.get(effect_type)
+            if best is None or get_directed_score(value, effect_type) > get_directed_score(best, effect_type):
+                best_effects[effect_type] = value
+        self.n_positive += n_positive
+        self.n_negative += len(entries) - n_positive
+
+    def get_study_count(self):
+        return len(self.pmids)
+
+    def get_pmids(self):
+        return list(self.pmids)
+
+    def get_cell_lines(self):
+        return list(self.cell_lines)
+
+    def get_assays(self):
+        return list(self.assays)
+
+    def get_gene_ids(self):
+        """
+        Returns the NCBI Gene CURIEs of the pair (the gene with the smaller id first)
+        """
+        return GenePairKey.get_curies(self.key)
+
+
+class PairEvidenceIndex:
+    """
+    Consolidates the entries of all studies by unordered gene pair (an undirected GenePairKey), so that the
+    studies, cell lines and assays that support a pair can be looked up without a scan over all entries. The
+    entries are added in batches (e.g., the results of one parser) and are not kept. Each pair is listed with
+    the gene with the smaller NCBI Gene id as gene A, independently of the order of the genes in the studies.
+    The pairs are kept in the order in which they were first seen.
+    """
+    def __init__(self):
+        self._pairs = {}
+        # the symbol of each NCBI Gene id (the first one that was seen), and the reverse
+        self._symbols = {}
+        self._gene_ids = {}
+
+    def add_all(self, slis):
+        """
+        Adds a batch of entries (one pass, the keys of the batch are packed at once). Entries with a gene id that
+        is not an NCBI Gene CURIE with a number are skipped with a warning.
+        """
+        slis = list(slis)
+        groups = GenePairGroups(directed=False)
+        try:
+            groups.add_all(slis)
+        except ValueError:
+            groups = GenePairGroups(directed=False)
+            groups.add_all(PairEvidenceIndex._skip_invalid_ids(slis))
+        pairs = self._pairs
+        add_symbol = self._symbols.setdefault
+        add_gene_id = self._gene_ids.setdefault
+        for key, entries in groups.items():
+            evidence = pairs.get(key)
+            if evidence is None:
+                evidence = PairEvidence(key)
+                pairs[key] = evidence
+                sli = entries[0]
+                add_symbol(sli.gene_A_id, sli.gene_A_symbol)
+                add_symbol(sli.gene_B_id, sli.gene_B_symbol)
+                add_gene_id(sli.gene_A_symbol, sli.gene_A_id)
+                add_gene_id(sli.gene_B_symbol, sli.gene_B_id)
+            evidence.add_entries(entries)
+
+    @staticmethod
+    def _skip_invalid_ids(slis):
+        invalid = {}
+        for gene_id in {sli.gene_A_id for sli in slis}.union(sli.gene_B_id for sli in slis):
+            try:
+                GenePairKey.get_gene_number(gene_id)
+            except ValueError as e:
+                invalid[gene_id] = e
+        valid = []
+        for sli in slis:
+            error = invalid.get(sli.gene_A_id) or invalid.get(sli.gene_B_id)
+            if error is None:
+                valid.append(sli)
+            else:
+                print("[WARNING] Skipping the entry %s: %s" % (GenePairGroups.get_entry_string(sli), error))
+        return valid
+
+    def __len__(self):
+        return len(self._pairs)
+
+    def __iter__(self):
+        return iter(self._pairs.values())
+
+    def get_evidence(self, gene_1_id, gene_2_id):
+        """
+        Returns the PairEvidence of two genes (NCBI Gene CURIEs or numbers, in any order), or None if no study
+        has an entry for the pair
+        """
+        return self._pairs.get(GenePairKey.undirected(gene_1_id, gene_2_id))
+
+    def get_evidence_by_symbols(self, symbol_1, symbol_2):
+        """
+        As get_evidence, for the gene symbols used in the entries (e.g., EGFR and ANXA6)
+        """
+        if symbol_1 not in self._gene_ids or symbol_2 not in self._gene_ids:
+            return None
+        return self.get_evidence(self._gene_ids[symbol_1], self._gene_ids[symbol_2])
+
+    def get_symbol(self, gene_id):
+        return self._symbols.get(gene_id)
+
+    @staticmethod
+    def get_tsv_header():
+        lst = ['geneA',
+               'geneA.ncbi-id',
+               'geneA.ensembl-id',
+               'geneB',
+               'geneB.ncbi-id',
+               'geneB.ensembl-id',
+               'n.studies',
+               'pmids',
+               'n.positive',
+               'n.negative',
+               'assays',
+               'cell.lines',
+               'best.effects']
+        return "\t".join(lst)
+
+    def get_tsv_line(self, evidence, symbol2ensembl):
+        """
+        The line of a pair: the values of the lists are separated by | (a single assay can contain a semicolon,
+        see Turner2008Parser), and the best effects are given as effect.type=effect.size
+        """
+        id_A, id_B = evidence.get_gene_ids()
+        symbol_A = self._symbols[id_A]
+        symbol_B = self._symbols[id_B]
+        best_effects = "|".join("%s=%s" % item for item in evidence.best_effects.items())
+        lst = [symbol_A,
+               id_A,
+               symbol2ensembl.get(symbol_A, "n/a"),
+               symbol_B,
+               id_B,
+               symbol2ensembl.get(symbol_B, "n/a"),
+               str(evidence.get_study_count()),
+               "|".join(map(str, evidence.pmids)),
+               str(evidence.n_positive),
+               str(evidence.n_negative),
+               "|".join(evidence.assays),
+               "|".join(evidence.cell_lines),
+               best_effects if best_effects else "n/a"]
+        return "\t".join(lst)
+
+    def write_tsv(self, fh, symbol2ensembl):
+        fh.write(PairEvidenceIndex.get_tsv_header() + "\n")
+        for evidence in self._pairs.values():
+            fh.write(self.get_tsv_line(evidence, symbol2ensembl) + "\n")
@@ -0,0 +1,195 @@
+import ast
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import zlib
+from .compressed_input import CompressedInput
+from .hgnc_cache import HgncIndexCache
+from .hgnc_snapshot import HgncSnapshotStore
+
+
+class ParseResultCache:
+    """
+    On-disk cache of the SLI lists returned by the parse() methods of the dataset parsers. Each parser has one
+    file (<parser class>.sli) with a magic string, a JSON header and the zlib-compressed, pickled SLI list.
+    The header records a key, the SHA-256 of
+     - the input files of the parser (see SL_DatasetParser.get_input_files),
+     - the version of the gene index (e.g., the SHA-256 of the HGNC file, see HgncParser.get_version),
+     - the source files of the modules of the parser class and of its base classes, and of all modules of this
+       package that these modules import, directly or indirectly (see get_imported_modules),
+     - the cache format and Python versions.
+    A result is only used if its key matches the current key, so editing one parser or one data file only
+    re-runs the affected parser. By default, the cache lives in the parse-results subdirectory of the
+    directory of the HgncSnapshotStore.
+    """
+    MAGIC = b'IDG2SLPR'
+    FORMAT_VERSION = 1
+    PACKAGE = 'idg2sl'
+    _LENGTH = struct.Struct('<I')
+
+    def __init__(self, cache_dir=None):
+        if cache_dir is None:
+            cache_dir = os.path.join(HgncSnapshotStore.get_default_cache_dir(), 'parse-results')
+        self.cache_dir = cache_dir
+        self._file_hashes = {}
+        self._imports = {}
+
+    def _sha256(self, fname):
+        # source files are hashed once per process; data files may be edited between runs of a session
+        fname = os.path.abspath(fname)
+        st = os.stat(fname)
+        stamp = (st.st_size, st.st_mtime_ns)
+        cached = self._file_hashes.get(fname)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, HgncIndexCache.sha256(fname))
+            self._file_hashes[fname] = cached
+        return cached[1]
+
+    @staticmethod
+    def _get_source_file(name):
+        module = sys.modules.get(name)
+        fname = getattr(module, '__file__', None)
+        if fname is None:
+            spec = importlib.util.find_spec(name)
+            fname = None if spec is None else spec.origin
+        if fname is None or not fname.endswith('.py'):
+            raise ValueError("Could not find the source file of module %s" % name)
+        return fname
+
+    @staticmethod
+    def _is_package_module(name):
+        return name == ParseResultCache.PACKAGE or name.startswith(ParseResultCache.PACKAGE + '.')
+
+    @staticmethod
+    def get_imported_modules(name):
+        """
+        Returns the names of the modules of this package that the module name imports (also in functions).
+        Names imported from a package (e.g., from idg2sl import SyntheticLethalInteraction) count as imports of
+        the module that defines them, not of the package.
+        """
+        fname = ParseResultCache._get_source_file(name)
+        with open(fname, 'rt', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), fname)
+        package = name if os.path.basename(fname) == '__init__.py' else name.rpartition('.')[0]
+        imported = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                imported.update(alias.name for alias in node.names
+                                if ParseResultCache._is_package_module(alias.name))
+            elif isinstance(node, ast.ImportFrom):
+                base = importlib.util.resolve_name('.' * node.level + (node.module or ''), package)
+                if not ParseResultCache._is_package_module(base):
+                    continue
+                base_module = importlib.import_module(base)
+                for alias in node.names:
+                    submodule = base + '.' + alias.name
+                    if hasattr(base_module, '__path__') and importlib.util.find_spec(submodule) is not None:
+                        imported.add(submodule)
+                        continue
+                    value = getattr(base_module, alias.name, None)
+                    defined_in = getattr(value, '__module__', None)
+                    if defined_in is not None and ParseResultCache._is_package_module(defined_in):
+                        imported.add(defined_in)
+                    else:
+                        imported.add(base)
+        imported.discard(name)
+        return imported
+
+    def _source_files(self, parser_class):
+        todo = [cls.__module__ for cls in parser_class.__mro__ if cls is not object]
+        modules = set()
+        while len(todo) > 0:
+            name = todo.pop()
+            if name in modules:
+                continue
+            modules.add(name)
+            if name not in self._imports:
+                self._imports[name] = ParseResultCache.get_imported_modules(name)
+            todo.extend(self._imports[name])
+        return [ParseResultCache._get_source_file(name) for name in sorted(modules)]
+
+    def get_key(self, parser, gene_index):
+        """
+        Returns the key of the result of parser with the gene index gene_index, or None if the result cannot be
+        cached (because the gene index does not have a get_version method or an input file is missing)
+        """
+        get_version = getattr(gene_index, 'get_version', None)
+        if get_version is None:
+            return None
+        h = hashlib.sha256()
+        h.update(("%d %d.%d %s\n" % ((ParseResultCache.FORMAT_VERSION,) + sys.version_info[:2] +
+                                     (get_version(),))).encode('utf-8'))
+        try:
+            for fname in parser.get_input_files():
+                # the file that is actually read, which may be a compressed version of fname
+                fname = CompressedInput.find(fname) or fname
+                h.update(("input %s %s\n" % (fname, self._sha256(fname))).encode('utf-8'))
+            for fname in self._source_files(type(parser)):
+                h.update(("source %s %s\n" % (os.path.basename(fname), self._sha256(fname))).encode('utf-8'))
+        except OSError:
+            return None
+        return h.hexdigest()
+
+    def _fname(self, parser):
+        return os.path.join(self.cache_dir, type(parser).__name__ + '.sli')
+
+    def read(self, parser, key):
+        """
+        Returns the cached SLI list of parser, or None if there is no result with the key
+        """
+        try:
+            with open(self._fname(parser), 'rb') as f:
+                if f.read(len(ParseResultCache.MAGIC)) != ParseResultCache.MAGIC:
+                    return None
+                header_len = ParseResultCache._LENGTH.unpack(f.read(ParseResultCache._LENGTH.size))[0]
+                header = json.loads(f.read(header_len).decode('utf-8'))
+                if header.get('key') != key:
+                    return None
+                return pickle.loads(zlib.decompress(f.read()))
+        except (OSError, ValueError, EOFError, struct.error, zlib.error, pickle.UnpicklingError):
+            return None
+
+    def write(self, parser, key, sli_list):
+        """
+        Store sli_list as the result of parser. The file is written to a temporary file first and then renamed,
+        so that concurrent readers (e.g., other workers of the ParserRunner) never see partial files.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        header = json.dumps({'key': key, 'parser': type(parser).__name__, 'n': len(sli_list)}).encode('utf-8')
+        data = zlib.compress(pickle.dumps(sli_list, protocol=pickle.HIGHEST_PROTOCOL), 6)
+        fd, tmp_fname = tempfile.mkstemp(dir=self.cache_dir, prefix='.sli-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(ParseResultCache.MAGIC)
+                f.write(ParseResultCache._LENGTH.pack(len(header)))
+                f.write(header)
+                f.write(data)
+            os.replace(tmp_fname, self._fname(parser))
+        except BaseException:
+            if os.path.exists(tmp_fname):
+                os.remove(tmp_fname)
+            raise
+
+    def get(self, parser, gene_index):
+        """
+        Returns the SLI list of parser from the cache if it is current; otherwise, the parser is run and its
+        result is stored. The second return value is True if the result was taken from the cache.
+        """
+        key = self.get_key(parser, gene_index)
+        if key is not None:
+            sli_list = self.read(parser, key)
+            if sli_list is not None:
+                return sli_list, True
+        sli_list = parser.parse()
+        if key is not None:
+            try:
+                self.write(parser, key, sli_list)
+            except OSError as e:
+                print("[WARNING] Could not write parse result cache %s: %s" % (self._fname(parser), e))
+        return sli_list, False
@@ -0,0 +1,258 @@
+import ast
+import importlib
+import os
+
+
+class ParserSpec:
+    """
+    Metadata of one dataset parser: the name of the parser class, the module that defines it, a label for
+    reports, the PubMed id of the publication and the input files (relative to the working directory).
+    The module is only imported when load() is called.
+    Manually entered datasets cover many publications and have no pmid.
+    If source is given, the metadata that is not passed is read from the source file of the module on first
+    use, without importing it (see read_source).
+    """
+    def __init__(self, name, module, label=None, pmid=None, files=(), parser_class=None, source=None):
+        self.name = name
+        self.module = module
+        self._label = label
+        self._pmid = pmid
+        self._files = tuple(files)
+        self._parser_class = parser_class
+        self._source = source
+
+    def _read_metadata(self):
+        if self._source is not None:
+            label, pmid, files = ParserSpec.read_source(self._source, self.name)
+            self._label = self._label or label or self.name
+            self._pmid = self._pmid or pmid
+            self._files = self._files or tuple(files)
+            self._source = None
+
+    @property
+    def label(self):
+        self._read_metadata()
+        return self._label
+
+    @property
+    def pmid(self):
+        self._read_metadata()
+        return self._pmid
+
+    @property
+    def files(self):
+        self._read_metadata()
+        return self._files
+
+    def copy(self):
+        return ParserSpec(self.name, self.module, self._label, self._pmid, self._files, self._parser_class,
+                          self._source)
+
+    @staticmethod
+    def read_source(fname, name):
+        """
+        Returns the label, pmid and input files of the parser class name in the module source fname (None for
+        what is not found):
+         - a class defined in the module: the pmid that its __init__ assigns to pmid (or passes as pmid=) and
+           the data/... file names of the module (e.g., the default fname); there is no label
+         - a class generated from a YAML spec (name = SpecParser.create_class(path, __name__), with the spec in
+           the specs directory of the package): the label, pmid and file of the spec
+        """
+        with open(fname) as f:
+            tree = ast.parse(f.read(), fname)
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and node.name == name:
+                files = [n.value for n in ast.walk(tree) if isinstance(n, ast.Constant)
+                         and isinstance(n.value, str) and n.value.startswith('data/')]
+                return None, ParserSpec._get_init_pmid(node), list(dict.fromkeys(files))
+            if (isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == name for t in node.targets)
+                    and isinstance(node.value, ast.Call) and len(node.value.args) > 0):
+                spec_files = [n.value for n in ast.walk(node.value.args[0]) if isinstance(n, ast.Constant)
+                              and isinstance(n.value, str) and n.value.endswith('.yaml')]
+                if len(spec_files) == 1:
+                    from .spec_parser import DatasetSpec
+                    package_dir = os.path.dirname(os.path.abspath(__file__))
+                    spec = DatasetSpec.load(os.path.join(package_dir, 'specs', spec_files[0]))
+                    return spec.label, spec.pmid, [spec.fname]
+        raise ValueError("Could not find the parser %s in %s" % (name, fname))
+
+    @staticmethod
+    def _get_init_pmid(class_node):
+        for node in class_node.body:
+            if isinstance(node, ast.FunctionDef) and node.name == '__init__':
+                for n in ast.walk(node):
+                    if (isinstance(n, ast.Assign) and any(isinstance(t, ast.Name) and t.id == 'pmid'
+                                                          for t in n.targets)):
+                        value = n.value
+                    elif isinstance(n, ast.keyword) and n.arg == 'pmid':
+                        value = n.value
+                    else:
+                        continue
+                    if isinstance(value, ast.Constant) and isinstance(value.value, str):
+                        return value.value
+        return None
+
+    def load(self):
+        """
+        Import the module of the parser (if needed) and return the parser class
+        """
+        if self._parser_class is None:
+            module = importlib.import_module(self.module)
+            self._parser_class = getattr(module, self.name)
+        return self._parser_class
+
+    def is_loaded(self):
+        return self._parser_class is not None
+
+    def get_pmid_string(self):
+        return "n/a" if self.pmid is None else "PMID:%s" % self.pmid
+
+    def __repr__(self):
+        return "%s (%s, %s)" % (self.name, self.label, self.get_pmid_string())
+
+
+def _builtin(name, module, label=None):
+    # the pmid and files (and the label of a parser generated from a YAML spec) are read from the module source
+    source = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parsers', module + '.py')
+    return ParserSpec(name, 'idg2sl.parsers.' + module, label, source=source)
+
+
+class ParserRegistry:
+    """
+    Registry of the dataset parsers. The parsers of this package are listed below, so that they can be
+    enumerated and selected without importing them; their pmid and files are read from the source of their
+    modules, and a parser generated from a YAML spec also takes its label from the spec. Other packages can contribute parsers with an entry point
+    in the group idg2sl.parsers, e.g.,
+
+        [project.entry-points."idg2sl.parsers"]
+        Smith2021Parser = "smith_sl.parser:Smith2021Parser"
+
+    Entry points are read on first use of the registry; their classes are also only imported when loaded.
+    Parsers defined in scripts can be added with the register_parser decorator.
+    """
+    ENTRY_POINT_GROUP = 'idg2sl.parsers'
+    BUILTIN_PARSERS = [
+        _builtin('Astsaturov2010Parser', 'astsaturov_2010_parser', "Astsaturov et al 2010"),
+        _builtin('Baldwin2010Parser', 'baldwin_2010_parser', "Baldwin et al 2010"),
+        _builtin('Bommi2008Parser', 'bommi_2008_parser', "Bommi et al 2008"),
+        _builtin('Blomen2015Parser', 'blomen_2015_parser', "Blomen et al 2015"),
+        _builtin('Brough2018Parser', 'brough_2018_parser', "Brough et al 2018"),
+        _builtin('Chakraborty2017Parser', 'chakraborty_2017_parser', "chakraborty et al 2017"),
+        _builtin('Chin2020Parser', 'chin_2020_parser', "chin 2020"),
+        _builtin('Dai2013Parser', 'dai_2013_parser', "Dai et al 2013"),
+        _builtin('Etemadmoghadam2013Parser', 'etemadmoghadam_2013_parser', "Etemadmoghadam et al 2013"),
+        _builtin('Han2017Parser', 'han_2017_parser', "Han et al 2017"),
+        _builtin('JerbyArnon2014Parser', 'jerby_arnon_2014_parser', "Jerby Arnon et al 2014"),
+        _builtin('Josse2014Parser', 'josse_2014_parser'),
+        _builtin('Kang2015Parser', 'kang_2015_parser', "Kang et al 2015"),
+        _builtin('Kessler2012Parser', 'kessler_2012_parser'),
+        _builtin('Kim2011Parser', 'kim_2011_parser', "Kim et al 2011"),
+        _builtin('Krastev2011Parser', 'krastev_2011_parser', "Krastev et al 2011"),
+        _builtin('Lord2008Parser', 'lord_2008_parser', "Lord et al 2008"),
+        _builtin('Luo2009Parser', 'luo_2009', "Luo et al 2009"),
+        _builtin('Martin2010and2011Parser', 'martin_2010_parser', "Martin et al 2010/2011"),
+        _builtin('Mengwasser2019Parser', 'mengwasser2019_parser', "Mengwasser et al 2019"),
+        _builtin('Mohni2014Parser', 'mohni_2014_parser', "Mohni et al 2014"),
+        _builtin('Mondal2019Parser', 'mondal_2019_parser', "Mondal et al 2019"),
+        _builtin('Najm2018Parser', 'najm_2018_parser', "Najm et al 2018"),
+        _builtin('Oser2019Parser', 'oser_2019_parser', "Oser et al 2019"),
+        _builtin('Patidar2020Parser', 'patidar_2020_parser', "Patidar 2020"),
+        _builtin('Shen2015Parser', 'shen_2015_parser', "Shen et al 2015 "),
+        _builtin('Shen2017Parser', 'shen_2017_parser', "Shen et al 2017"),
+        _builtin('Schick2019Parser', 'schick_2019_parser', "Schick et al 2019"),
+        _builtin('Srivas2016Parser', 'srivas_2016_parser', "Srivas et al 2016"),
+        _builtin('Steckel2012Parser', 'steckel_2012_parser', "Steckel et al 2012"),
+        _builtin('Sullivan2012Parser', 'sullivan_2012_parser', "Sullivan et al 2012"),
+        _builtin('Sun2019Parser', 'sun_2019_parser', "Sun et al 2019"),
+        _builtin('Toyoshima2008Parser', 'toyoshima_2008_parser', "Toyoshima et al 2008"),
+        _builtin('Turner2008Parser', 'turner_2008_parser', "Turner et al 2008"),
+        _builtin('Vizeacoumar2013Parser', 'vizeacoumar_2013_parser', "Vizeacoumar et al 2013"),
+        _builtin('Wang2016Parser', 'wang_2016_parser', "Wang et al 2016"),
+        _builtin('Wang2017Parser', 'wang_2017_parser', "Wang et al 2017"),
+        _builtin('Wang2019Parser', 'wang_2019_parser', "Wang et al 2019"),
+        _builtin('Williamson2016Parser', 'williamson_2016_parser', "Williamson et al 2016"),
+        _builtin('ManualEntry1', 'manual_entry_1', "Manually entered single-SLI studies (part zero)"),
+        _builtin('ManualEntry2', 'manual_entry_2', "Manually entered single-SLI studies (part one)"),
+        _builtin('ManualEntry3', 'manual_entry_3', "Manually entered (3)"),
+    ]
+    _default = None
+
+    def __init__(self, specs=BUILTIN_PARSERS, use_entry_points=True):
+        self._specs = {}
+        for spec in specs:
+            # copies, so that loading a parser in one registry does not change the specs of another one
+            self.register(spec.copy())
+        self._use_entry_points = use_entry_points
+
+    def register(self, spec):
+        if spec.name in self._specs and self._specs[spec.name].module != spec.module:
+            raise ValueError("Parser %s is already registered by %s" % (spec.name, self._specs[spec.name].module))
+        self._specs[spec.name] = spec
+
+    def unregister(self, name):
+        if name not in self._specs:
+            raise ValueError("Parser %s is not registered" % name)
+        del self._specs[name]
+
+    def _load_entry_points(self):
+        if not self._use_entry_points:
+            return
+        self._use_entry_points = False
+        from importlib import metadata
+        try:
+            entry_points = metadata.entry_points(group=ParserRegistry.ENTRY_POINT_GROUP)
+        except TypeError:
+            # Python < 3.10
+            entry_points = metadata.entry_points().get(ParserRegistry.ENTRY_POINT_GROUP, [])
+        for ep in entry_points:
+            module, _, name = ep.value.partition(':')
+            # the label, pmid and files of an external parser are taken from the class once it is loaded
+            self.register(ParserSpec(name or ep.name, module.strip(), label=ep.name))
+
+    def get_names(self):
+        self._load_entry_points()
+        return list(self._specs.keys())
+
+    def get_spec(self, name):
+        self._load_entry_points()
+        if name not in self._specs:
+            raise ValueError("Unknown parser %s (known parsers: %s)" % (name, ", ".join(self._specs.keys())))
+        return self._specs[name]
+
+    def get_specs(self, names=None):
+        """
+        Returns the ParserSpecs of the parsers in names (class names or PubMed ids), or of all parsers
+        """
+        if names is None:
+            return [self._specs[name] for name in self.get_names()]
+        specs = []
+        for name in names:
+            by_pmid = [s for s in self._specs.values() if s.pmid == name]
+            specs.extend(by_pmid if len(by_pmid) > 0 else [self.get_spec(name)])
+        return specs
+
+    def get_parsers(self, names=None):
+        """
+        Returns (label, parser class) pairs of the selected parsers that can be passed to the ParserRunner
+        """
+        return [(spec.label, spec.load()) for spec in self.get_specs(names)]
+
+    @staticmethod
+    def get_default():
+        if ParserRegistry._default is None:
+            ParserRegistry._default = ParserRegistry()
+        return ParserRegistry._default
+
+
+def register_parser(label, pmid=None, files=()):
+    """
+    Class decorator that adds a parser class to the default registry, e.g.,
+
+        @register_parser("Smith et al 2021", pmid='12345678', files=['data/smith2021.tsv'])
+        class Smith2021Parser(SL_DatasetParser):
+    """
+    def decorator(parser_class):
+        spec = ParserSpec(parser_class.__name__, parser_class.__module__, label, pmid, files, parser_class)
+        ParserRegistry.get_default().register(spec)
+        return parser_class
+    return decorator
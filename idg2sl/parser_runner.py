@@ -0,0 +1,126 @@
+import multiprocessing
+import os
+import time
+import traceback
+from .sl_dataset_parser import SL_DatasetParser
+
+
+class ParserResult:
+    """
+    The output of one dataset parser run by the ParserRunner. sli_list is None if the parser failed, in which
+    case error holds the traceback. seconds is the wall time of the constructor and parse() together, and
+    stats the ResolutionStats of the symbol lookups of the parser (None if it did not resolve any symbols).
+    cached is True if the SLI list was taken from the ParseResultCache.
+    """
+    def __init__(self, label, parser_name, sli_list, seconds, stats=None, error=None, cached=False):
+        self.label = label
+        self.parser_name = parser_name
+        self.sli_list = sli_list
+        self.seconds = seconds
+        self.stats = stats
+        self.error = error
+        self.cached = cached
+
+    def is_ok(self):
+        return self.error is None
+
+
+def _run_parser(label, parser_class, cache=None):
+    """
+    Run one parser in a worker process. This is a module-level function so that it can be pickled.
+    """
+    start = time.perf_counter()
+    cached = False
+    try:
+        parser = parser_class()
+        if cache is None:
+            sli_list = parser.parse()
+        else:
+            sli_list, cached = cache.get(parser, SL_DatasetParser.get_hgnc_index())
+        error = None
+    except Exception:
+        sli_list = None
+        error = traceback.format_exc()
+    seconds = time.perf_counter() - start
+    try:
+        stats = SL_DatasetParser.get_resolution_cache().get_stats().get(parser_class.__name__)
+    except Exception:
+        # the HGNC index could not be loaded; the parser failed with the same error
+        stats = None
+    return ParserResult(label, parser_class.__name__, sli_list, seconds, stats, error, cached)
+
+
+def _run_parser_task(task):
+    return _run_parser(*task)
+
+
+def _init_worker(hgnc):
+    """
+    Use the HGNC index of the process that started the pool in a worker process
+    """
+    SL_DatasetParser.set_hgnc_index(hgnc)
+
+
+class ParserRunner:
+    """
+    Run a list of dataset parsers concurrently in a process pool. parsers is a list of (label, parser class)
+    pairs, and each class must be constructible without arguments.
+    The HGNC index is loaded once before the pool is started and is passed to the worker processes by the
+    initializer of the pool, so that the workers also use an index injected with SL_DatasetParser.set_hgnc_index.
+    With the 'fork' start method, the workers inherit the index copy-on-write, together with the symbol
+    resolutions that the parent process has memoized so far; otherwise the index is pickled (an HgncParser is
+    then loaded again from its file, see HgncParser.__reduce__) and the workers start with an empty resolution
+    cache. By default, the start method of the platform is used.
+    The results are returned in the order of parsers, regardless of the order in which the parsers finish.
+    """
+    def __init__(self, parsers, processes=None, start_method=None, cache=None):
+        """
+        processes is the number of worker processes (by default, the number of CPUs). With processes=1, the
+        parsers are run one after another in the current process.
+        If a ParseResultCache is passed as cache, parsers whose inputs and code did not change are not run again.
+        """
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if processes < 1:
+            raise ValueError("processes must be positive but was %d" % processes)
+        self.parsers = list(parsers)
+        self.processes = min(processes, max(1, len(self.parsers)))
+        self.start_method = start_method
+        self.cache = cache
+
+    def iter_results(self):
+        """
+        Yields one ParserResult per parser, in the order of parsers, as soon as the result is available. The
+        caller can write and discard each result before the next one arrives, so that the results of all
+        parsers are never held in memory together.
+        """
+        hgnc = SL_DatasetParser.get_hgnc_index()
+        if self.cache is not None and hasattr(hgnc, 'get_version'):
+            hgnc.get_version()  # hash the HGNC file once, before the workers are forked
+        tasks = [(label, parser_class, self.cache) for label, parser_class in self.parsers]
+        if self.processes == 1:
+            for task in tasks:
+                yield _run_parser(*task)
+        else:
+            context = multiprocessing.get_context(self.start_method)
+            with context.Pool(self.processes, initializer=_init_worker, initargs=(hgnc,)) as pool:
+                for result in pool.imap(_run_parser_task, tasks):
+                    yield result
+
+    def run(self, raise_on_error=True):
+        """
+        Returns a list with one ParserResult per parser. If raise_on_error is True, a ValueError that lists the
+        failed parsers is raised after all parsers have finished.
+        """
+        results = list(self.iter_results())
+        if raise_on_error:
+            ParserRunner.raise_if_failed(results)
+        return results
+
+    @staticmethod
+    def raise_if_failed(results):
+        failed = [r for r in results if not r.is_ok()]
+        if len(failed) == 0:
+            return
+        messages = ["%s (%s):\n%s" % (r.label, r.parser_name, r.error) for r in failed]
+        raise ValueError("%d of %d parsers failed\n%s" % (len(failed), len(results), "\n".join(messages)))
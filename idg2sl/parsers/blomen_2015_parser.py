@@ -1,9 +1,8 @@
-from collections import defaultdict
 from idg2sl import SyntheticLethalInteraction
 from idg2sl.sl_dataset_parser import SL_DatasetParser
-from idg2sl.gene_pair import GenePair
+from idg2sl.gene_pair import GenePairGroups
 from .sl_constants import SlConstants
-import csv
+from idg2sl.table_reader import TableReader
 
 
 class Blomen2015Parser(SL_DatasetParser):
@@ -29,40 +28,35 @@ class Blomen2015Parser(SL_DatasetParser):
         perturbation = SlConstants.KNOCKOUT
         cellosuarus = SlConstants.HAP1_CELLOSAURUS
         assay = 'proportions.of.sense.and.antisense.insertions'
-        sli_dict = defaultdict(list)
+        sli_dict = GenePairGroups()
         # GENE	SUMMARY	PUBMED ID	INTERACTING QUERY GENE
-        with open(self.fname) as csvfile:
-            csvreader = csv.DictReader(csvfile, delimiter='\t')
-            for row in csvreader:
-                geneA = self.get_current_symbol(row['GENE'])
-                if geneA in self.entrez_dict:
-                    geneA_id = "NCBIGene:{}".format(self.entrez_dict.get(geneA))
+        for geneA, geneBlist in TableReader(self.fname, ['GENE', 'INTERACTING QUERY GENE']):
+            geneA = self.get_current_symbol(geneA)
+            if geneA in self.entrez_dict:
+                geneA_id = "NCBIGene:{}".format(self.entrez_dict.get(geneA))
+            else:
+                raise ValueError("[ERROR] We could not find a gene id for " + geneA)
+            for geneB in geneBlist.split(';'):
+                geneB = geneB.strip()
+                geneB = self.get_current_symbol(geneB)
+                if geneB in self.entrez_dict:
+                    geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneB))
                 else:
-                    raise ValueError("[ERROR] We could not find a gene id for " + geneA)
-                geneBlist = row['INTERACTING QUERY GENE']
-                for geneB in geneBlist.split(';'):
-                    geneB = geneB.strip()
-                    geneB = self.get_current_symbol(geneB)
-                    if geneB in self.entrez_dict:
-                        geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneB))
-                    else:
-                        raise ValueError("Could not get NCBI id for gene \"%s\" in Blomen 2015" % geneB)
-                    sli = SyntheticLethalInteraction(gene_A_symbol=geneA,
-                                                     gene_A_id=geneA_id,
-                                                     gene_B_symbol=geneB,
-                                                     gene_B_id=geneB_id,
-                                                     gene_A_pert=perturbation,
-                                                     gene_B_pert=perturbation,
-                                                     effect_type=SlConstants.N_A,
-                                                     effect_size=0,
-                                                     cell_line=SlConstants.HAP1_CELL,
-                                                     cellosaurus_id=cellosuarus,
-                                                     cancer_type=SlConstants.N_A,
-                                                     ncit_id=SlConstants.N_A,
-                                                     assay=assay,
-                                                     pmid=self.pmid,
-                                                     SL=True)
-                    gene_pair = GenePair(geneA, geneB)
-                    sli_dict[gene_pair].append(sli)
-                    sli_list = self._mark_maximum_entries(sli_dict)
-        return sli_list
+                    raise ValueError("Could not get NCBI id for gene \"%s\" in Blomen 2015" % geneB)
+                sli = SyntheticLethalInteraction(gene_A_symbol=geneA,
+                                                 gene_A_id=geneA_id,
+                                                 gene_B_symbol=geneB,
+                                                 gene_B_id=geneB_id,
+                                                 gene_A_pert=perturbation,
+                                                 gene_B_pert=perturbation,
+                                                 effect_type=SlConstants.N_A,
+                                                 effect_size=0,
+                                                 cell_line=SlConstants.HAP1_CELL,
+                                                 cellosaurus_id=cellosuarus,
+                                                 cancer_type=SlConstants.N_A,
+                                                 ncit_id=SlConstants.N_A,
+                                                 assay=assay,
+                                                 pmid=self.pmid,
+                                                 SL=True)
+                sli_dict.add(sli)
+        return self._mark_maximum_entries(sli_dict)
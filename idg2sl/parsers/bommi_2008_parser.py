@@ -1,9 +1,8 @@
-from collections import defaultdict
 from idg2sl import SyntheticLethalInteraction
 from idg2sl.sl_dataset_parser import SL_DatasetParser
 from .sl_constants import SlConstants
-from idg2sl.gene_pair import GenePair
-import csv
+from idg2sl.gene_pair import GenePairGroups
+from idg2sl.table_reader import TableReader
 
 
 class Bommi2008Parser(SL_DatasetParser):
@@ -41,54 +40,48 @@ class Bommi2008Parser(SL_DatasetParser):
         gene2_perturbation = SlConstants.SH_RNA
         effect_type = 'differential_viability'
         # The following keeps track of the current largest effect size SLI for any given gene A/gene B pair
-        sli_dict = defaultdict(list)
+        sli_dict = GenePairGroups()
         # The following list includes symbols that are not current but either could
         # not be matched or match to multiple possible candidates
         unclear_gene_symbols = {'PITSLRE', 'TAK1', 'PKD3', 'CAMLCK', 'MAPAPK3', 'CK1E', 'CK2A2', 'PDGRFB', 'ZC1/HGK'}
         # gene	differential	cell	table
-        with open(self.fname) as csvfile:
-            csvreader = csv.DictReader(csvfile, delimiter='\t')
-            for row in csvreader:
-                if len(row) < 4:
-                    raise ValueError("Only got %d fields but was expecting 4" % len(row))
-                genesy = row['gene'].upper()
-                geneB_sym = self.get_current_symbol(genesy)
-                if geneB_sym == "IRR" or geneB_sym == "HER4":
-                    continue
-                if geneB_sym in unclear_gene_symbols:
-                    continue  # Symbol could be either CDK11A or CDK11B
-                if geneB_sym in self.entrez_dict:
-                    geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneB_sym))
-                else:
-                    raise ValueError("Could not find id for %s in Bommi 2008" % geneB_sym)
-                effect = float(row['differential'])
-                cell = row['cell']
-                if cell == 'RCC4':
-                    cell_line = SlConstants.RCC4_CELL
-                    cellosaurus = SlConstants.RCC4_CELLOSAURUS
-                elif cell == '786-0':
-                    cell_line = SlConstants.CELL_786O
-                    cellosaurus = SlConstants.CELL_786O_CELLOSAURUS
-                else:
-                    raise ValueError("Did not recognize cell type '%s'" % cell)
-                assay_string = SlConstants.DIFFERENTIAL_VIABILITY_ASSAY
-                SL = True  # All data in this set is True
-                sli = SyntheticLethalInteraction(gene_A_symbol=vhl_symbol,
-                                                 gene_A_id=vhl_id,
-                                                 gene_B_symbol=geneB_sym,
-                                                 gene_B_id=geneB_id,
-                                                 gene_A_pert=vhl_perturbation,
-                                                 gene_B_pert=gene2_perturbation,
-                                                 effect_type=effect_type,
-                                                 effect_size=effect,
-                                                 cell_line=cell_line,
-                                                 cellosaurus_id=cellosaurus,
-                                                 cancer_type=SlConstants.CLEAR_CELL_RENAL_CELL_CARCINOMA,
-                                                 ncit_id=SlConstants.CLEAR_CELL_RENAL_CELL_CARCINOMA_NCIT,
-                                                 assay=assay_string,
-                                                 pmid=self.pmid,
-                                                 SL=SL)
-                gene_pair = GenePair(vhl_symbol, geneB_sym)
-                sli_dict[gene_pair].append(sli)
+        for genesy, effect, cell in TableReader(self.fname, ['gene', 'differential', 'cell']):
+            genesy = genesy.upper()
+            geneB_sym = self.get_current_symbol(genesy)
+            if geneB_sym == "IRR" or geneB_sym == "HER4":
+                continue
+            if geneB_sym in unclear_gene_symbols:
+                continue  # Symbol could be either CDK11A or CDK11B
+            if geneB_sym in self.entrez_dict:
+                geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneB_sym))
+            else:
+                raise ValueError("Could not find id for %s in Bommi 2008" % geneB_sym)
+            effect = float(effect)
+            if cell == 'RCC4':
+                cell_line = SlConstants.RCC4_CELL
+                cellosaurus = SlConstants.RCC4_CELLOSAURUS
+            elif cell == '786-0':
+                cell_line = SlConstants.CELL_786O
+                cellosaurus = SlConstants.CELL_786O_CELLOSAURUS
+            else:
+                raise ValueError("Did not recognize cell type '%s'" % cell)
+            assay_string = SlConstants.DIFFERENTIAL_VIABILITY_ASSAY
+            SL = True  # All data in this set is True
+            sli = SyntheticLethalInteraction(gene_A_symbol=vhl_symbol,
+                                             gene_A_id=vhl_id,
+                                             gene_B_symbol=geneB_sym,
+                                             gene_B_id=geneB_id,
+                                             gene_A_pert=vhl_perturbation,
+                                             gene_B_pert=gene2_perturbation,
+                                             effect_type=effect_type,
+                                             effect_size=effect,
+                                             cell_line=cell_line,
+                                             cellosaurus_id=cellosaurus,
+                                             cancer_type=SlConstants.CLEAR_CELL_RENAL_CELL_CARCINOMA,
+                                             ncit_id=SlConstants.CLEAR_CELL_RENAL_CELL_CARCINOMA_NCIT,
+                                             assay=assay_string,
+                                             pmid=self.pmid,
+                                             SL=SL)
+            sli_dict.add(sli)
         sli_list = self._mark_maximum_entries(sli_dict)
         return sli_list
@@ -1,9 +1,8 @@
-from collections import defaultdict
 from idg2sl import SyntheticLethalInteraction
 from idg2sl.sl_dataset_parser import SL_DatasetParser
 from .sl_constants import SlConstants
-from idg2sl.gene_pair import GenePair
-import csv
+from idg2sl.gene_pair import GenePairGroups
+from idg2sl.table_reader import TableReader
 
 
 class Brough2018Parser(SL_DatasetParser):
@@ -29,13 +28,15 @@ class Brough2018Parser(SL_DatasetParser):
     def __init__(self, fname=None):
         pmid = '29915391'
         super().__init__(fname=fname, pmid=pmid)
-        self.sli_dict = defaultdict(list)
         # old symbols that are assigned to multiple genes
         # Pseudogenes: PI4KAP2, BTF3P10, GLRA4, RPL21P44
         self.unclear_gene_symbols = {'SARS', 'PI4KAP2', 'BTF3P10', 'DLGAP1-AS1', 'GLRA4', 'URGCP-MRPS24', 'PCDHA3',
                                      'RPL21P44', 'RPL21P28', 'ZNF733P'}
 
-    def parse_suppl9(self):
+    def get_input_files(self):
+        return ['data/brough_2012_suppl9.tsv', 'data/brough_2012_suppl10.tsv', 'data/brough_2012_suppl11.tsv']
+
+    def parse_suppl9(self, sli_dict):
         fname = 'data/brough_2012_suppl9.tsv'
         rb1 = 'RB1'
         rb1_id = SlConstants.RB1_GENE_ID
@@ -47,38 +48,34 @@ class Brough2018Parser(SL_DatasetParser):
         cancer = SlConstants.N_A
         ncit = SlConstants.N_A
 
-        with open(fname) as csvfile:
-            csvreader = csv.DictReader(csvfile, delimiter='\t')
-            for row in csvreader:
-                # print(row)
-                geneBsym = self.get_current_symbol(row['symbol'])
-                if geneBsym in self.entrez_dict:
-                    geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneBsym))
-                elif geneBsym in self.unclear_gene_symbols:
-                    continue
-                else:
-                    raise ValueError("Could not find iid for %s in Brough 2018 2008 " % geneBsym)
-                penetrance = int(row['Penetrance.%'])
-                if penetrance >= 80:
-                    sli = SyntheticLethalInteraction(gene_A_symbol=rb1,
-                                                     gene_A_id=rb1_id,
-                                                     gene_B_symbol=geneBsym,
-                                                     gene_B_id=geneB_id,
-                                                     gene_A_pert=rb1_perturbation,
-                                                     gene_B_pert=gene2_perturbation,
-                                                     effect_type=SlConstants.PENETRANCE_ASSAY,
-                                                     effect_size=penetrance,
-                                                     cell_line=cell_line,
-                                                     cellosaurus_id=cellosaurus,
-                                                     cancer_type=cancer,
-                                                     ncit_id=ncit,
-                                                     assay=assay_string,
-                                                     pmid=self.pmid,
-                                                     SL=True)
-                    gene_pair = GenePair(rb1, geneBsym)
-                    self.sli_dict[gene_pair].append(sli)
+        for geneBsym, penetrance in TableReader(fname, ['symbol', 'Penetrance.%']):
+            geneBsym = self.get_current_symbol(geneBsym)
+            if geneBsym in self.entrez_dict:
+                geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneBsym))
+            elif geneBsym in self.unclear_gene_symbols:
+                continue
+            else:
+                raise ValueError("Could not find iid for %s in Brough 2018 2008 " % geneBsym)
+            penetrance = int(penetrance)
+            if penetrance >= 80:
+                sli = SyntheticLethalInteraction(gene_A_symbol=rb1,
+                                                 gene_A_id=rb1_id,
+                                                 gene_B_symbol=geneBsym,
+                                                 gene_B_id=geneB_id,
+                                                 gene_A_pert=rb1_perturbation,
+                                                 gene_B_pert=gene2_perturbation,
+                                                 effect_type=SlConstants.PENETRANCE_ASSAY,
+                                                 effect_size=penetrance,
+                                                 cell_line=cell_line,
+                                                 cellosaurus_id=cellosaurus,
+                                                 cancer_type=cancer,
+                                                 ncit_id=ncit,
+                                                 assay=assay_string,
+                                                 pmid=self.pmid,
+                                                 SL=True)
+                sli_dict.add(sli)
 
-    def parse_suppl10_11(self, fname):
+    def parse_suppl10_11(self, sli_dict, fname):
         rb1 = 'RB1'
         rb1_id = SlConstants.RB1_GENE_ID
         rb1_perturbation = SlConstants.LOF_MUTATION
@@ -90,43 +87,40 @@ class Brough2018Parser(SL_DatasetParser):
         cancer = SlConstants.N_A
         ncit = SlConstants.N_A
 
-        with open(fname) as csvfile:
-            csvreader = csv.DictReader(csvfile, delimiter='\t')
-            for row in csvreader:
-                # print(row)
-                geneBsym = self.get_current_symbol(row['target'])
-                if ',' in geneBsym:
-                    continue # We cannot assign an effect unambiguously to one of the genes
-                    # some of the entries are like  PMS2,PMS2CL
-                if geneBsym in self.entrez_dict:
-                    geneB_id = self.get_ncbigene_curie(geneBsym)
-                elif geneBsym in self.unclear_gene_symbols:
-                    continue
-                else:
-                    raise ValueError("Could not find id for %s in Brough 2018 2008 " % geneBsym)
-                penetrance = int(row['Penetrance.(%)'])
-                if penetrance >= 80:
-                    sli = SyntheticLethalInteraction(gene_A_symbol=rb1,
-                                                     gene_A_id=rb1_id,
-                                                     gene_B_symbol=geneBsym,
-                                                     gene_B_id=geneB_id,
-                                                     gene_A_pert=rb1_perturbation,
-                                                     gene_B_pert=gene2_perturbation,
-                                                     effect_type=effect_type,
-                                                     effect_size=penetrance,
-                                                     cell_line=cell_line,
-                                                     cellosaurus_id=cellosaurus,
-                                                     cancer_type=cancer,
-                                                     ncit_id=ncit,
-                                                     assay=assay_string,
-                                                     pmid=self.pmid,
-                                                     SL=True)
-                    gene_pair = GenePair(rb1, geneBsym)
-                    self.sli_dict[gene_pair].append(sli)
+        for geneBsym, penetrance in TableReader(fname, ['target', 'Penetrance.(%)']):
+            geneBsym = self.get_current_symbol(geneBsym)
+            if ',' in geneBsym:
+                continue # We cannot assign an effect unambiguously to one of the genes
+                # some of the entries are like  PMS2,PMS2CL
+            if geneBsym in self.entrez_dict:
+                geneB_id = self.get_ncbigene_curie(geneBsym)
+            elif geneBsym in self.unclear_gene_symbols:
+                continue
+            else:
+                raise ValueError("Could not find id for %s in Brough 2018 2008 " % geneBsym)
+            penetrance = int(penetrance)
+            if penetrance >= 80:
+                sli = SyntheticLethalInteraction(gene_A_symbol=rb1,
+                                                 gene_A_id=rb1_id,
+                                                 gene_B_symbol=geneBsym,
+                                                 gene_B_id=geneB_id,
+                                                 gene_A_pert=rb1_perturbation,
+                                                 gene_B_pert=gene2_perturbation,
+                                                 effect_type=effect_type,
+                                                 effect_size=penetrance,
+                                                 cell_line=cell_line,
+                                                 cellosaurus_id=cellosaurus,
+                                                 cancer_type=cancer,
+                                                 ncit_id=ncit,
+                                                 assay=assay_string,
+                                                 pmid=self.pmid,
+                                                 SL=True)
+                sli_dict.add(sli)
 
     def parse(self):
-        self.parse_suppl9()
-        self.parse_suppl10_11(fname='data/brough_2012_suppl10.tsv')
-        self.parse_suppl10_11(fname='data/brough_2012_suppl11.tsv')
-        sli_list = self._mark_maximum_entries(self.sli_dict)
+        sli_dict = GenePairGroups()
+        self.parse_suppl9(sli_dict)
+        self.parse_suppl10_11(sli_dict, fname='data/brough_2012_suppl10.tsv')
+        self.parse_suppl10_11(sli_dict, fname='data/brough_2012_suppl11.tsv')
+        sli_list = self._mark_maximum_entries(sli_dict)
         return sli_list
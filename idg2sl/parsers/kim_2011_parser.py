@@ -1,7 +1,7 @@
 from idg2sl import SyntheticLethalInteraction
-import csv
 from idg2sl.sl_dataset_parser import SL_DatasetParser
 from .sl_constants import SlConstants
+from idg2sl.table_reader import TableReader
 
 
 
@@ -35,32 +35,28 @@ class Kim2011Parser(SL_DatasetParser):
         pmid = "21430111"
         super().__init__(fname=fname, pmid=pmid)
 
-    def parse(self):
-        sli_list = []
+    def parse_iter(self):
         pik3ca = 'PIK3CA'
         pik3ca_id = self.get_ncbigene_curie(pik3ca)
-        with open(self.fname) as csvfile:
-            csvreader = csv.DictReader(csvfile, delimiter='\t')
-            for row in csvreader:
-                geneBsym = self.get_current_symbol(row['Gene symbol'])
-                geneBid = self.get_ncbigene_curie(geneBsym)
-                px866 = float(row['PX-866'])
-                nvpbez235 = float(row['NVP-BEZ235'])
-                mean_fc = 0.5 * (px866+nvpbez235)
-                sli = SyntheticLethalInteraction(gene_A_symbol=pik3ca,
-                                                 gene_A_id=pik3ca_id,
-                                                 gene_B_symbol=geneBsym,
-                                                 gene_B_id=geneBid,
-                                                 gene_A_pert=SlConstants.PHARMACEUTICAL,
-                                                 gene_B_pert=SlConstants.SI_RNA,
-                                                 effect_type=SlConstants.FOLD_CHANGE,
-                                                 effect_size=mean_fc,
-                                                 cell_line=SlConstants.U87WT_CELL,
-                                                 cellosaurus_id=SlConstants.U87WT_CELLOSAURUS,
-                                                 cancer_type=SlConstants.N_A,
-                                                 ncit_id=SlConstants.N_A,
-                                                 assay=SlConstants.GROWTH_INHIBITION_ASSAY,
-                                                 pmid=self.pmid,
-                                                 SL=True)
-                sli_list.append(sli)
-        return sli_list
\ No newline at end of file
+        for geneBsym, px866, nvpbez235 in TableReader(self.fname, ['Gene symbol', 'PX-866', 'NVP-BEZ235']):
+            geneBsym = self.get_current_symbol(geneBsym)
+            geneBid = self.get_ncbigene_curie(geneBsym)
+            px866 = float(px866)
+            nvpbez235 = float(nvpbez235)
+            mean_fc = 0.5 * (px866+nvpbez235)
+            sli = SyntheticLethalInteraction(gene_A_symbol=pik3ca,
+                                             gene_A_id=pik3ca_id,
+                                             gene_B_symbol=geneBsym,
+                                             gene_B_id=geneBid,
+                                             gene_A_pert=SlConstants.PHARMACEUTICAL,
+                                             gene_B_pert=SlConstants.SI_RNA,
+                                             effect_type=SlConstants.FOLD_CHANGE,
+                                             effect_size=mean_fc,
+                                             cell_line=SlConstants.U87WT_CELL,
+                                             cellosaurus_id=SlConstants.U87WT_CELLOSAURUS,
+                                             cancer_type=SlConstants.N_A,
+                                             ncit_id=SlConstants.N_A,
+                                             assay=SlConstants.GROWTH_INHIBITION_ASSAY,
+                                             pmid=self.pmid,
+                                             SL=True)
+            yield sli
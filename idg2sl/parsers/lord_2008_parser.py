@@ -2,7 +2,7 @@ from collections import defaultdict
 from idg2sl import SyntheticLethalInteraction
 from idg2sl.sl_dataset_parser import SL_DatasetParser
 from .sl_constants import SlConstants
-import csv
+from idg2sl.table_reader import TableReader
 
 
 class Lord2008Parser(SL_DatasetParser):
@@ -48,22 +48,17 @@ class Lord2008Parser(SL_DatasetParser):
         # The following list includes symbols that are not current but either could
         # not be matched or match to multiple possible candidates (PMS2L4 is a pseudogene)
         unclear_gene_symbols = {'CDC2', 'NBS1', 'TGIF', 'PMS2L4'}
-        with open(self.fname) as csvfile:
-            csvreader = csv.DictReader(csvfile, delimiter='\t')
-            for row in csvreader:
-                if len(row) != 3:
-                    raise ValueError("Malformed line with length %d instead of 3: %s" % (len(row), row))
-                geneBsym = row['gene']
-                if geneBsym in unclear_gene_symbols:
-                    continue
-                geneBsym = self.get_current_symbol(geneBsym)
-                parp_sens = float(row['parp_sens'])
-                if geneBsym == 'BRCA1':
-                    continue
-                elif geneBsym == 'GFP-22' or geneBsym == 'SCRAM':
-                    continue  # a control siRNA
-                # ignore the third field
-                parpdict[geneBsym].append(parp_sens)
+        for geneBsym, parp_sens in TableReader(self.fname, ['gene', 'parp_sens'], n_fields=3):
+            if geneBsym in unclear_gene_symbols:
+                continue
+            geneBsym = self.get_current_symbol(geneBsym)
+            parp_sens = float(parp_sens)
+            if geneBsym == 'BRCA1':
+                continue
+            elif geneBsym == 'GFP-22' or geneBsym == 'SCRAM':
+                continue  # a control siRNA
+            # ignore the third field
+            parpdict[geneBsym].append(parp_sens)
         sli_list = []
         for geneBsym, parp_sens_list in parpdict.items():
             if geneBsym in self.entrez_dict:
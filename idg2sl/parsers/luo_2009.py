@@ -1,9 +1,8 @@
-from collections import defaultdict
 from idg2sl import SyntheticLethalInteraction
 from idg2sl.sl_dataset_parser import SL_DatasetParser
 from .sl_constants import SlConstants
-from idg2sl.gene_pair import GenePair
-import csv
+from idg2sl.gene_pair import GenePairGroups
+from idg2sl.table_reader import TableReader
 
 
 class Luo2009Parser(SL_DatasetParser):
@@ -46,47 +45,42 @@ class Luo2009Parser(SL_DatasetParser):
 
         # The following keeps track of the current largest effect size SLI for any given gene A/gene B pair
         # Symbol	Accession	v2SH	Sequence	Mean.DLD1	SD.DLD1	Mean.HCT116	SD.HCT116	
-        sli_dict = defaultdict(list)
-        with open(self.fname) as csvfile:
-            csvreader = csv.DictReader(csvfile, delimiter='\t')
-            for row in csvreader:
-                if len(row) < 8:
-                    raise ValueError("Bad line in Luo2009 with less than 8 fields")
-                geneB_sym = self.get_current_symbol(row['Symbol'])
-                if geneB_sym == 'CXORF40A':
-                    geneB_sym = 'EOLA1'
-                if geneB_sym in self.entrez_dict:
-                    geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneB_sym))
-                elif geneB_sym == 'FLJ34747':
-                    # This is a LINC, plus the symbol is old
-                    geneB_sym = 'LINC00547'
-                    geneB_id = 'NCBIGene:400121'
-                elif geneB_sym == 'LOC283194':
-                    geneB_id = 'NCBIGene:283194' # an ncRNA
-                elif geneB_sym == 'LOC285556':
-                    geneB_id = 'NCBIGene:285556'
-                elif geneB_sym == 'LOC149654' or geneB_sym == 'LOC730000':
-                    continue  # Could not find these in NCBI Gene or HCNG
-                else:
-                    raise ValueError("Could not get NCBI id for gene %s in Luo2009" % geneB_sym)
-                stddev = float(row['SD.DLD1'])  # float(fields[5])
-                SL = True  # All data in this set is True
-                sli = SyntheticLethalInteraction(gene_A_symbol=kras_symbol,
-                                                 gene_A_id=kras_id,
-                                                 gene_B_symbol=geneB_sym,
-                                                 gene_B_id=geneB_id,
-                                                 gene_A_pert=kras_perturbation,
-                                                 gene_B_pert=gene2_perturbation,
-                                                 effect_type=effect_type,
-                                                 effect_size=stddev,
-                                                 cell_line=cell_line,
-                                                 cellosaurus_id=cellosaurus,
-                                                 cancer_type=cancer,
-                                                 ncit_id=ncit,
-                                                 assay=assay_string,
-                                                 pmid=self.pmid,
-                                                 SL=SL)
-                gene_pair = GenePair(kras_symbol, geneB_sym)
-                sli_dict[gene_pair].append(sli)
+        sli_dict = GenePairGroups()
+        for geneB_sym, stddev in TableReader(self.fname, ['Symbol', 'SD.DLD1']):
+            geneB_sym = self.get_current_symbol(geneB_sym)
+            if geneB_sym == 'CXORF40A':
+                geneB_sym = 'EOLA1'
+            if geneB_sym in self.entrez_dict:
+                geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneB_sym))
+            elif geneB_sym == 'FLJ34747':
+                # This is a LINC, plus the symbol is old
+                geneB_sym = 'LINC00547'
+                geneB_id = 'NCBIGene:400121'
+            elif geneB_sym == 'LOC283194':
+                geneB_id = 'NCBIGene:283194' # an ncRNA
+            elif geneB_sym == 'LOC285556':
+                geneB_id = 'NCBIGene:285556'
+            elif geneB_sym == 'LOC149654' or geneB_sym == 'LOC730000':
+                continue  # Could not find these in NCBI Gene or HCNG
+            else:
+                raise ValueError("Could not get NCBI id for gene %s in Luo2009" % geneB_sym)
+            stddev = float(stddev)
+            SL = True  # All data in this set is True
+            sli = SyntheticLethalInteraction(gene_A_symbol=kras_symbol,
+                                             gene_A_id=kras_id,
+                                             gene_B_symbol=geneB_sym,
+                                             gene_B_id=geneB_id,
+                                             gene_A_pert=kras_perturbation,
+                                             gene_B_pert=gene2_perturbation,
+                                             effect_type=effect_type,
+                                             effect_size=stddev,
+                                             cell_line=cell_line,
+                                             cellosaurus_id=cellosaurus,
+                                             cancer_type=cancer,
+                                             ncit_id=ncit,
+                                             assay=assay_string,
+                                             pmid=self.pmid,
+                                             SL=SL)
+            sli_dict.add(sli)
         sli_list = self._mark_maximum_entries(sli_dict)
         return sli_list
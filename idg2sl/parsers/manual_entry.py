@@ -10,9 +10,10 @@ class ManualEntry(SL_DatasetParser):
        """
 
     def parse(self):
-        pass  # Not implemented. We use other methods from the superclass
+        # a copy, so that callers cannot change the entries returned by later calls
+        return list(self.entries)
 
-    def __init__(self, entrez, ensembl, synonym):
+    def __init__(self, entrez=None, ensembl=None, synonym=None):
         super().__init__(fname=None, pmid=None, entrez=entrez, ensembl=ensembl, synonym=synonym)
 
     def create_and_add_sli(self, geneA, geneB, geneApert, geneBpert, assay, pmid,
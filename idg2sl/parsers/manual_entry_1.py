@@ -10,9 +10,9 @@ class ManualEntry1(ManualEntry):
     """
 
     def parse(self):
-        pass  # Not implemented. We use other methods from the superclass
+        return list(self.entries)
 
-    def __init__(self, entrez, ensembl, synonym):
+    def __init__(self, entrez=None, ensembl=None, synonym=None):
         super().__init__(entrez=entrez, ensembl=ensembl, synonym=synonym)
         self.entries = []
         self._add_reid_2016()
@@ -11,7 +11,7 @@ class ManualEntry3(ManualEntry):
        entries
        """
 
-    def __init__(self, entrez, ensembl, synonym):
+    def __init__(self, entrez=None, ensembl=None, synonym=None):
         super().__init__(entrez=entrez, ensembl=ensembl, synonym=synonym)
         self.entries = []
         self._add_li_2020()
@@ -1,10 +1,9 @@
-from collections import defaultdict
 from idg2sl import SyntheticLethalInteraction
 from idg2sl.sl_dataset_parser import SL_DatasetParser
 from .sl_constants import SlConstants
-from idg2sl.gene_pair import GenePair
-import csv
+from idg2sl.gene_pair import GenePairGroups
 import numpy as np
+from idg2sl.table_reader import TableReader
 
 
 class Mohni2014Parser(SL_DatasetParser):
@@ -22,62 +21,52 @@ class Mohni2014Parser(SL_DatasetParser):
     def parse(self):
         geneA = 'ATR'
         geneAid = self.get_ncbigene_curie(geneA)
-        sli_dict = defaultdict(list)
-        with open(self.fname) as csvfile:
-            csvreader = csv.DictReader(csvfile, delimiter='\t')
-            for row in csvreader:
-                geneB = row['Gene Symbol']
-                geneB = self.get_current_symbol(geneB)
-                if geneB == 'ATR':
-                    continue # Self interaction, not a SLI!
-                # A few special cases -- capitalization is not correct in the HGNC file
-                if geneB == 'C10ORF119':
-                    geneB = 'MCMBP'
-                elif geneB == 'C15ORF20':
-                    geneB = 'PIF1'
-                elif geneB == 'CXORF53':
-                    geneB = 'BRCC3'
-                if geneB in self.entrez_dict:
-                    geneBid = self.get_ncbigene_curie(geneB)
-                else:
-                    raise ValueError("Could not find id for gene %s in Mohni 2014" % geneB)
-                mock1 = float(row['Mock.1'])
-                atr1 = float(row['ATRi.1'])
-                mock2 = float(row['Mock.2'])
-                atr2 = float(row['ATRi.2'])
-                mock3 = float(row['Mock.3'])
-                atr3 = float(row['ATRi.3'])
-                mock4 = float(row['Mock.4'])
-                atr4 = float(row['ATRi.4'])
-                d1 = atr1 - mock1
-                d2 = atr2 - mock2
-                d3 = atr3 - mock3
-                d4 = atr4 - mock4
-                # We demand that at least three replicates show SL
-                a = np.array([d1, d2, d3, d4])
-                mn = a.mean()
-                if mn < -2:
-                    SL = True
-                elif mn >= 0:
-                    SL = False
-                else:
-                    raise ValueError("Expecting mean either below -2 or above 0")
-                sli = SyntheticLethalInteraction(gene_A_symbol=geneA,
-                                                 gene_A_id=geneAid,
-                                                 gene_B_symbol=geneB,
-                                                 gene_B_id=geneBid,
-                                                 gene_A_pert=SlConstants.PHARMACEUTICAL,
-                                                 gene_B_pert=SlConstants.SI_RNA,
-                                                 effect_type=SlConstants.ZSCORE,
-                                                 effect_size=mn,
-                                                 cell_line=SlConstants.U2OS_CELL,
-                                                 cellosaurus_id=SlConstants.U2OS_CELLOSAURUS,
-                                                 cancer_type='n/a',
-                                                 ncit_id='n/a',
-                                                 assay=SlConstants.RNA_INTERFERENCE_ASSAY,
-                                                 pmid=self.pmid,
-                                                 SL=SL)
-                gene_pair = GenePair(geneA, geneB)
-                sli_dict[gene_pair].append(sli)
+        sli_dict = GenePairGroups()
+        columns = ['Gene Symbol', 'Mock.1', 'ATRi.1', 'Mock.2', 'ATRi.2', 'Mock.3', 'ATRi.3', 'Mock.4', 'ATRi.4']
+        for geneB, *values in TableReader(self.fname, columns):
+            geneB = self.get_current_symbol(geneB)
+            if geneB == 'ATR':
+                continue # Self interaction, not a SLI!
+            # A few special cases -- capitalization is not correct in the HGNC file
+            if geneB == 'C10ORF119':
+                geneB = 'MCMBP'
+            elif geneB == 'C15ORF20':
+                geneB = 'PIF1'
+            elif geneB == 'CXORF53':
+                geneB = 'BRCC3'
+            if geneB in self.entrez_dict:
+                geneBid = self.get_ncbigene_curie(geneB)
+            else:
+                raise ValueError("Could not find id for gene %s in Mohni 2014" % geneB)
+            mock1, atr1, mock2, atr2, mock3, atr3, mock4, atr4 = map(float, values)
+            d1 = atr1 - mock1
+            d2 = atr2 - mock2
+            d3 = atr3 - mock3
+            d4 = atr4 - mock4
+            # We demand that at least three replicates show SL
+            a = np.array([d1, d2, d3, d4])
+            mn = a.mean()
+            if mn < -2:
+                SL = True
+            elif mn >= 0:
+                SL = False
+            else:
+                raise ValueError("Expecting mean either below -2 or above 0")
+            sli = SyntheticLethalInteraction(gene_A_symbol=geneA,
+                                             gene_A_id=geneAid,
+                                             gene_B_symbol=geneB,
+                                             gene_B_id=geneBid,
+                                             gene_A_pert=SlConstants.PHARMACEUTICAL,
+                                             gene_B_pert=SlConstants.SI_RNA,
+                                             effect_type=SlConstants.ZSCORE,
+                                             effect_size=mn,
+                                             cell_line=SlConstants.U2OS_CELL,
+                                             cellosaurus_id=SlConstants.U2OS_CELLOSAURUS,
+                                             cancer_type='n/a',
+                                             ncit_id='n/a',
+                                             assay=SlConstants.RNA_INTERFERENCE_ASSAY,
+                                             pmid=self.pmid,
+                                             SL=SL)
+            sli_dict.add(sli)
         sli_list = self._mark_maximum_entries(sli_dict)
         return sli_list
@@ -1,8 +1,8 @@
 from idg2sl import SyntheticLethalInteraction
 from idg2sl.sl_dataset_parser import SL_DatasetParser
 from .sl_constants import SlConstants
-from csv import DictReader
 from collections import defaultdict
+from idg2sl.table_reader import TableReader
 
 
 class Najm2018Parser(SL_DatasetParser):
@@ -16,32 +16,27 @@ class Najm2018Parser(SL_DatasetParser):
         pmid = "29251726"
         super().__init__(fname=fname, pmid=pmid)
 
-    def parse(self):
+    def parse_iter(self):
         """
         While POLQ serves as a positive control, FEN1 and APEX2 represent novel B2SL genes and novel potential drug
         targets in BRCA-deficient tumors. The authors do not concretely name the entire list of SLIs, so
         we restrict ourselves to the three that are investigated in detail. FEN1 was also validated for BRCA1
         """
 
-        sli_list = []
         seen_interactions = defaultdict(float)  # There are duplicates. Keep the one with the lowest q value
-        with open(self.fname) as f:
-            r = DictReader(f, delimiter='\t')
-            for row in r:
-                gene1 = row['Gene 1']
-                gene2 = row['Gene 2']
-                synletQ = float(row['SynLet q-value'])
-                if synletQ > 0.05:
-                    continue
-                if gene1 == gene2:
-                    continue
-                genes = sorted([gene1, gene2])
-                gene_key = f"{genes[0]}-{genes[1]}"
-                if gene_key not in seen_interactions:
-                    seen_interactions[gene_key] = synletQ
-                else:
-                    seen_interactions[gene_key] = min(synletQ, seen_interactions.get(gene_key))
-                    continue
+        for gene1, gene2, synletQ in TableReader(self.fname, ['Gene 1', 'Gene 2', 'SynLet q-value']):
+            synletQ = float(synletQ)
+            if synletQ > 0.05:
+                continue
+            if gene1 == gene2:
+                continue
+            genes = sorted([gene1, gene2])
+            gene_key = f"{genes[0]}-{genes[1]}"
+            if gene_key not in seen_interactions:
+                seen_interactions[gene_key] = synletQ
+            else:
+                seen_interactions[gene_key] = min(synletQ, seen_interactions.get(gene_key))
+                continue
         for gene_key, qval in seen_interactions.items():
             genes = gene_key.split("-")
             geneA = genes[0]
@@ -63,5 +58,4 @@ class Najm2018Parser(SL_DatasetParser):
                                              assay=SlConstants.BIG_PAPI,
                                              pmid=self.pmid,
                                              SL=True)
-            sli_list.append(sli)
-        return sli_list
+            yield sli
@@ -1,9 +1,8 @@
-from collections import defaultdict
 from idg2sl import SyntheticLethalInteraction
 from idg2sl.sl_dataset_parser import SL_DatasetParser
 from .sl_constants import SlConstants
-from idg2sl.gene_pair import GenePair
-import csv
+from idg2sl.gene_pair import GenePairGroups
+from idg2sl.table_reader import TableReader
 
 
 class Shen2017Parser(SL_DatasetParser):
@@ -23,60 +22,55 @@ class Shen2017Parser(SL_DatasetParser):
         assay = SlConstants.CRISPR_CAS9_INTERFERENCE_ASSAY
         effect_type = SlConstants.ZSCORE
         # The following keeps track of the current largest effect size SLI for any given gene A/gene B pair
-        sli_dict = defaultdict(list)
-        with open(self.fname) as csvfile:
-            csvreader = csv.DictReader(csvfile, delimiter='\t')
-            for row in csvreader:
-                if len(row) < 7:
-                    raise ValueError("Only got %d fields but was expecting at least 7 tab-separated fields" % len(row))
-                geneA_sym = row['geneA']
-                geneA_sym = self.get_current_symbol(geneA_sym)
-                if geneA_sym in self.entrez_dict:
-                    geneA_id = "NCBIGene:{}".format(self.entrez_dict.get(geneA_sym))
+        sli_dict = GenePairGroups()
+        columns = ['geneA', 'geneB', 'Interaction_type', 'Hit_Cell_Line', '293T_Z', 'HeLa_Z', 'A549_Z']
+        reader = TableReader(self.fname, columns)
+        for geneA_sym, geneB_sym, interaction_type, hit_cell_lines, z_293T, z_HeLa, z_A549 in reader:
+            geneA_sym = self.get_current_symbol(geneA_sym)
+            if geneA_sym in self.entrez_dict:
+                geneA_id = "NCBIGene:{}".format(self.entrez_dict.get(geneA_sym))
+            else:
+                raise ValueError("Could not get gene A in Shen 2017: %s" % geneA_sym)
+            geneB_sym = self.get_current_symbol(geneB_sym)
+            if geneB_sym in self.entrez_dict:
+                geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneB_sym))
+            else:
+                raise ValueError("Could not get gene B in Shen 2017: %s" % geneB_sym)
+            if interaction_type == "Synthetic Lethal":
+                SL = True
+            else:
+                SL = False
+            cell_line_list = hit_cell_lines.split(",")
+            for cell_line in cell_line_list:
+                cell_line = cell_line.strip()
+                if cell_line == "293T":
+                    cellosaurus = SlConstants.CELL_293T_CELLOSAURUS
+                    effect = float(z_293T.replace(",", "."))
+                elif cell_line.upper() == "HELA":
+                    cell_line = SlConstants.HELA_CELL
+                    cellosaurus = SlConstants.HELA_CELLOSAURUS
+                    effect = float(z_HeLa.replace(",", "."))
+                elif cell_line == "A549":
+                    cell_line = SlConstants.A549_CELL
+                    cellosaurus = SlConstants.A549_CELLOSAURUS
+                    effect = float(z_A549.replace(",", "."))
                 else:
-                    raise ValueError("Could not get gene A in Shen 2017: %s" % geneA_sym)
-                geneB_sym = row['geneB']
-                geneB_sym = self.get_current_symbol(geneB_sym)
-                if geneB_sym in self.entrez_dict:
-                    geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneB_sym))
-                else:
-                    raise ValueError("Could not get gene B in Shen 2017: %s" % geneB_sym)
-                if row['Interaction_type'] == "Synthetic Lethal":
-                    SL = True
-                else:
-                    SL = False
-                cell_line_list = row['Hit_Cell_Line'].split(",")
-                for cell_line in cell_line_list:
-                    cell_line = cell_line.strip()
-                    if cell_line == "293T":
-                        cellosaurus = SlConstants.CELL_293T_CELLOSAURUS
-                        effect = float(row['293T_Z'].replace(",", "."))
-                    elif cell_line.upper() == "HELA":
-                        cell_line = SlConstants.HELA_CELL
-                        cellosaurus = SlConstants.HELA_CELLOSAURUS
-                        effect = float(row['HeLa_Z'].replace(",", "."))
-                    elif cell_line == "A549":
-                        cell_line = SlConstants.A549_CELL
-                        cellosaurus = SlConstants.A549_CELLOSAURUS
-                        effect = float(row['A549_Z'].replace(",", "."))
-                    else:
-                        raise ValueError("Could not find cell line (\"%s\") from %s" % (cell_line,row['Hit_Cell_Line']))
-                    sli = SyntheticLethalInteraction(gene_A_symbol=geneA_sym,
-                                                     gene_A_id=geneA_id,
-                                                     gene_B_symbol=geneB_sym,
-                                                     gene_B_id=geneB_id,
-                                                     gene_A_pert=gene1_perturbation,
-                                                     gene_B_pert=gene2_perturbation,
-                                                     effect_type=effect_type,
-                                                     effect_size=effect,
-                                                     cell_line=cell_line,
-                                                     cellosaurus_id=cellosaurus,
-                                                     cancer_type=SlConstants.N_A,
-                                                     ncit_id=SlConstants.N_A,
-                                                     assay=assay,
-                                                     pmid=self.pmid,
-                                                     SL=SL)
-                    gene_pair = GenePair(geneA_sym, geneB_sym)
-                    sli_dict[gene_pair].append(sli)
+                    raise ValueError("Could not find cell line (\"%s\") from %s" % (cell_line,hit_cell_lines))
+                sli = SyntheticLethalInteraction(gene_A_symbol=geneA_sym,
+                                                 gene_A_id=geneA_id,
+                                                 gene_B_symbol=geneB_sym,
+                                                 gene_B_id=geneB_id,
+                                                 gene_A_pert=gene1_perturbation,
+                                                 gene_B_pert=gene2_perturbation,
+                                                 effect_type=effect_type,
+                                                 effect_size=effect,
+                                                 cell_line=cell_line,
+                                                 cellosaurus_id=cellosaurus,
+                                                 cancer_type=SlConstants.N_A,
+                                                 ncit_id=SlConstants.N_A,
+                                                 assay=assay,
+                                                 pmid=self.pmid,
+                                                 SL=SL)
+                sli_dict.add(sli)
         sli_list = self._mark_maximum_entries(sli_dict)
         return sli_list
@@ -1,9 +1,8 @@
-from collections import defaultdict
 from idg2sl import SyntheticLethalInteraction
 from idg2sl.sl_dataset_parser import SL_DatasetParser
 from .sl_constants import SlConstants
-from idg2sl.gene_pair import GenePair
-import csv
+from idg2sl.gene_pair import GenePairGroups
+from idg2sl.table_reader import TableReader
 
 
 class Srivas2016Parser(SL_DatasetParser):
@@ -20,46 +19,39 @@ class Srivas2016Parser(SL_DatasetParser):
         gene2_perturbation = 'natural (is a TSG)'
         assay = "pharmaceutical + siRNA"
         # The following keeps track of the current largest effect size SLI for any given gene A/gene B pair
-        sli_dict = defaultdict(list)
-        with open(self.fname) as csvfile:
-            csvreader = csv.DictReader(csvfile, delimiter='\t')
-            for row in csvreader:
-                if len(row) < 4:
-                    raise ValueError(
-                        "Only got %d fields but was expecting at least 4 tab-separated fields" % len(row))
-                # seperate col containing multiple genes
-                geneA_sym = row['geneAlist'].split(",")
-                geneB_sym = row['geneB']
-                geneB_sym = self.get_current_symbol(geneB_sym)
-                if geneB_sym in self.get_current_symbol(geneB_sym):
-                    geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneB_sym))
+        sli_dict = GenePairGroups()
+        for geneA_list, geneB_sym, effect in TableReader(self.fname, ['geneAlist', 'geneB', 'effect']):
+            # seperate col containing multiple genes
+            geneA_sym = geneA_list.split(",")
+            geneB_sym = self.get_current_symbol(geneB_sym)
+            if geneB_sym in self.get_current_symbol(geneB_sym):
+                geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneB_sym))
+            else:
+                raise ValueError("Could not find id for geneB %s in Srivasa 2016" % geneB_sym)
+            effect = float(effect.replace(",", "."))
+            for i in geneA_sym:
+                i = self.get_current_symbol(i)
+                if i in self.entrez_dict:
+                    geneA_id = "NCBIGene:{}".format(self.entrez_dict.get(i))
                 else:
-                    raise ValueError("Could not find id for geneB %s in Srivasa 2016" % geneB_sym)
-                effect = float(row['effect'].replace(",", "."))
-                for i in geneA_sym:
-                    i = self.get_current_symbol(i)
-                    if i in self.entrez_dict:
-                        geneA_id = "NCBIGene:{}".format(self.entrez_dict.get(i))
-                    else:
-                        raise ValueError("Could not find id for geneA %s in Srivasa 2016" % i)
-                    if geneA_id == geneB_id:
-                        continue  # There are a few self loops in the data, but these are not SLIs, so we skip them
-                    sli = SyntheticLethalInteraction(gene_A_symbol=i,
-                                                     gene_A_id=geneA_id,
-                                                     gene_B_symbol=geneB_sym,
-                                                     gene_B_id=geneB_id,
-                                                     gene_A_pert=gene1_perturbation,
-                                                     gene_B_pert=gene2_perturbation,
-                                                     effect_type=SlConstants.ZSCORE,
-                                                     effect_size=effect,
-                                                     cell_line=SlConstants.HELA_CELL,
-                                                     cellosaurus_id=SlConstants.HELA_CELLOSAURUS,
-                                                     cancer_type=SlConstants.N_A,
-                                                     ncit_id=SlConstants.N_A,
-                                                     assay=assay,
-                                                     pmid=self.pmid,
-                                                     SL=True)
-                    gene_pair = GenePair(i, geneB_sym)
-                    sli_dict[gene_pair].append(sli)
+                    raise ValueError("Could not find id for geneA %s in Srivasa 2016" % i)
+                if geneA_id == geneB_id:
+                    continue  # There are a few self loops in the data, but these are not SLIs, so we skip them
+                sli = SyntheticLethalInteraction(gene_A_symbol=i,
+                                                 gene_A_id=geneA_id,
+                                                 gene_B_symbol=geneB_sym,
+                                                 gene_B_id=geneB_id,
+                                                 gene_A_pert=gene1_perturbation,
+                                                 gene_B_pert=gene2_perturbation,
+                                                 effect_type=SlConstants.ZSCORE,
+                                                 effect_size=effect,
+                                                 cell_line=SlConstants.HELA_CELL,
+                                                 cellosaurus_id=SlConstants.HELA_CELLOSAURUS,
+                                                 cancer_type=SlConstants.N_A,
+                                                 ncit_id=SlConstants.N_A,
+                                                 assay=assay,
+                                                 pmid=self.pmid,
+                                                 SL=True)
+                sli_dict.add(sli)
         sli_list = self._mark_maximum_entries(sli_dict)
         return sli_list
\ No newline at end of file
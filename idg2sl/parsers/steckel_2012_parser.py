@@ -1,9 +1,8 @@
-from collections import defaultdict
 from idg2sl import SyntheticLethalInteraction
 from idg2sl.sl_dataset_parser import SL_DatasetParser
 from .sl_constants import SlConstants
-from idg2sl.gene_pair import GenePair
-import csv
+from idg2sl.gene_pair import GenePairGroups
+from idg2sl.table_reader import TableReader
 
 
 class Steckel2012Parser(SL_DatasetParser):
@@ -44,60 +43,58 @@ class Steckel2012Parser(SL_DatasetParser):
         cellosaurus = SlConstants.HCT_116_CELLOSAURUS
         cancer = SlConstants.COLORECTAL_CARCINOMA
         ncit = SlConstants.COLORECTAL_CARCINOMA_NCIT
-        sli_dict = defaultdict(list)
+        sli_dict = GenePairGroups()
         # Immunoglobulin or multiple mapping old symbols
         # COAS3, CES4, POM121L1, MYCL2 are aliases for a pseudogene
         unclear_gene_symbols = {'MAD', 'IGHG4', 'DKFZp434C1418', 'COAS3', 'HNT', 'CES4', 'SAS', 'HLA-DRB3',
                                 'LOC90557', 'POM121L1', 'MLL2', '37499', 'MYCL2', 'CAMKIINALPHA',
                                 'TGIF', 'PCDHA2', 'PCDHA9'}
         # GeneID	Locus.ID	Accession	HCT-116.Z-score	HKE-3.Z-score	D.Z-score
-        with open(self.fname) as csvfile:
-            csvreader = csv.DictReader(csvfile, delimiter='\t')
-            for row in csvreader:
-                if len(row) != 6:
-                    raise ValueError("Line has %d fields (should have 6): %s" % (len(row), row))
-                geneB_sym = row['GeneID']  # F[0]
-                geneB_sym = self.get_current_symbol(geneB_sym)
-                HCT116_zscore = float(row['HCT-116.Z-score'])  # float(F[3])
-                HKE3_zscore = float(row['HKE-3.Z-score'])  # float(F[4])
-                delta_zscore = float(row['D.Z-score'])
-                if geneB_sym in self.entrez_dict:
-                    geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneB_sym))
-                elif geneB_sym == 'C9ORF96':
-                    geneB_sym = 'STKLD1'
-                elif geneB_sym in unclear_gene_symbols:
-                    continue
-                elif geneB_sym == 'CDR1':
-                    # According to HGNC
-                    # This gene has the locus type 'unknown' because it features in publications but is no longer supported by annotation projects.
-                    # however, the gene is annotated as protein-coding in OMIM and UCSC
-                    geneB_id = 'NCBIGene:1038'
-                elif delta_zscore < 2:
-                    continue  # one of the many negative samples, we can skip it if it cannot be mapped
-                else:
-                    raise ValueError("Could not find id for gene %s in Steckel 2012" % geneB_sym)
-                if geneB_sym == "KRAS":
-                    continue  # This was an internal control!
-                if delta_zscore >= 3.3 and HKE3_zscore < 2:
-                    SL = True
-                else:
-                    SL = False
-                sli = SyntheticLethalInteraction(gene_A_symbol=kras_symbol,
-                                                 gene_A_id=kras_id,
-                                                 gene_B_symbol=geneB_sym,
-                                                 gene_B_id=geneB_id,
-                                                 gene_A_pert=kras_perturbation,
-                                                 gene_B_pert=gene2_perturbation,
-                                                 effect_type=effect_type,
-                                                 effect_size=HCT116_zscore,
-                                                 cell_line=cell_line,
-                                                 cellosaurus_id=cellosaurus,
-                                                 cancer_type=cancer,
-                                                 ncit_id=ncit,
-                                                 assay=assay_string,
-                                                 pmid=self.pmid,
-                                                 SL=SL)
-                gene_pair = GenePair(kras_symbol, geneB_sym)
-                sli_dict[gene_pair].append(sli)
+        zscore_columns = ['HCT-116.Z-score', 'HKE-3.Z-score', 'D.Z-score']
+        reader = TableReader(self.fname, ['GeneID'] + zscore_columns, n_fields=6)
+        table = reader.read_columns(numeric=zscore_columns)
+        # The thresholds of the screen are applied to the whole columns at once; every row is kept (the
+        # negatives too), so they give the SL column rather than a selection of the rows
+        table['SL'] = (table['D.Z-score'] >= 3.3) & (table['HKE-3.Z-score'] < 2)
+        rows = TableReader.select_rows(table, ['GeneID', 'HCT-116.Z-score', 'D.Z-score', 'SL'])
+        columns = {'gene_B_symbol': [], 'gene_B_id': [], 'effect_size': [], 'SL': []}
+        for geneB_sym, HCT116_zscore, delta_zscore, SL in rows:
+            geneB_sym = self.get_current_symbol(geneB_sym)
+            if geneB_sym in self.entrez_dict:
+                geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneB_sym))
+            elif geneB_sym == 'C9ORF96':
+                geneB_sym = 'STKLD1'
+                geneB_id = 'NCBIGene:169436'
+            elif geneB_sym in unclear_gene_symbols:
+                continue
+            elif geneB_sym == 'CDR1':
+                # According to HGNC
+                # This gene has the locus type 'unknown' because it features in publications but is no longer supported by annotation projects.
+                # however, the gene is annotated as protein-coding in OMIM and UCSC
+                geneB_id = 'NCBIGene:1038'
+            elif delta_zscore < 2:
+                continue  # one of the many negative samples, we can skip it if it cannot be mapped
+            else:
+                raise ValueError("Could not find id for gene %s in Steckel 2012" % geneB_sym)
+            if geneB_sym == "KRAS":
+                continue  # This was an internal control!
+            columns['gene_B_symbol'].append(geneB_sym)
+            columns['gene_B_id'].append(geneB_id)
+            columns['effect_size'].append(HCT116_zscore)
+            columns['SL'].append(SL)
+        # the rows are checked and the interactions created as one batch
+        sli_batch = SyntheticLethalInteraction.from_columns(columns,
+                                                            gene_A_symbol=kras_symbol,
+                                                            gene_A_id=kras_id,
+                                                            gene_A_pert=kras_perturbation,
+                                                            gene_B_pert=gene2_perturbation,
+                                                            effect_type=effect_type,
+                                                            cell_line=cell_line,
+                                                            cellosaurus_id=cellosaurus,
+                                                            cancer_type=cancer,
+                                                            ncit_id=ncit,
+                                                            assay=assay_string,
+                                                            pmid=self.pmid)
+        sli_dict.add_all(sli_batch)
         sli_list = self._mark_maximum_entries(sli_dict)
         return sli_list
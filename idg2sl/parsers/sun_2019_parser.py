@@ -1,5 +1,6 @@
 from idg2sl import SyntheticLethalInteraction
 from idg2sl.sl_dataset_parser import SL_DatasetParser
+from idg2sl.compressed_input import CompressedInput
 from .sl_constants import SlConstants
 
 
@@ -21,14 +22,13 @@ class Sun2019Parser(SL_DatasetParser):
         pmid = '31436504'
         super().__init__(fname=fname, pmid=pmid)
 
-    def parse(self):
+    def parse_iter(self):
         vhl = 'VHL'
-        sli_list = []
         unclear_gene_symbols = {'QARS', 'SARS' }
         # I could figure out that the following mappings are correct and unique with the HGNC website
         mappings = {'ORAOV1': 'LTO1', 'VWA9': 'INTS14', 'NARFL':'CIAO3', 'WBSCR22': 'BUD23',
                     'UFD1L': 'UFD1', 'C7orf26': 'INTS15'}
-        with open(self.fname) as f:
+        with CompressedInput.open(self.fname) as f:
             for line in f:
                 geneBsym = line.strip()
                 if geneBsym in self.entrez_dict:
@@ -59,5 +59,4 @@ class Sun2019Parser(SL_DatasetParser):
                                                  assay=SlConstants.CRISPR_CAS9_INTERFERENCE_ASSAY,
                                                  pmid=self.pmid,
                                                  SL=True)
-                sli_list.append(sli)
-        return sli_list
+                yield sli
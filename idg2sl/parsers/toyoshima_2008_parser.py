@@ -1,7 +1,7 @@
 from idg2sl import SyntheticLethalInteraction
 from idg2sl.sl_dataset_parser import SL_DatasetParser
 from .sl_constants import SlConstants
-import csv
+from idg2sl.table_reader import TableReader
 
 
 class Toyoshima2008Parser(SL_DatasetParser):
@@ -20,45 +20,37 @@ class Toyoshima2008Parser(SL_DatasetParser):
         pmid = '22623531'
         super().__init__(fname=fname, pmid=pmid)
 
-    def parse(self):
+    def parse_iter(self):
         mycsymbol = 'MYC'
         effect_type = 'stddev'
         cell_line = SlConstants.HFF_Myc_CELL
         cellosaurus = SlConstants.HFF_Myc_CELLOSAURUS
-        sl_list = []
         # The following list includes symbols that are not current but either could
         # not be matched or match to multiple possible candidates
         unclear_gene_symbols = {'MLCK'}
         # Gene.Symbol	Accession.number	Z.score.greaterthan	%Viability.HFF-pB	%Viability.HFF-MYC	Ratio pBabe/Myc
-        with open(self.fname) as csvfile:
-            csvreader = csv.DictReader(csvfile, delimiter='\t')
-            for row in csvreader:
-                if len(row) != 6:
-                    raise ValueError("Bad line with %d fields: %s" % (len(row), row))
-                # Gene Symbol	Accession number	Z score (>than)	%Viability HFF-pB	%Viability HFF-MYC	Ratio pBabe/Myc
-                geneBsym = row['Gene.Symbol']
-                if geneBsym in unclear_gene_symbols:
-                    continue
-                geneBsym = self.get_current_symbol(geneBsym)
-                if geneBsym in self.entrez_dict:
-                    geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneBsym))
-                else:
-                    raise ValueError("Could not find id for symbol %s in Toyoshima 2008" % geneBsym)
-                zscore = float(row['Z.score.greaterthan'])
-                sli = SyntheticLethalInteraction(gene_A_symbol=mycsymbol,
-                                                 gene_A_id=SlConstants.MYC_GENE_ID,
-                                                 gene_B_symbol=geneBsym,
-                                                 gene_B_id=geneB_id,
-                                                 gene_A_pert=SlConstants.OVEREXPRESSION,
-                                                 gene_B_pert=SlConstants.SI_RNA,
-                                                 effect_type=effect_type,
-                                                 effect_size=zscore,
-                                                 cell_line=cell_line,
-                                                 cellosaurus_id=cellosaurus,
-                                                 cancer_type=SlConstants.N_A,
-                                                 ncit_id=SlConstants.N_A,
-                                                 assay=SlConstants.RNA_INTERFERENCE_ASSAY,
-                                                 pmid=self.pmid,
-                                                 SL=True)
-                sl_list.append(sli)
-        return sl_list
+        for geneBsym, zscore in TableReader(self.fname, ['Gene.Symbol', 'Z.score.greaterthan'], n_fields=6):
+            if geneBsym in unclear_gene_symbols:
+                continue
+            geneBsym = self.get_current_symbol(geneBsym)
+            if geneBsym in self.entrez_dict:
+                geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneBsym))
+            else:
+                raise ValueError("Could not find id for symbol %s in Toyoshima 2008" % geneBsym)
+            zscore = float(zscore)
+            sli = SyntheticLethalInteraction(gene_A_symbol=mycsymbol,
+                                             gene_A_id=SlConstants.MYC_GENE_ID,
+                                             gene_B_symbol=geneBsym,
+                                             gene_B_id=geneB_id,
+                                             gene_A_pert=SlConstants.OVEREXPRESSION,
+                                             gene_B_pert=SlConstants.SI_RNA,
+                                             effect_type=effect_type,
+                                             effect_size=zscore,
+                                             cell_line=cell_line,
+                                             cellosaurus_id=cellosaurus,
+                                             cancer_type=SlConstants.N_A,
+                                             ncit_id=SlConstants.N_A,
+                                             assay=SlConstants.RNA_INTERFERENCE_ASSAY,
+                                             pmid=self.pmid,
+                                             SL=True)
+            yield sli
@@ -1,9 +1,8 @@
-from collections import defaultdict
-from idg2sl.gene_pair import GenePair
+from idg2sl.gene_pair import GenePairGroups
 from idg2sl.synthetic_lethal_interaction import SyntheticLethalInteraction
 from idg2sl.sl_dataset_parser import SL_DatasetParser
 from .sl_constants import SlConstants
-import csv
+from idg2sl.table_reader import TableReader
 
 
 class Turner2008Parser(SL_DatasetParser):
@@ -30,47 +29,42 @@ class Turner2008Parser(SL_DatasetParser):
         assay_string = ";".join(assays)
         effect_type = 'stddev'
 
-        sli_dict = defaultdict(list)
-        with open(self.fname) as csvfile:
-            # SMARTpool	Z score	percent-siCONTROL
-            csvreader = csv.DictReader(csvfile, delimiter='\t')
-            for row in csvreader:
-                if len(row) < 3:
-                    raise ValueError("Bad row for Turner et al, only %d fields found (%s)" % (len(row), row))
-                geneB_sym = self.get_current_symbol(row['SMARTpool'])
-                zscore = float(row['Z score'])
-                if geneB_sym in self.entrez_dict:
-                    geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneB_sym))
-                elif geneB_sym == 'IMPK':
-                    continue  # could not be found in HGNC or NCBI Gene
-                elif geneB_sym == 'FLJ34389':
-                    geneB_sym = 'MLKL'
-                    geneB_id = "NCBIGene:197259"
+        sli_dict = GenePairGroups()
+        # SMARTpool	Z score	percent-siCONTROL
+        table = TableReader(self.fname, ['SMARTpool', 'Z score']).read_columns(numeric=['Z score'])
+        # every row is kept (the negatives too), so the threshold gives the SL column rather than a selection
+        table['SL'] = table['Z score'] <= -3.0
+        columns = {'gene_B_symbol': [], 'gene_B_id': [], 'effect_size': [], 'SL': []}
+        for geneB_sym, zscore, SL in TableReader.select_rows(table, ['SMARTpool', 'Z score', 'SL']):
+            geneB_sym = self.get_current_symbol(geneB_sym)
+            if geneB_sym in self.entrez_dict:
+                geneB_id = "NCBIGene:{}".format(self.entrez_dict.get(geneB_sym))
+            elif geneB_sym == 'IMPK':
+                continue  # could not be found in HGNC or NCBI Gene
+            elif geneB_sym == 'FLJ34389':
+                geneB_sym = 'MLKL'
+                geneB_id = "NCBIGene:197259"
+            else:
+                if zscore > 3.0:
+                    raise ValueError("Could not get NCBI id for gene %s in Turner 2008" % geneB_sym)
                 else:
-                    if zscore > 3.0:
-                        raise ValueError("Could not get NCBI id for gene %s in Turner 2008" % geneB_sym)
-                    else:
-                        continue # These are negative examples, we will just skiip
-                if zscore <= -3.0:
-                    SL = True
-                else:
-                    SL = False
-                sli = SyntheticLethalInteraction(gene_A_symbol=parp1_symbol,
-                                                 gene_A_id=parp1_id,
-                                                 gene_B_symbol=geneB_sym,
-                                                 gene_B_id=geneB_id,
-                                                 gene_A_pert=parp1_perturbation,
-                                                 gene_B_pert=gene2_perturbation,
-                                                 effect_type=effect_type,
-                                                 effect_size=zscore,
-                                                 cell_line=SlConstants.CAL51_CELL,
-                                                 cellosaurus_id=SlConstants.CAL51_CELLOSAURUS,
-                                                 cancer_type=SlConstants.BREAST_CARCINOMA,
-                                                 ncit_id=SlConstants.BREAST_CARCINOMA_NCIT,
-                                                 assay=assay_string,
-                                                 pmid=self.pmid,
-                                                 SL=SL)
-                gene_pair = GenePair(parp1_symbol, geneB_sym)
-                sli_dict[gene_pair].append(sli)
-                sli_list = self._mark_maximum_entries(sli_dict)
-        return sli_list
+                    continue # These are negative examples, we will just skiip
+            columns['gene_B_symbol'].append(geneB_sym)
+            columns['gene_B_id'].append(geneB_id)
+            columns['effect_size'].append(zscore)
+            columns['SL'].append(SL)
+        # the rows are checked and the interactions created as one batch
+        sli_batch = SyntheticLethalInteraction.from_columns(columns,
+                                                            gene_A_symbol=parp1_symbol,
+                                                            gene_A_id=parp1_id,
+                                                            gene_A_pert=parp1_perturbation,
+                                                            gene_B_pert=gene2_perturbation,
+                                                            effect_type=effect_type,
+                                                            cell_line=SlConstants.CAL51_CELL,
+                                                            cellosaurus_id=SlConstants.CAL51_CELLOSAURUS,
+                                                            cancer_type=SlConstants.BREAST_CARCINOMA,
+                                                            ncit_id=SlConstants.BREAST_CARCINOMA_NCIT,
+                                                            assay=assay_string,
+                                                            pmid=self.pmid)
+        sli_dict.add_all(sli_batch)
+        return self._mark_maximum_entries(sli_dict)
@@ -1,7 +1,7 @@
 from idg2sl import SyntheticLethalInteraction
 from idg2sl.sl_dataset_parser import SL_DatasetParser
 from .sl_constants import SlConstants
-import csv
+from idg2sl.table_reader import TableReader
 
 
 class Vizeacoumar2013Parser(SL_DatasetParser):
@@ -14,46 +14,48 @@ class Vizeacoumar2013Parser(SL_DatasetParser):
     def __init__(self, fname=None):
         pmid = '24104479'
         super().__init__(fname=fname, pmid=pmid)
-        self.sli_list = []
         # old symbols that are assigned to multiple genes
         # Pseudogenes: PMS2L5
         self.unclear_gene_symbols = {'51639', 'PMS2L5'}
 
+    def get_input_files(self):
+        return ['data/vizeacoumarSuppl4-BLM.tsv', 'data/vizeacoumarSuppl4-MUS81.tsv',
+                'data/vizeacoumarSuppl4-PTTG1.tsv', 'data/vizeacoumarSuppl4-PTEN.tsv']
+
     def parseLoF(self, geneA, fname):
         """
         BLM, MUS81, PTEN, PTTG1
         """
         geneAid = self.get_ncbigene_curie(geneA)
-        with open(fname) as csvfile:
-            csvreader = csv.DictReader(csvfile, delimiter='\t')
-            for row in csvreader:
-                if not row['Expression'] == 'Expressed':
-                    continue
-                geneBsym = self.get_current_symbol(row['human gene'])
-                if geneBsym in self.entrez_dict:
-                    geneB_id = self.get_ncbigene_curie(geneBsym)
-                elif geneBsym in self.unclear_gene_symbols:
-                    continue
-                else:
-                    raise ValueError("Could not find iid for %s in Brough 2018 2008 " % geneBsym)
-                conf80 = int(row['80% Confidence Interval (P<0.2)'])
-                if conf80 == 1:
-                    sli = SyntheticLethalInteraction(gene_A_symbol=geneA,
-                                                     gene_A_id=geneAid,
-                                                     gene_B_symbol=geneBsym,
-                                                     gene_B_id=geneB_id,
-                                                     gene_A_pert=SlConstants.LOF_MUTATION,
-                                                     gene_B_pert=SlConstants.SI_RNA ,
-                                                     effect_type='confidence.80%',
-                                                     effect_size='true',
-                                                     cell_line=SlConstants.HCT_116,
-                                                     cellosaurus_id=SlConstants.HCT_116_CELLOSAURUS,
-                                                     cancer_type=SlConstants.N_A,
-                                                     ncit_id=SlConstants.N_A,
-                                                     assay=SlConstants.MULTICOLOR_COMPETITION_ASSAY,
-                                                     pmid=self.pmid,
-                                                     SL=True)
-                    self.sli_list.append(sli)
+        columns = ['Expression', 'human gene', '80% Confidence Interval (P<0.2)']
+        for expression, geneBsym, conf80 in TableReader(fname, columns):
+            if not expression == 'Expressed':
+                continue
+            geneBsym = self.get_current_symbol(geneBsym)
+            if geneBsym in self.entrez_dict:
+                geneB_id = self.get_ncbigene_curie(geneBsym)
+            elif geneBsym in self.unclear_gene_symbols:
+                continue
+            else:
+                raise ValueError("Could not find iid for %s in Brough 2018 2008 " % geneBsym)
+            conf80 = int(conf80)
+            if conf80 == 1:
+                sli = SyntheticLethalInteraction(gene_A_symbol=geneA,
+                                                 gene_A_id=geneAid,
+                                                 gene_B_symbol=geneBsym,
+                                                 gene_B_id=geneB_id,
+                                                 gene_A_pert=SlConstants.LOF_MUTATION,
+                                                 gene_B_pert=SlConstants.SI_RNA ,
+                                                 effect_type='confidence.80%',
+                                                 effect_size='true',
+                                                 cell_line=SlConstants.HCT_116,
+                                                 cellosaurus_id=SlConstants.HCT_116_CELLOSAURUS,
+                                                 cancer_type=SlConstants.N_A,
+                                                 ncit_id=SlConstants.N_A,
+                                                 assay=SlConstants.MULTICOLOR_COMPETITION_ASSAY,
+                                                 pmid=self.pmid,
+                                                 SL=True)
+                yield sli
 
     def parseKRAS(self):
         """
@@ -63,50 +65,48 @@ class Vizeacoumar2013Parser(SL_DatasetParser):
         geneAid = self.get_ncbigene_curie(geneA)
         fname = 'data/vizeacoumarSuppl4-PTEN.tsv'
         c = 0
-        with open(fname) as csvfile:
-            csvreader = csv.DictReader(csvfile, delimiter='\t')
-            for row in csvreader:
-                if not row['Expression'] == 'Expressed':
-                    continue
-                geneBsym = self.get_current_symbol(row['human gene'])
-                if geneBsym in self.entrez_dict:
-                    geneB_id = self.get_ncbigene_curie(geneBsym)
-                elif geneBsym in self.unclear_gene_symbols:
-                    continue
-                else:
-                    raise ValueError("Could not find iid for %s in Brough 2018 2008 " % geneBsym)
-                conf80 = int(row['80% Confidence Interval (P<0.2)'])
-                if conf80 == 1:
-                    c += 1
-                    sli = SyntheticLethalInteraction(gene_A_symbol=geneA,
-                                                     gene_A_id=geneAid,
-                                                     gene_B_symbol=geneBsym,
-                                                     gene_B_id=geneB_id,
-                                                     gene_A_pert=SlConstants.ACTIVATING_MUTATION,
-                                                     gene_B_pert=SlConstants.SI_RNA,
-                                                     effect_type='confidence.80%',
-                                                     effect_size='true',
-                                                     cell_line=SlConstants.HCT_116,
-                                                     cellosaurus_id=SlConstants.HCT_116_CELLOSAURUS,
-                                                     cancer_type=SlConstants.N_A,
-                                                     ncit_id=SlConstants.N_A,
-                                                     assay=SlConstants.MULTICOLOR_COMPETITION_ASSAY,
-                                                     pmid=self.pmid,
-                                                     SL=True)
-                    self.sli_list.append(sli)
+        columns = ['Expression', 'human gene', '80% Confidence Interval (P<0.2)']
+        for expression, geneBsym, conf80 in TableReader(fname, columns):
+            if not expression == 'Expressed':
+                continue
+            geneBsym = self.get_current_symbol(geneBsym)
+            if geneBsym in self.entrez_dict:
+                geneB_id = self.get_ncbigene_curie(geneBsym)
+            elif geneBsym in self.unclear_gene_symbols:
+                continue
+            else:
+                raise ValueError("Could not find iid for %s in Brough 2018 2008 " % geneBsym)
+            conf80 = int(conf80)
+            if conf80 == 1:
+                c += 1
+                sli = SyntheticLethalInteraction(gene_A_symbol=geneA,
+                                                 gene_A_id=geneAid,
+                                                 gene_B_symbol=geneBsym,
+                                                 gene_B_id=geneB_id,
+                                                 gene_A_pert=SlConstants.ACTIVATING_MUTATION,
+                                                 gene_B_pert=SlConstants.SI_RNA,
+                                                 effect_type='confidence.80%',
+                                                 effect_size='true',
+                                                 cell_line=SlConstants.HCT_116,
+                                                 cellosaurus_id=SlConstants.HCT_116_CELLOSAURUS,
+                                                 cancer_type=SlConstants.N_A,
+                                                 ncit_id=SlConstants.N_A,
+                                                 assay=SlConstants.MULTICOLOR_COMPETITION_ASSAY,
+                                                 pmid=self.pmid,
+                                                 SL=True)
+                yield sli
 
-    def parse(self):
+    def parse_iter(self):
         blm = 'BLM'
         blm_fname = 'data/vizeacoumarSuppl4-BLM.tsv'
-        self.parseLoF(geneA=blm, fname=blm_fname)
+        yield from self.parseLoF(geneA=blm, fname=blm_fname)
         mus81 = 'MUS81'
         mus81_fname = 'data/vizeacoumarSuppl4-MUS81.tsv'
-        self.parseLoF(geneA=mus81, fname=mus81_fname)
+        yield from self.parseLoF(geneA=mus81, fname=mus81_fname)
         pttg1 = 'PTTG1'
         pttg1_fname = 'data/vizeacoumarSuppl4-PTTG1.tsv'
-        self.parseLoF(geneA=pttg1, fname=pttg1_fname)
+        yield from self.parseLoF(geneA=pttg1, fname=pttg1_fname)
         pten = 'PTEN'
         pten_fname = 'data/vizeacoumarSuppl4-PTEN.tsv'
-        self.parseLoF(geneA=pten, fname=pten_fname)
-        self.parseKRAS()
-        return self.sli_list
+        yield from self.parseLoF(geneA=pten, fname=pten_fname)
+        yield from self.parseKRAS()
@@ -1,29 +1,39 @@
 import os
-import wget
+import threading
+from .compressed_input import CompressedInput
 from .hgnc_parser import HgncParser
+from .hgnc_snapshot import HgncSnapshotStore
+from .symbol_resolution import SymbolResolver, ResolutionCache
+from .evidence_aggregation import EvidenceAggregator
 
 
 class SL_DatasetParser:
+    # The HGNC index is shared by all parsers of a process, see get_hgnc_index()
+    _hgnc_index = None
+    _hgnc_index_lock = threading.Lock()
+    _resolution_cache = None
+
     def __init__(self, fname, pmid, entrez=None, ensembl=None, synonym=None):
         """
         entrez and ensembl are dictionaries from a gene symbol to an entrez or ensembl id
         The dictionaries are generated by he HgncParser. 
-        If they are not parsed, this constructor will generate them.
+        If they are not passed, this constructor will take them from the process-wide HGNC index.
         """
-        if fname is not None and not os.path.exists(fname):
+        if fname is not None and CompressedInput.find(fname) is None:
             raise ValueError("SL dataset %s does not exist" % fname)
-        # Download HGNS file if necessary
         if entrez is None or ensembl is None or synonym is None:
-            SL_DatasetParser.get_hgnc_file()
-            hgnc_fname = SL_DatasetParser.get_local_hgncfile_name()
-            parser = HgncParser(hgnc_fname)
+            parser = SL_DatasetParser.get_hgnc_index()
             self.entrez_dict = parser.get_entrez_dictionary()
             self.ensembl_dist = parser.get_ensembl_dictionary()
             self.synonym_dict = parser.get_synonym_dictionary()
+            cache = SL_DatasetParser.get_resolution_cache()
         else:
             self.entrez_dict = entrez
             self.ensembl_dist = ensembl
             self.synonym_dict = synonym
+            cache = ResolutionCache()
+        self.resolver = SymbolResolver(self.entrez_dict, self.ensembl_dist, self.synonym_dict,
+                                       cache=cache, source=type(self).__name__)
         self.fname = fname
         self.pmid = pmid
 
@@ -31,58 +41,115 @@ class SL_DatasetParser:
         """
         The parsing functions add all SLIs for gene A & B to a list
         Here, we get a dictionary of lists (the list can have one or more entry)
-        The keys are GenePair objects.
+        The keys are GenePairKey values (see GenePairGroups).
         We need to mark one entry in each list as being the Max=True
+        The entry with the strongest evidence is chosen in a single pass over each list (see EvidenceAggregator);
+        it is returned first, followed by the other entries of the list in their original order.
         """
-        sli_list = []
-        for k, vlist in sli_dict.items():
-            vlist.sort(key=lambda x: abs(x.effect_size), reverse=True)
-            sli = vlist[0]
-            sli.set_maximum()
-            sli_list.append(sli)
-            for s in vlist[1:]:
-                sli_list.append(s)
-        return sli_list
+        return EvidenceAggregator.mark_maximum_in_groups(sli_dict.values())
 
     def parse(self):
         """
-        This method must be implemented by subclasses
+        Returns a list with the SyntheticLethalInteraction objects of the dataset.
+        Subclasses implement either this method or parse_iter. Neither may change the state of the parser (e.g.,
+        by collecting the entries in an instance attribute): every call returns the same entries, so that a
+        parser can be run again and from several threads at the same time.
+        """
+        if type(self).parse_iter is SL_DatasetParser.parse_iter:
+            raise NotImplementedError
+        return list(self.parse_iter())
+
+    def parse_iter(self):
+        """
+        Yields the SyntheticLethalInteraction objects of the dataset one by one, so that large screens can be
+        streamed without building a list. Parsers that need to see all entries before they can emit the first
+        one (e.g., to mark the maximum entry of each gene pair) implement parse() instead, and this method
+        iterates over its list.
+        """
+        if type(self).parse is SL_DatasetParser.parse:
+            raise NotImplementedError
+        return iter(self.parse())
+
+    def get_input_files(self):
+        """
+        Returns the data files read by parse() (used by the ParseResultCache to check if a result is current).
+        Parsers that read several files or files other than fname must override this method.
+        """
+        return [] if self.fname is None else [self.fname]
+
+    def resolve_symbols(self, symbols, rescue=False):
+        """
+        Resolve a whole column of gene symbols at once. Returns a ResolutionReport with the current symbol,
+        NCBI Gene CURIE, Ensembl id and resolution path (exact/previous/alias/ambiguous/missing) of each
+        distinct symbol. Use report.raise_if_unresolved() to report all unresolved symbols together.
+        With rescue=True, the report also suggests candidates for unresolved symbols (case errors,
+        spreadsheet dates such as 1-Mar for MARCH1, similar symbols).
         """
-        raise NotImplementedError
+        return self.resolver.resolve_symbols(symbols, rescue=rescue)
 
     def get_current_symbol(self, symbol):
-        if symbol in self.entrez_dict:
-            return symbol
-        elif symbol not in self.synonym_dict:
-            return symbol  # Could not find it, this will lead to an error
-        else:
-            s = self.synonym_dict[symbol]
-            if s == 'MULTIPLE':
-                return symbol
-            else:
-                return s
+        # If the symbol is unknown or ambiguous, the symbol itself is returned, which will lead to an error
+        return self.resolver.resolve(symbol).current_symbol
 
     def get_ncbigene_curie(self, symbol):
-        if symbol in self.entrez_dict:
-            geneid = self.entrez_dict.get(symbol)
-            return 'NCBIGene:%s' % geneid
+        resolution = self.resolver.resolve(symbol)
+        if resolution.path == resolution.EXACT:
+            return resolution.ncbigene_curie
         else:
             raise ValueError("Could not find id for %s (sl_dataset_parser)" % symbol)
 
+    @staticmethod
+    def get_hgnc_index():
+        """
+        Return the HgncParser that is shared by all parsers of this process.
+        The HGNC file is downloaded (if necessary) and loaded the first time this method is called,
+        unless an index was injected with set_hgnc_index. The compiled index is cached on disk (see HgncParser.load).
+        """
+        if SL_DatasetParser._hgnc_index is None:
+            with SL_DatasetParser._hgnc_index_lock:
+                if SL_DatasetParser._hgnc_index is None:
+                    hgnc_fname = SL_DatasetParser.get_hgnc_file()
+                    SL_DatasetParser._resolution_cache = ResolutionCache()
+                    SL_DatasetParser._hgnc_index = HgncParser.load(hgnc_fname)
+        return SL_DatasetParser._hgnc_index
+
+    @staticmethod
+    def get_resolution_cache():
+        """
+        Return the cache of symbol resolutions that belongs to the process-wide HGNC index.
+        Its get_stats() method reports the hits, misses and lookup time of each parser class.
+        """
+        SL_DatasetParser.get_hgnc_index()
+        return SL_DatasetParser._resolution_cache
+
+    @staticmethod
+    def set_hgnc_index(hgnc):
+        """
+        Use hgnc (an HgncParser or any object with the same get_*_dictionary methods) as the
+        process-wide HGNC index, e.g., for tests or when embedding the parsers in another application.
+        Passing None discards the current index, which will then be rebuilt on the next use.
+        The memoized symbol resolutions are kept if hgnc is the current index (e.g., in a forked worker process
+        that installs the index of its parent), and are discarded otherwise.
+        """
+        with SL_DatasetParser._hgnc_index_lock:
+            if hgnc is not None and hgnc is SL_DatasetParser._hgnc_index:
+                return
+            SL_DatasetParser._resolution_cache = None if hgnc is None else ResolutionCache()
+            SL_DatasetParser._hgnc_index = hgnc
+
     @staticmethod
     def get_hgnc_file():
         """
-        Download the file  ftp://ftp.ebi.ac.uk/pub/databases/genenames/hgnc/tsv/locus_groups/protein-coding_gene.txt
-        ftp://ftp.ebi.ac.uk/pub/databases/genenames/hgnc/tsv/non_alt_loci_set.txt
+        Return the path of the HGNC file protein-coding_gene.txt
+        (https://ftp.ebi.ac.uk/pub/databases/genenames/hgnc/tsv/locus_groups/protein-coding_gene.txt).
+        A copy in the current working directory is used if it exists. Otherwise, the file is taken from the
+        shared snapshot store (see HgncSnapshotStore), which downloads it if needed.
         """
-        urldir = 'ftp://ftp.ebi.ac.uk/pub/databases/genenames/hgnc/tsv/locus_groups/protein-coding_gene.txt'
         local_filename = 'protein-coding_gene.txt'
-        if not os.path.exists(local_filename):
-            print("[INFO] Will download ", local_filename)
-            local_filename = wget.download(urldir)
-        if not os.path.exists(local_filename):
-            raise Exception("Failed to download %s from %s" % (local_filename, urldir))
+        if os.path.exists(local_filename):
+            return local_filename
+        return HgncSnapshotStore().get()
 
     @staticmethod
     def get_local_hgncfile_name():
-        return 'protein-coding_gene.txt'
+        return SL_DatasetParser.get_hgnc_file()
@@ -0,0 +1,315 @@
+import math
+from operator import attrgetter, methodcaller
+import numpy as np
+from .evidence_aggregation import EvidenceAggregator
+from .gene_pair import GenePairKey
+from .synthetic_lethal_interaction import SyntheticLethalInteraction
+
+
+class Categories:
+    """
+    The distinct values of a dictionary-encoded column of a SliTable. Each value is stored once, and the rows of
+    the column hold its code (the index of the value in values). Values are only ever added, so that tables
+    derived from one another (e.g., by SliTable.filter) can share their categories.
+    """
+    def __init__(self, values=()):
+        self.values = []
+        self._codes = {}
+        for value in values:
+            self.encode(value)
+
+    def encode(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def encode_all(self, values):
+        """
+        Returns the codes of a list of values as an int32 array. New values are added in the order in which they
+        first occur; the codes are looked up in bulk instead of calling encode for each value.
+        """
+        codes = self._codes
+        distinct = dict.fromkeys(values)
+        for value in distinct:
+            if value not in codes:
+                codes[value] = len(self.values)
+                self.values.append(value)
+        if len(distinct) == 1:
+            # most categorical columns of a study have a single value (e.g., the assay or the PubMed id)
+            return np.full(len(values), codes[values[0]], dtype=np.int32)
+        return np.fromiter(map(codes.__getitem__, values), dtype=np.int32, count=len(values))
+
+    def get_code(self, value):
+        """
+        Returns the code of value, or -1 if value is not one of the categories
+        """
+        return self._codes.get(value, -1)
+
+    def __len__(self):
+        return len(self.values)
+
+
+_NCBIGENE_PREFIX = 'NCBIGene:'
+
+
+def _get_gene_number(curie, _n=len(_NCBIGENE_PREFIX)):
+    return int(curie[_n:])
+
+
+class SliTable:
+    """
+    A columnar collection of synthetic lethal interactions (a structure of NumPy arrays instead of a list of
+    SyntheticLethalInteraction objects), so that operations on a whole dataset or on the whole database are
+    vectorized:
+     - gene_A_id and gene_B_id: the NCBI Gene ids as integers (int64)
+     - effect_size: the effect sizes as floats (NaN if the effect size is not a number, e.g., n/a or 'true')
+     - SL and maximum: booleans
+     - all other fields (the CATEGORICAL columns) are dictionary-encoded: the column holds int32 codes, and its
+       Categories hold the distinct values
+    Effect sizes that are not floats (e.g., 'true' or an integer penetrance) are also kept as they were passed,
+    so that to_records() returns records that are equal to the ones that were added.
+    Records are appended to a buffer and encoded in bulk the next time a column is read.
+    """
+    CATEGORICAL = ('gene_A_symbol', 'gene_B_symbol', 'gene_A_pert', 'gene_B_pert', 'effect_type', 'species_id',
+                   'assay', 'cell_line', 'cellosaurus_id', 'cancer_type', 'ncit_id', 'pmid',
+                   'background_dependency_status', 'background_dependency_gene_symbol',
+                   'background_dependency_gene_id')
+    COLUMNS = CATEGORICAL + ('gene_A_id', 'gene_B_id', 'effect_size', 'SL', 'maximum')
+    # the last three (background dependency) fields are private attributes of SyntheticLethalInteraction
+    _GETTERS = dict({name: attrgetter(name) for name in CATEGORICAL[:-3]},
+                    **{name: methodcaller('get_' + name) for name in CATEGORICAL[-3:]})
+    # the effect sizes that are not floats, encoded as (type, value) so that, e.g., 1 and True are different
+    _EFFECT_VALUE = '_effect_value'
+
+    def __init__(self, records=()):
+        self._categories = {name: Categories() for name in SliTable.CATEGORICAL + (SliTable._EFFECT_VALUE,)}
+        self._columns = {name: SliTable._empty_column(name) for name in SliTable.COLUMNS + (SliTable._EFFECT_VALUE,)}
+        self._pending = list(records)
+
+    @staticmethod
+    def _empty_column(name):
+        if name in ('gene_A_id', 'gene_B_id'):
+            return np.empty(0, dtype=np.int64)
+        elif name == 'effect_size':
+            return np.empty(0, dtype=np.float64)
+        elif name in ('SL', 'maximum'):
+            return np.empty(0, dtype=bool)
+        return np.empty(0, dtype=np.int32)
+
+    @staticmethod
+    def from_records(records):
+        return SliTable(records)
+
+    def append(self, sli):
+        self._pending.append(sli)
+
+    def extend(self, records):
+        self._pending.extend(records)
+
+    def __len__(self):
+        return len(self._columns['SL']) + len(self._pending)
+
+    def _flush(self):
+        if len(self._pending) == 0:
+            return
+        records = self._pending
+        self._pending = []
+        n = len(records)
+        new_columns = {}
+        for name in SliTable.CATEGORICAL:
+            values = list(map(SliTable._GETTERS[name], records))
+            new_columns[name] = self._categories[name].encode_all(values)
+        for name in ('gene_A_id', 'gene_B_id'):
+            curies = list(map(attrgetter(name), records))
+            numbers = {curie: _get_gene_number(curie) for curie in dict.fromkeys(curies)}
+            new_columns[name] = np.fromiter(map(numbers.__getitem__, curies), dtype=np.int64, count=n)
+        values = list(map(attrgetter('effect_size'), records))
+        effect_values = np.full(n, -1, dtype=np.int32)
+        if set(map(type, values)) == {float}:
+            effect_sizes = np.array(values, dtype=np.float64)
+        else:
+            effect_sizes = np.empty(n, dtype=np.float64)
+            encode = self._categories[SliTable._EFFECT_VALUE].encode
+            for i, value in enumerate(values):
+                if value.__class__ is float:
+                    effect_sizes[i] = value
+                else:
+                    numeric = EvidenceAggregator.get_numeric_effect(value)
+                    effect_sizes[i] = math.nan if numeric is None else numeric
+                    effect_values[i] = encode((value.__class__, value))
+        new_columns['effect_size'] = effect_sizes
+        new_columns[SliTable._EFFECT_VALUE] = effect_values
+        new_columns['SL'] = np.fromiter(map(bool, map(attrgetter('SL'), records)), dtype=bool, count=n)
+        new_columns['maximum'] = np.fromiter(map(attrgetter('maximum_value'), records), dtype=bool, count=n)
+        for name, column in new_columns.items():
+            if len(self._columns[name]) == 0:
+                self._columns[name] = column
+            else:
+                self._columns[name] = np.concatenate([self._columns[name], column])
+
+    def get_column(self, name):
+        """
+        Returns the NumPy array of a column (the codes for a categorical column). The array must not be changed.
+        """
+        if name not in self._columns or name == SliTable._EFFECT_VALUE:
+            raise ValueError("Unknown column %s (known columns: %s)" % (name, ", ".join(SliTable.COLUMNS)))
+        self._flush()
+        return self._columns[name]
+
+    def get_categories(self, name):
+        """
+        Returns the Categories of a categorical column
+        """
+        if name not in SliTable.CATEGORICAL:
+            raise ValueError("%s is not a categorical column" % name)
+        return self._categories[name]
+
+    def get_values(self, name):
+        """
+        Returns the values of a column; categorical columns are decoded to an array of objects
+        """
+        column = self.get_column(name)
+        if name not in SliTable.CATEGORICAL:
+            return column
+        values = np.empty(len(self._categories[name]), dtype=object)
+        values[:] = self._categories[name].values
+        return values[column]
+
+    def equals(self, name, value):
+        """
+        Returns a boolean mask of the rows whose categorical column name has value
+        """
+        code = self.get_categories(name).get_code(value)
+        return self.get_column(name) == code if code >= 0 else np.zeros(len(self), dtype=bool)
+
+    def isin(self, name, values):
+        """
+        Returns a boolean mask of the rows whose categorical column name has one of values
+        """
+        categories = self.get_categories(name)
+        codes = [c for c in map(categories.get_code, values) if c >= 0]
+        return np.isin(self.get_column(name), codes)
+
+    def get_scores(self):
+        """
+        Returns the strength of the evidence of each row as in EvidenceAggregator.get_score (larger is better),
+        with -inf for effect sizes that are not numbers
+        """
+        effect_size = self.get_column('effect_size')
+        smaller_is_better = self.isin('effect_type', EvidenceAggregator.SMALLER_IS_BETTER)
+        scores = np.where(smaller_is_better, -effect_size, np.abs(effect_size))
+        scores[np.isnan(scores)] = -np.inf
+        return scores
+
+    def get_pair_keys(self, directed=False):
+        """
+        Returns the GenePairKey of each row as an int64 array (undirected by default, so that the rows of studies
+        that list a pair as A-B and as B-A can be joined)
+        """
+        return GenePairKey.pack_arrays(self.get_column('gene_A_id'), self.get_column('gene_B_id'), directed=directed)
+
+    def _with_columns(self, columns):
+        table = SliTable()
+        table._categories = self._categories
+        table._columns = columns
+        return table
+
+    def filter(self, mask):
+        """
+        Returns a new table with the rows selected by mask (a boolean mask or an array of row indexes). The new
+        table shares the categories of this table.
+        """
+        self._flush()
+        return self._with_columns({name: column[mask] for name, column in self._columns.items()})
+
+    @staticmethod
+    def concatenate(tables):
+        """
+        Returns a new table with the rows of all tables, in order
+        """
+        tables = list(tables)
+        if len(tables) == 0:
+            return SliTable()
+        for table in tables:
+            table._flush()
+        result = SliTable()
+        parts = {name: [] for name in result._columns}
+        for table in tables:
+            for name, column in table._columns.items():
+                if name in result._categories:
+                    # map the codes of the table to the codes of the result; the code -1 (no value) stays -1
+                    encode = result._categories[name].encode
+                    remap = np.array(list(map(encode, table._categories[name].values)) + [-1], dtype=np.int32)
+                    column = remap[column]
+                parts[name].append(column)
+        result._columns = {name: np.concatenate(columns) for name, columns in parts.items()}
+        return result
+
+    def group_by(self, names):
+        """
+        Groups the rows by the values of the columns names. Returns a dictionary from a tuple with the values of
+        the columns to an array with the indexes of the rows of the group (in the order of the rows). The groups
+        are ordered by the codes (for categorical columns) or the values of the columns.
+        """
+        names = list(names)
+        if len(self) == 0:
+            return {}
+        # The group of each row is numbered by combining the ranks of its values in the columns (codes and
+        # booleans are ranks already; the gene ids are ranked with np.unique)
+        key = np.zeros(len(self), dtype=np.int64)
+        n_keys = 1
+        for name in names:
+            column = self.get_column(name)
+            if name in SliTable.CATEGORICAL:
+                ranks, n_ranks = column, len(self._categories[name])
+            elif column.dtype == bool:
+                ranks, n_ranks = column, 2
+            else:
+                _, ranks = np.unique(column, return_inverse=True)
+                ranks = ranks.reshape(-1)
+                n_ranks = int(ranks.max()) + 1
+            if n_keys * n_ranks >= 2**62:
+                # make the numbers dense again, so that they cannot overflow
+                _, key = np.unique(key, return_inverse=True)
+                key = key.reshape(-1)
+                n_keys = int(key.max()) + 1
+            key = key * n_ranks + ranks
+            n_keys *= n_ranks
+        order = np.argsort(key, kind='stable')
+        counts = np.bincount(key) if n_keys <= 4 * len(key) else np.unique(key, return_counts=True)[1]
+        bounds = np.cumsum(counts[counts > 0])[:-1]
+        # the values of the key of a group are taken from its first row
+        first_rows = order[np.concatenate(([0], bounds))]
+        key_columns = []
+        for name in names:
+            values = self._columns[name][first_rows].tolist()
+            if name in SliTable.CATEGORICAL:
+                values = list(map(self._categories[name].values.__getitem__, values))
+            key_columns.append(values)
+        return dict(zip(zip(*key_columns), np.split(order, bounds)))
+
+    def to_records(self):
+        """
+        Returns a list with one SyntheticLethalInteraction per row
+        """
+        self._flush()
+        columns = {}
+        for name in SliTable.CATEGORICAL:
+            columns[name] = list(map(self._categories[name].values.__getitem__, self._columns[name].tolist()))
+        for name in ('gene_A_id', 'gene_B_id'):
+            numbers = self._columns[name].tolist()
+            curies = {i: _NCBIGENE_PREFIX + str(i) for i in set(numbers)}
+            columns[name] = list(map(curies.__getitem__, numbers))
+        effect_values = self._categories[SliTable._EFFECT_VALUE].values
+        columns['effect_size'] = [value if code < 0 else effect_values[code][1] for value, code in
+                                  zip(self._columns['effect_size'].tolist(),
+                                      self._columns[SliTable._EFFECT_VALUE].tolist())]
+        columns['SL'] = self._columns['SL'].tolist()
+        # the names of the columns are the names of the arguments of the constructor
+        sli_list = SyntheticLethalInteraction.from_columns(columns)
+        for i in np.flatnonzero(self._columns['maximum']).tolist():
+            sli_list[i].set_maximum()
+        return sli_list
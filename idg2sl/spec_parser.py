@@ -0,0 +1,333 @@
+import operator
+import os
+import re
+from .synthetic_lethal_interaction import SyntheticLethalInteraction
+from .sl_dataset_parser import SL_DatasetParser
+from .parsers.sl_constants import SlConstants
+from .gene_pair import GenePairGroups
+from .table_reader import TableReader
+
+
+class SpecCondition:
+    """
+    A comparison of a numeric column with a number, e.g., 'D.Z-score >= 3.3'.
+    Conditions are applied to whole NumPy columns at once.
+    """
+    OPERATORS = {'<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+                 '==': operator.eq, '!=': operator.ne}
+    _PATTERN = re.compile(r'^(.+?)\s*(<=|>=|==|!=|<|>)\s*(\S+)$')
+
+    def __init__(self, column, op, value):
+        if op not in SpecCondition.OPERATORS:
+            raise ValueError("Unknown operator %s (must be one of %s)" % (op, ", ".join(SpecCondition.OPERATORS)))
+        self.column = column
+        self.op = op
+        self.value = float(value)
+
+    @staticmethod
+    def parse(text):
+        m = SpecCondition._PATTERN.match(text.strip())
+        if m is None:
+            raise ValueError("Could not parse condition '%s' (expected e.g. 'D.Z-score >= 3.3')" % text)
+        return SpecCondition(m.group(1), m.group(2), m.group(3))
+
+    def get_mask(self, columns):
+        """
+        Returns a boolean NumPy array with the rows of columns (as returned by TableReader.read_columns) that
+        fulfil the condition
+        """
+        return SpecCondition.OPERATORS[self.op](columns[self.column], self.value)
+
+    def __repr__(self):
+        return "%s %s %g" % (self.column, self.op, self.value)
+
+
+class DatasetSpec:
+    """
+    Declarative description of a screen whose table has one row per gene pair (or per gene B, if the gene A
+    is fixed):
+
+        name: Kessler2012Parser          # name of the generated parser class
+        label: Kessler et al 2012
+        pmid: '22157079'
+        file: data/kessler2012SupplTable1.tsv
+        n_fields: 3                      # optional, as for TableReader (also: delimiter)
+        gene_a: {symbol: MYC, perturbation: SlConstants.OVEREXPRESSION}   # or a column instead of symbol
+        gene_b:
+          column: symbol
+          perturbation: SlConstants.SI_RNA
+          symbol_map: {C9ORF96: STKLD1}  # optional corrections of the symbols in the table
+          ignore: [ATP5EP1, GIF]         # optional symbols that are skipped if they cannot be resolved
+          skip_unresolved: false         # optional, true skips all symbols that cannot be resolved
+        effect: {type: SlConstants.ZSCORE, column: median.pair.diffs}   # or a constant value instead of column
+        fields: {assay: ..., cell_line: ..., cellosaurus_id: ..., cancer_type: ..., ncit_id: ...}
+        filters: ['D.Z-score >= 2']      # optional, rows that fail a filter are skipped
+        sl: true                         # true, or conditions that all must hold for a positive SLI
+        mark_maximum: true               # mark the entry with the largest |effect| per gene pair
+        listed:                          # optional entries of a fixed gene A that are not taken from the table
+          gene_b: [ATR, TAB2]
+          sl: true
+          effect: {type: SlConstants.N_A, value: SlConstants.N_A}
+
+    A gene A column takes the same optional entries as gene_b (symbol_map, ignore, skip_unresolved).
+    Instead of true or a list of conditions, sl can also give the conditions of positive and of negative rows,
+    e.g., {negative: ['RSA.p-value >= 0.5']}; a row that matches neither (all conditions of a list must hold)
+    is skipped. Rows in which both genes are the same are skipped.
+    Values of the form SlConstants.NAME refer to the constants in SlConstants. The symbols of the rows that pass
+    the filters and SL rules are resolved together, and the unresolved symbols that are not in ignore are
+    reported at once (e.g., pseudogenes or withdrawn symbols go into ignore).
+    """
+    FIELDS = ('assay', 'cell_line', 'cellosaurus_id', 'cancer_type', 'ncit_id')
+
+    def __init__(self, spec, source='<spec>'):
+        try:
+            self.name = spec['name']
+            self.label = spec.get('label', self.name)
+            self.pmid = str(spec['pmid'])
+            self.fname = spec['file']
+            self.delimiter = spec.get('delimiter', '\t')
+            self.n_fields = spec.get('n_fields')
+            gene_a = spec['gene_a']
+            self.gene_a_symbol = gene_a.get('symbol')
+            self.gene_a_column = gene_a.get('column')
+            if (self.gene_a_symbol is None) == (self.gene_a_column is None):
+                raise ValueError("gene_a needs either a symbol or a column")
+            self.gene_a_perturbation = DatasetSpec.constant(gene_a['perturbation'])
+            self.gene_a_symbol_map, self.gene_a_ignore, self.gene_a_skip_unresolved = \
+                DatasetSpec._get_resolution_options(gene_a)
+            gene_b = spec['gene_b']
+            self.gene_b_column = gene_b['column']
+            self.gene_b_perturbation = DatasetSpec.constant(gene_b['perturbation'])
+            self.symbol_map, self.ignore, self.skip_unresolved = DatasetSpec._get_resolution_options(gene_b)
+            self.effect_type, self.effect_column, self.effect_value = DatasetSpec._get_effect(spec['effect'])
+            fields = spec.get('fields') or {}
+            unknown = set(fields) - set(DatasetSpec.FIELDS)
+            if len(unknown) > 0:
+                raise ValueError("unknown field(s) %s" % ", ".join(sorted(unknown)))
+            self.fields = {k: DatasetSpec.constant(fields.get(k, SlConstants.N_A)) for k in DatasetSpec.FIELDS}
+            self.filters = [SpecCondition.parse(c) for c in spec.get('filters') or ()]
+            sl = spec.get('sl', True)
+            # negative_conditions is None unless the negative rows are given by conditions of their own
+            self.negative_conditions = None
+            if sl is True or sl is False:
+                self.sl_value = sl
+                self.sl_conditions = []
+            elif isinstance(sl, dict):
+                unknown = set(sl) - {'positive', 'negative'}
+                if len(unknown) > 0:
+                    raise ValueError("unknown sl rule(s) %s" % ", ".join(sorted(unknown)))
+                self.sl_value = None
+                self.sl_conditions = [SpecCondition.parse(c) for c in sl.get('positive') or ()]
+                self.negative_conditions = [SpecCondition.parse(c) for c in sl.get('negative') or ()]
+                if 'positive' not in sl and 'negative' not in sl:
+                    raise ValueError("sl needs positive or negative conditions")
+                self.has_positive_rule = 'positive' in sl
+                self.has_negative_rule = 'negative' in sl
+            else:
+                self.sl_value = None
+                self.sl_conditions = [SpecCondition.parse(c) for c in sl]
+            self.mark_maximum = bool(spec.get('mark_maximum', False))
+            listed = spec.get('listed')
+            if listed is None:
+                self.listed_symbols = []
+            else:
+                if self.gene_a_symbol is None:
+                    raise ValueError("listed entries need a fixed gene A symbol")
+                self.listed_symbols = list(listed['gene_b'])
+                self.listed_sl = bool(listed.get('sl', True))
+                self.listed_effect_type, _, self.listed_effect_value = DatasetSpec._get_effect(listed['effect'])
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError("Invalid parser spec %s: missing or malformed entry %s" % (source, e))
+        except ValueError as e:
+            raise ValueError("Invalid parser spec %s: %s" % (source, e))
+
+    @staticmethod
+    def _get_resolution_options(gene):
+        return (dict(gene.get('symbol_map') or {}), frozenset(gene.get('ignore') or ()),
+                bool(gene.get('skip_unresolved', False)))
+
+    @staticmethod
+    def _get_effect(effect):
+        return (DatasetSpec.constant(effect['type']), effect.get('column'),
+                DatasetSpec.constant(effect.get('value', SlConstants.N_A)))
+
+    @staticmethod
+    def constant(value):
+        if isinstance(value, str) and value.startswith('SlConstants.'):
+            name = value[len('SlConstants.'):]
+            if not hasattr(SlConstants, name):
+                raise ValueError("SlConstants has no constant %s" % name)
+            return getattr(SlConstants, name)
+        return value
+
+    def get_numeric_columns(self):
+        columns = [c.column for c in self.filters + self.sl_conditions + (self.negative_conditions or [])]
+        if self.effect_column is not None:
+            columns.append(self.effect_column)
+        return list(dict.fromkeys(columns))
+
+    @staticmethod
+    def load(fname):
+        import yaml
+        with open(fname) as f:
+            return DatasetSpec(yaml.safe_load(f), source=fname)
+
+
+class SpecParser(SL_DatasetParser):
+    """
+    A dataset parser generated from a DatasetSpec. The needed columns of the table are read in one pass with
+    TableReader.read_columns (numeric columns as NumPy arrays), the filters and SL conditions are compiled to
+    boolean masks over whole columns, and only the rows that pass are materialized.
+    Use SpecParser.create_class to generate a parser class from a YAML file.
+    """
+    SPEC = None
+    SPEC_FILE = None
+
+    def __init__(self, fname=None):
+        if fname is None:
+            fname = self.SPEC.fname
+        super().__init__(fname=fname, pmid=self.SPEC.pmid)
+
+    @staticmethod
+    def create_class(spec_fname, module):
+        """
+        Returns a subclass of SpecParser for the spec in the YAML file spec_fname. module must be the name of the
+        module in which the class is stored under the name of the spec, so that the class can be pickled.
+        """
+        spec = DatasetSpec.load(spec_fname)
+        return type(spec.name, (SpecParser,), {'SPEC': spec, 'SPEC_FILE': os.path.abspath(spec_fname),
+                                               '__module__': module, '__doc__': "Generated from %s" % spec_fname})
+
+    def get_input_files(self):
+        return [self.fname, self.SPEC_FILE]
+
+    def _compile(self, columns, n):
+        """
+        Returns the mask of the rows that are kept (None for all rows) and the mask of the positive rows among
+        them (None if all rows have the SL status of the spec)
+        """
+        import numpy as np
+        spec = self.SPEC
+
+        def get_mask(conditions):
+            mask = np.ones(n, dtype=bool)
+            for c in conditions:
+                mask &= c.get_mask(columns)
+            return mask
+        keep = get_mask(spec.filters) if len(spec.filters) > 0 else None
+        if spec.sl_value is not None:
+            return keep, None
+        positive = get_mask(spec.sl_conditions)
+        if spec.negative_conditions is None:
+            return keep, positive
+        if not spec.has_positive_rule:
+            positive = np.zeros(n, dtype=bool)
+        # a row that matches neither rule is skipped
+        matched = positive | get_mask(spec.negative_conditions) if spec.has_negative_rule else positive
+        return (matched if keep is None else keep & matched), positive
+
+    def parse_iter(self):
+        if self.SPEC.mark_maximum:
+            return super().parse_iter()
+        return self._iter_slis()
+
+    def parse(self):
+        if not self.SPEC.mark_maximum:
+            return list(self._iter_slis())
+        sli_dict = GenePairGroups()
+        sli_dict.add_all(self._iter_slis())
+        return self._mark_maximum_entries(sli_dict)
+
+    def _iter_slis(self):
+        spec = self.SPEC
+        gene_columns = [spec.gene_b_column] if spec.gene_a_column is None else [spec.gene_a_column,
+                                                                                 spec.gene_b_column]
+        numeric = [c for c in spec.get_numeric_columns() if c not in gene_columns]
+        reader = TableReader(self.fname, gene_columns + numeric, delimiter=spec.delimiter, n_fields=spec.n_fields)
+        columns = reader.read_columns(numeric=numeric)
+        keep, positive = self._compile(columns, len(columns[spec.gene_b_column]))
+        names = list(gene_columns)
+        if spec.effect_column is not None:
+            names.append(spec.effect_column)
+        if positive is not None:
+            columns['_sl'] = positive
+            names.append('_sl')
+        rows = TableReader.select_rows(columns, names, keep)
+        symbol_map = spec.symbol_map
+        a_symbol_map = spec.gene_a_symbol_map
+        has_a_column = spec.gene_a_column is not None
+        # resolve the distinct symbols of the selected rows at once (dictionaries keep the order of the rows)
+        b = len(gene_columns) - 1
+        symbols_b = {symbol_map.get(row[b], row[b]): None for row in rows}
+        symbols_a = {a_symbol_map.get(row[0], row[0]): None for row in rows} if has_a_column else {}
+        report = self.resolve_symbols(list(symbols_b) + list(symbols_a), rescue=True)
+        # the unresolved symbols that must be reported are those of columns that do not skip them
+        required = set()
+        if not spec.skip_unresolved:
+            required.update(symbols_b)
+            required.difference_update(spec.ignore)
+        if not spec.gene_a_skip_unresolved:
+            required.update(symbols_a)
+            required.difference_update(spec.gene_a_ignore)
+        unresolved = {r.symbol for r in report.get_unresolved()}
+        report.raise_if_unresolved(ignore=unresolved - required, source=spec.label)
+        # the interactions are created as one batch of columns (see SyntheticLethalInteraction.from_columns)
+        batch = {'gene_A_symbol': [], 'gene_A_id': [], 'gene_B_symbol': [], 'gene_B_id': []}
+        if spec.effect_column is not None:
+            batch['effect_size'] = []
+        if positive is not None:
+            batch['SL'] = []
+        gene_a = spec.gene_a_symbol
+        gene_a_id = None if has_a_column else self.get_ncbigene_curie(gene_a)
+        for row in rows:
+            if has_a_column:
+                resolution_a = report[a_symbol_map.get(row[0], row[0])]
+                if not resolution_a.is_resolved():
+                    continue
+                gene_a = resolution_a.current_symbol
+                gene_a_id = resolution_a.ncbigene_curie
+            resolution = report[symbol_map.get(row[b], row[b])]
+            if not resolution.is_resolved():
+                continue
+            if gene_a_id == resolution.ncbigene_curie:
+                continue  # self-loops cannot be SLIs
+            batch['gene_A_symbol'].append(gene_a)
+            batch['gene_A_id'].append(gene_a_id)
+            batch['gene_B_symbol'].append(resolution.current_symbol)
+            batch['gene_B_id'].append(resolution.ncbigene_curie)
+            if spec.effect_column is not None:
+                batch['effect_size'].append(row[b + 1])
+            if positive is not None:
+                batch['SL'].append(row[-1])
+        fields = dict(spec.fields, gene_A_pert=spec.gene_a_perturbation, gene_B_pert=spec.gene_b_perturbation,
+                      effect_type=spec.effect_type, pmid=self.pmid)
+        if spec.effect_column is None:
+            fields['effect_size'] = spec.effect_value
+        if positive is None:
+            fields['SL'] = spec.sl_value
+        yield from SyntheticLethalInteraction.from_columns(batch, **fields)
+        if len(spec.listed_symbols) > 0:
+            gene_a = spec.gene_a_symbol
+            gene_a_id = self.get_ncbigene_curie(gene_a)
+            for gene_b in spec.listed_symbols:
+                yield self._create_sli(gene_a, gene_a_id, gene_b, self.get_ncbigene_curie(gene_b),
+                                       spec.listed_effect_type, spec.listed_effect_value, spec.listed_sl)
+
+    def _create_sli(self, gene_a, gene_a_id, gene_b, gene_b_id, effect_type, effect_size, sl):
+        spec = self.SPEC
+        fields = spec.fields
+        return SyntheticLethalInteraction(gene_A_symbol=gene_a,
+                                          gene_A_id=gene_a_id,
+                                          gene_B_symbol=gene_b,
+                                          gene_B_id=gene_b_id,
+                                          gene_A_pert=spec.gene_a_perturbation,
+                                          gene_B_pert=spec.gene_b_perturbation,
+                                          effect_type=effect_type,
+                                          effect_size=effect_size,
+                                          cell_line=fields['cell_line'],
+                                          cellosaurus_id=fields['cellosaurus_id'],
+                                          cancer_type=fields['cancer_type'],
+                                          ncit_id=fields['ncit_id'],
+                                          assay=fields['assay'],
+                                          pmid=self.pmid,
+                                          SL=sl)
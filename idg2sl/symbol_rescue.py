@@ -0,0 +1,132 @@
+import re
+from collections import defaultdict
+import numpy as np
+
+
+class RescueCandidate:
+    """
+    A candidate gene for a symbol that could not be resolved. name is the approved, previous or alias symbol
+    that matched, current_symbol the approved symbol of the gene, and method tells how the candidate was found:
+    'case' (the symbol differs only in case), 'excel-date' (the symbol was mangled into a date by a spreadsheet,
+    e.g., 1-Mar for MARCH1) or 'trigram' (similar spelling). score is 1.0 for the repairs and the trigram
+    similarity (Dice coefficient) otherwise.
+    """
+    CASE = 'case'
+    EXCEL_DATE = 'excel-date'
+    TRIGRAM = 'trigram'
+
+    def __init__(self, name, current_symbol, score, method):
+        self.name = name
+        self.current_symbol = current_symbol
+        self.score = score
+        self.method = method
+
+    def __repr__(self):
+        if self.name == self.current_symbol:
+            return "%s (%s, %.2f)" % (self.current_symbol, self.method, self.score)
+        return "%s via %s (%s, %.2f)" % (self.current_symbol, self.name, self.method, self.score)
+
+
+class SymbolRescueIndex:
+    """
+    Precomputed index over all approved symbols and unambiguous previous/alias symbols of a gene index, used to
+    suggest candidates for symbols that could not be resolved by exact, previous or alias lookup.
+    Besides case-folding and the repair of symbols that spreadsheets turn into dates, the index holds an
+    inverted trigram index (one NumPy array of name positions per trigram), so that the similarity of a query
+    to all names is computed with one bincount.
+    """
+    # Gene symbols that spreadsheets turn into dates are month abbreviations followed by a number,
+    # e.g., MARCH1 -> 1-Mar, SEPT2 -> 2-Sep, DEC1 -> 1-Dec, OCT4 -> 4-Oct
+    MONTH_PREFIXES = {'JAN': ['JAN'], 'FEB': ['FEB'], 'MAR': ['MARCH', 'MARCHF', 'MAR'], 'APR': ['APR'],
+                      'MAY': ['MAY'], 'JUN': ['JUN'], 'JUL': ['JUL'], 'AUG': ['AUG'],
+                      'SEP': ['SEPT', 'SEPTIN', 'SEP'], 'OCT': ['OCT'], 'NOV': ['NOV'], 'DEC': ['DEC']}
+    _DAY_MONTH = re.compile(r'^0?(\d{1,2})[-/ ]([A-Za-z]{3})[A-Za-z]*(?:[-/ ]\d{2,4})?$')
+    _MONTH_DAY = re.compile(r'^([A-Za-z]{3})[A-Za-z]*[-/ ]0?(\d{1,2})$')
+
+    def __init__(self, entrez, synonym):
+        """
+        entrez and synonym are the symbol to NCBI Gene id and synonym to symbol dictionaries of the gene index
+        """
+        targets = {}
+        for symbol in entrez:
+            targets[symbol] = symbol
+        for name in synonym:
+            current = synonym.get(name)
+            if name not in targets and current != 'MULTIPLE':
+                targets[name] = current
+        self._names = list(targets.keys())
+        self._targets = [targets[name] for name in self._names]
+        self._upper = defaultdict(list)
+        for i, name in enumerate(self._names):
+            self._upper[name.upper()].append(i)
+        postings = defaultdict(list)
+        lengths = np.zeros(len(self._names), dtype=np.int32)
+        for i, name in enumerate(self._names):
+            grams = SymbolRescueIndex.trigrams(name)
+            lengths[i] = len(grams)
+            for g in grams:
+                postings[g].append(i)
+        self._postings = {g: np.array(rows, dtype=np.int32) for g, rows in postings.items()}
+        self._lengths = lengths
+
+    @staticmethod
+    def trigrams(s):
+        padded = '  ' + s.upper() + ' '
+        return set(padded[i:i + 3] for i in range(len(padded) - 2))
+
+    def _candidate(self, i, score, method):
+        return RescueCandidate(self._names[i], self._targets[i], score, method)
+
+    def repair_excel_date(self, symbol):
+        """
+        Returns the names (e.g., MARCH1) that a spreadsheet could have turned into the date symbol (e.g., 1-Mar)
+        """
+        m = SymbolRescueIndex._DAY_MONTH.match(symbol)
+        if m is not None:
+            day, month = m.group(1), m.group(2).upper()
+        else:
+            m = SymbolRescueIndex._MONTH_DAY.match(symbol)
+            if m is None:
+                return []
+            month, day = m.group(1).upper(), m.group(2)
+        names = []
+        for prefix in SymbolRescueIndex.MONTH_PREFIXES.get(month, []):
+            for i in self._upper.get(prefix + day, []):
+                names.append(i)
+        return names
+
+    def rescue(self, symbol, limit=5, min_score=0.5):
+        """
+        Returns up to limit RescueCandidates for symbol, best first. Candidates found by case-folding or date
+        repair come first; trigram candidates must have a similarity of at least min_score.
+        """
+        candidates = []
+        seen = set()
+        for i in self._upper.get(symbol.upper(), []):
+            if self._names[i] != symbol:
+                candidates.append(self._candidate(i, 1.0, RescueCandidate.CASE))
+        for i in self.repair_excel_date(symbol):
+            candidates.append(self._candidate(i, 1.0, RescueCandidate.EXCEL_DATE))
+        grams = SymbolRescueIndex.trigrams(symbol)
+        arrays = [self._postings[g] for g in grams if g in self._postings]
+        if len(arrays) > 0:
+            shared = np.bincount(np.concatenate(arrays), minlength=len(self._names))
+            # Dice >= min_score requires at least min_score * len(grams) / 2 shared trigrams
+            rows = np.flatnonzero(shared >= min_score * len(grams) / 2)
+            scores = 2.0 * shared[rows] / (len(grams) + self._lengths[rows])
+            order = np.argsort(-scores, kind='stable')
+            for i, score in zip(rows[order[:4 * limit]].tolist(), scores[order[:4 * limit]].tolist()):
+                if score < min_score:
+                    break
+                if self._names[i] != symbol:
+                    candidates.append(self._candidate(i, score, RescueCandidate.TRIGRAM))
+        unique = []
+        for c in candidates:
+            # several names of one gene can match; only keep the best one
+            if c.current_symbol not in seen:
+                seen.add(c.current_symbol)
+                unique.append(c)
+        return unique[:limit]
+
+    def __len__(self):
+        return len(self._names)
@@ -0,0 +1,248 @@
+import threading
+import time
+
+
+class SymbolResolution:
+    """
+    The result of resolving one gene symbol from a dataset against the gene index.
+    path records how the symbol was resolved: 'exact' (the symbol is a current symbol), 'previous' or 'alias'
+    (the symbol is a previous/alias symbol of exactly one gene), 'ambiguous' (the symbol is a previous/alias
+    symbol of more than one gene) or 'missing' (the symbol is unknown).
+    For ambiguous and missing symbols, current_symbol is the symbol itself and the ids are None.
+    """
+    EXACT = 'exact'
+    PREVIOUS = 'previous'
+    ALIAS = 'alias'
+    AMBIGUOUS = 'ambiguous'
+    MISSING = 'missing'
+    PATHS = (EXACT, PREVIOUS, ALIAS, AMBIGUOUS, MISSING)
+
+    def __init__(self, symbol, current_symbol, ncbigene_curie, ensembl_id, path):
+        self.symbol = symbol
+        self.current_symbol = current_symbol
+        self.ncbigene_curie = ncbigene_curie
+        self.ensembl_id = ensembl_id
+        self.path = path
+
+    def is_resolved(self):
+        return self.ncbigene_curie is not None
+
+    def __repr__(self):
+        return "%s -> %s (%s, %s, %s)" % (self.symbol, self.current_symbol, self.ncbigene_curie,
+                                          self.ensembl_id, self.path)
+
+
+class ResolutionReport:
+    """
+    The resolutions of a column of gene symbols. Each distinct symbol is resolved once, and the report can be
+    indexed by the original symbol. All symbols that could not be resolved are available together, so that a
+    parser can report every problem of an input file at once rather than failing on the first one.
+    """
+    def __init__(self, resolutions, rescue_index=None):
+        """
+        rescue_index is a function that returns a SymbolRescueIndex; if it is given, unresolved symbols get
+        rescue candidates (see get_candidates)
+        """
+        self._resolutions = resolutions
+        self._rescue_index = rescue_index
+
+    def __getitem__(self, symbol):
+        return self._resolutions[symbol]
+
+    def __contains__(self, symbol):
+        return symbol in self._resolutions
+
+    def __iter__(self):
+        return iter(self._resolutions.values())
+
+    def __len__(self):
+        return len(self._resolutions)
+
+    def get_unresolved(self):
+        return [r for r in self._resolutions.values() if not r.is_resolved()]
+
+    def get_counts(self):
+        """
+        Returns a dictionary with the number of distinct symbols per resolution path
+        """
+        counts = {path: 0 for path in SymbolResolution.PATHS}
+        for r in self._resolutions.values():
+            counts[r.path] += 1
+        return counts
+
+    def get_candidates(self, symbol, limit=5):
+        """
+        Returns a ranked list of RescueCandidates for an unresolved symbol (an empty list if the symbol was
+        resolved or if the report was created without rescue index)
+        """
+        if self._rescue_index is None or self._resolutions[symbol].is_resolved():
+            return []
+        return self._rescue_index().rescue(symbol, limit=limit)
+
+    def raise_if_unresolved(self, ignore=(), source=None):
+        """
+        Raise a ValueError that lists all ambiguous or missing symbols except for those in ignore
+        (e.g., pseudogenes or withdrawn symbols that a parser skips on purpose), together with the
+        best rescue candidates if the report has a rescue index
+        """
+        problems = [r for r in self.get_unresolved() if r.symbol not in ignore]
+        if len(problems) == 0:
+            return
+        where = "" if source is None else " in %s" % source
+        lines = []
+        for r in problems:
+            candidates = self.get_candidates(r.symbol, limit=3)
+            if len(candidates) == 0:
+                lines.append("%s (%s)" % (r.symbol, r.path))
+            else:
+                lines.append("%s (%s; candidates: %s)" % (r.symbol, r.path, ", ".join(map(repr, candidates))))
+        raise ValueError("Could not resolve %d gene symbol(s)%s: %s" % (len(problems), where, ", ".join(lines)))
+
+
+class ResolutionStats:
+    """
+    Number of cache hits and misses and the time (in seconds) spent resolving the missed symbols of one source
+    """
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.seconds = 0.0
+
+    def get_lookups(self):
+        return self.hits + self.misses
+
+    def get_hit_rate(self):
+        lookups = self.get_lookups()
+        return 0.0 if lookups == 0 else self.hits / lookups
+
+    def __repr__(self):
+        return "%d hits, %d misses, %.3f s" % (self.hits, self.misses, self.seconds)
+
+
+class ResolutionCache:
+    """
+    Bounded cache of SymbolResolution objects, shared by all parsers that use the same gene index. If the cache
+    is full, the oldest entries are evicted first. The cache also keeps ResolutionStats for each source (parser).
+    Lookups of cached symbols are plain dictionary lookups, so they are cheap enough for the per-row calls of
+    the parsers.
+    """
+    DEFAULT_MAXSIZE = 65536
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive but was %d" % maxsize)
+        self.maxsize = maxsize
+        self.entries = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+        self.rescue_index = None
+
+    def put(self, symbol, resolution):
+        with self._lock:
+            entries = self.entries
+            entries[symbol] = resolution
+            while len(entries) > self.maxsize:
+                del entries[next(iter(entries))]
+
+    def get_source_stats(self, source):
+        with self._lock:
+            stats = self._stats.get(source)
+            if stats is None:
+                stats = ResolutionStats()
+                self._stats[source] = stats
+            return stats
+
+    def get_stats(self):
+        """
+        Returns a dictionary from each source to its ResolutionStats
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self._stats.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class SymbolResolver:
+    """
+    Resolve gene symbols to current symbols, NCBI Gene CURIEs and Ensembl ids using the dictionaries of a gene
+    index (see HgncParser). If a ResolutionCache is passed, resolutions are memoized in the cache and the
+    lookups are counted for source.
+    """
+    _rescue_lock = threading.Lock()
+
+    def __init__(self, entrez, ensembl, synonym, cache=None, source=None):
+        self.entrez_dict = entrez
+        self.ensembl_dict = ensembl
+        self.synonym_dict = synonym
+        self.cache = cache
+        self.source = source
+        self.rescue_index = None
+        self._is_previous_symbol = getattr(synonym, 'is_previous_symbol', None)
+        if cache is not None:
+            self._entries = cache.entries
+            self._stats = cache.get_source_stats(source)
+
+    def resolve(self, symbol):
+        if self.cache is None:
+            return self._resolve(symbol)
+        resolution = self._entries.get(symbol)
+        if resolution is not None:
+            self._stats.hits += 1
+            return resolution
+        start = time.perf_counter()
+        resolution = self._resolve(symbol)
+        self.cache.put(symbol, resolution)
+        self._stats.misses += 1
+        self._stats.seconds += time.perf_counter() - start
+        return resolution
+
+    def _resolve(self, symbol):
+        if symbol in self.entrez_dict:
+            current = symbol
+            path = SymbolResolution.EXACT
+        else:
+            current = self.synonym_dict.get(symbol)
+            if current is None:
+                return SymbolResolution(symbol, symbol, None, None, SymbolResolution.MISSING)
+            elif current == 'MULTIPLE':
+                return SymbolResolution(symbol, symbol, None, None, SymbolResolution.AMBIGUOUS)
+            elif current not in self.entrez_dict:
+                return SymbolResolution(symbol, symbol, None, None, SymbolResolution.MISSING)
+            elif self._is_previous_symbol is not None and self._is_previous_symbol(symbol):
+                path = SymbolResolution.PREVIOUS
+            else:
+                path = SymbolResolution.ALIAS
+        curie = 'NCBIGene:%s' % self.entrez_dict.get(current)
+        ensembl = self.ensembl_dict.get(current)
+        return SymbolResolution(symbol, current, curie, ensembl, path)
+
+    def get_rescue_index(self):
+        """
+        Returns the SymbolRescueIndex for the dictionaries of this resolver. The index is built on first use
+        and is shared by all resolvers with the same ResolutionCache.
+        """
+        # imported here because the rescue index needs NumPy, which is slow to import
+        from .symbol_rescue import SymbolRescueIndex
+        holder = self if self.cache is None else self.cache
+        with self._rescue_lock:
+            if holder.rescue_index is None:
+                holder.rescue_index = SymbolRescueIndex(self.entrez_dict, self.synonym_dict)
+            return holder.rescue_index
+
+    def resolve_symbols(self, symbols, rescue=False):
+        """
+        Resolve an iterable of symbols (e.g., one column of a supplementary table) and return a
+        ResolutionReport. Repeated symbols are only resolved once. If rescue is True, the report suggests
+        candidates for unresolved symbols (see SymbolRescueIndex); the rescue index is only built if needed.
+        """
+        resolutions = {}
+        for symbol in symbols:
+            if symbol not in resolutions:
+                resolutions[symbol] = self.resolve(symbol)
+        return ResolutionReport(resolutions, self.get_rescue_index if rescue else None)
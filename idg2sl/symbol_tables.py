@@ -0,0 +1,174 @@
+import sys
+from array import array
+from collections.abc import Mapping
+
+
+class SymbolIndex:
+    """
+    The approved gene symbols, interned and kept in a tuple, with a dictionary from each symbol to its position.
+    The index uses a hash table of Python strings, because lookups of approved symbols are by far the most
+    frequent operation of the parsers.
+    """
+    def __init__(self, symbols):
+        self._symbols = tuple(sys.intern(s) for s in symbols)
+        self._rows = {s: i for i, s in enumerate(self._symbols)}
+
+    def find(self, s):
+        """
+        Returns the position of s in the index or -1 if s is not an approved symbol
+        """
+        return self._rows.get(s, -1)
+
+    def __getitem__(self, i):
+        return self._symbols[i]
+
+    def __len__(self):
+        return len(self._symbols)
+
+    def __iter__(self):
+        return iter(self._symbols)
+
+    def to_sections(self):
+        return self._symbols,
+
+
+class FrozenIdMap(Mapping):
+    """
+    Read-only mapping from an approved gene symbol to an identifier such as an NCBI Gene id ('1956') or an
+    Ensembl gene id ('ENSG00000146648'). The symbols are kept in a SymbolIndex, the identifiers are stored as
+    integers in a typed array and are formatted with template when they are first looked up. Symbols without
+    identifier are stored as 0 and map to the empty string; the rare identifiers that cannot be reproduced by
+    the template are kept as strings in exceptions.
+    The formatted identifiers are kept (in a list with one slot per symbol), so that repeated lookups of a
+    symbol cost as much as a dictionary lookup, and the map only grows by the identifiers that are used.
+    """
+    def __init__(self, symbols, ids, exceptions, template):
+        self._symbols = symbols
+        self._find = symbols.find
+        self._ids = ids
+        self._exceptions = exceptions
+        self._template = template
+        self._formatted = [None] * len(ids)
+
+    @staticmethod
+    def from_strings(symbols, values, template):
+        """
+        Encode the identifiers in values (one per entry of the SymbolIndex symbols) into a FrozenIdMap
+        """
+        prefix = template.split('%', 1)[0]
+        ids = array('q', [0]) * len(values)
+        exceptions = {}
+        for i, value in enumerate(values):
+            if value == '':
+                continue
+            digits = value[len(prefix):]
+            if value.startswith(prefix) and digits.isdigit() and template % int(digits) == value:
+                ids[i] = int(digits)
+            else:
+                ids[i] = -1
+                exceptions[i] = value
+        return FrozenIdMap(symbols, ids, exceptions, template)
+
+    def _format(self, i):
+        n = self._ids[i]
+        if n > 0:
+            value = self._template % n
+        elif n == 0:
+            value = ''
+        else:
+            value = self._exceptions[i]
+        self._formatted[i] = value
+        return value
+
+    def __getitem__(self, symbol):
+        i = self._find(symbol)
+        if i < 0:
+            raise KeyError(symbol)
+        value = self._formatted[i]
+        return self._format(i) if value is None else value
+
+    def get(self, symbol, default=None):
+        i = self._find(symbol)
+        if i < 0:
+            return default
+        value = self._formatted[i]
+        return self._format(i) if value is None else value
+
+    def __contains__(self, symbol):
+        return self._find(symbol) >= 0
+
+    def __iter__(self):
+        return iter(self._symbols)
+
+    def __len__(self):
+        return len(self._symbols)
+
+    def get_int(self, symbol, default=None):
+        """
+        Returns the identifier as an integer (e.g., 1956 for EGFR) or default if the symbol is unknown
+        or has no numeric identifier
+        """
+        i = self._find(symbol)
+        if i < 0 or self._ids[i] <= 0:
+            return default
+        return self._ids[i]
+
+    def to_sections(self):
+        return self._ids, self._exceptions
+
+
+class FrozenSynonymMap(Mapping):
+    """
+    Read-only mapping from a previous or alias symbol to the current approved symbol, or to 'MULTIPLE' if the
+    synonym is used for more than one gene. The synonyms are kept in a plain dictionary whose values are the
+    interned symbols of the SymbolIndex, so that a lookup costs one dictionary lookup and the values take no
+    memory of their own. The previous (rather than alias) symbols are kept in a frozenset.
+    On disk, the map is stored as the list of synonyms, the position of the current symbol of each synonym in
+    the SymbolIndex (targets, -1 for ambiguous synonyms) and whether it is a previous symbol (1) or an alias
+    (0) (kinds).
+    """
+    MULTIPLE = 'MULTIPLE'
+
+    def __init__(self, symbols, synonyms, targets, kinds):
+        self._symbols = symbols
+        synonyms = list(synonyms)
+        self._synonyms = {s: symbols[row] if row >= 0 else FrozenSynonymMap.MULTIPLE
+                          for s, row in zip(synonyms, targets)}
+        self._previous_symbols = frozenset(s for s, kind in zip(synonyms, kinds) if kind == 1)
+
+    @staticmethod
+    def from_dict(symbols, synonym2row, previous_symbols=()):
+        """
+        synonym2row maps each synonym to the position of its gene in symbols, or to -1 for ambiguous synonyms.
+        previous_symbols is the set of synonyms that are previous (rather than alias) symbols
+        """
+        kinds = bytes(1 if s in previous_symbols else 0 for s in synonym2row)
+        return FrozenSynonymMap(symbols, synonym2row.keys(), synonym2row.values(), kinds)
+
+    def __getitem__(self, synonym):
+        return self._synonyms[synonym]
+
+    def get(self, synonym, default=None):
+        return self._synonyms.get(synonym, default)
+
+    def is_previous_symbol(self, synonym):
+        """
+        Returns True if synonym is a previous symbol of a gene (rather than an alias)
+        """
+        return synonym in self._previous_symbols
+
+    def __contains__(self, synonym):
+        return synonym in self._synonyms
+
+    def __iter__(self):
+        return iter(self._synonyms)
+
+    def __len__(self):
+        return len(self._synonyms)
+
+    def to_sections(self):
+        synonyms = list(self._synonyms)
+        targets = array('i', [-1 if symbol is FrozenSynonymMap.MULTIPLE else self._symbols.find(symbol)
+                              for symbol in self._synonyms.values()])
+        kinds = bytes(1 if s in self._previous_symbols else 0 for s in synonyms)
+        return synonyms, targets, kinds
@@ -1,12 +1,30 @@
+import itertools
+import inspect
+import operator
+import sys
 from .parsers.sl_constants import SlConstants
 
+
+def _share(value):
+    # One shared copy of each string value of the categorical fields; interned strings are freed when the last
+    # record that uses them is gone. Other values (e.g., a numeric PubMed id) are kept as they are.
+    return sys.intern(value) if value.__class__ is str else value
+
+
 class SyntheticLethalInteraction:
     """
     Instances of this class represent a single synthetic lethality (SL) interaction
     together with data about the experiment that was used to show the SL. A series
     of ingest scripts will transform the data of each of the ca. 30 published
     experiments to this common datastructure
+    The attributes are stored in slots (there is no per-instance __dict__), and the values of the categorical
+    fields (perturbations, effect type, assay, cell line, cancer, PubMed id, ...) are interned, so that the
+    records of a large screen share one copy of each of these strings.
     """
+    __slots__ = ('gene_A_symbol', 'gene_A_id', 'gene_B_symbol', 'gene_B_id', 'gene_A_pert', 'gene_B_pert',
+                 'assay', 'pmid', 'species_id', 'cell_line', 'cellosaurus_id', 'cancer_type', 'ncit_id',
+                 'effect_type', 'effect_size', '_background_dependency_status',
+                 '_background_dependency_gene_symbol', '_background_dependency_gene_id', 'SL', 'maximum_value')
 
     def __init__(self,
                  gene_A_symbol=None,
@@ -29,59 +47,177 @@ class SyntheticLethalInteraction:
                  background_dependency_gene_id=SlConstants.N_A,
                  SL=None):
         """
-
+        The required arguments are checked, and all problems are reported together in a single ValueError
         """
-        if gene_A_symbol is None:
-            raise ValueError("Need to pass gene A")
-        if gene_A_id is None:
-            raise ValueError("Need to pass gene A id")
-        if not gene_A_id.startswith("NCBIGene:"):
-            print("Error Gene A id (%s) did not start with NCBIGene" % gene_A_id)
-            raise("Error Gene A id (%s) did not start with NCBIGene" % gene_A_id)
-        if gene_B_symbol is None:
-            raise ValueError("Need to pass gene B")
-        if gene_B_id is None:
-            raise ValueError("Need to pass gene B id")
-        if not gene_B_id.startswith("NCBIGene:"):
-            raise ValueError("Error Gene B id (%s) did not start with NCBIGene" % gene_B_id)
-        if gene_A_pert is None:
-            raise ValueError("Need to pass gene A perturbation")
-        if gene_B_pert is None:
-            raise ValueError("Need to pass gene B perturbation")
-        if assay is None:
-            raise ValueError("Need to pass assay")
-        if pmid is None:
-            raise ValueError("Need to pass pmid")
-        if SL is None:
-            raise ValueError("Need to pass True or False for SL")
-        if gene_A_id == gene_B_id:
-            raise ValueError("Self loops not allowed -- you passed the same gene ID for gene A and gene B (%s/%s)" % (gene_B_symbol, gene_B_id))
+        if (gene_A_symbol is None or gene_A_id is None or gene_B_symbol is None or gene_B_id is None
+                or gene_A_pert is None or gene_B_pert is None or assay is None or pmid is None or SL is None
+                or not gene_A_id.startswith("NCBIGene:") or not gene_B_id.startswith("NCBIGene:")
+                or gene_A_id == gene_B_id):
+            errors = SyntheticLethalInteraction._get_errors(gene_A_symbol, gene_A_id, gene_B_symbol, gene_B_id,
+                                                            gene_A_pert, gene_B_pert, assay, pmid, SL)
+            raise ValueError("Could not create the interaction: " + "; ".join(errors))
         self.gene_A_symbol = gene_A_symbol
         self.gene_A_id = gene_A_id
         self.gene_B_symbol = gene_B_symbol
         self.gene_B_id = gene_B_id
-        self.gene_A_pert = gene_A_pert
-        self.gene_B_pert = gene_B_pert
-        self.assay = assay
-        self.pmid = pmid
-        # The cell line data is not obligatory. If it is not passed, set it to the empty string
-        self.species_id = species_id
-        self.cell_line = cell_line
-        self.cellosaurus_id = cellosaurus_id
-        self.cancer_type = cancer_type
-        self.ncit_id = ncit_id
+        self.gene_A_pert = _share(gene_A_pert)
+        self.gene_B_pert = _share(gene_B_pert)
+        self.assay = _share(assay)
+        self.pmid = _share(pmid)
+        # The cell line data is not obligatory. If it is not passed, it is the empty string
+        self.species_id = _share(species_id)
+        self.cell_line = _share(cell_line)
+        self.cellosaurus_id = _share(cellosaurus_id)
+        self.cancer_type = _share(cancer_type)
+        self.ncit_id = _share(ncit_id)
         if effect_type is None or effect_size is None:
             self.effect_type = ""
             self.effect_size = ""
         else:
-            self.effect_type = effect_type
+            self.effect_type = _share(effect_type)
             self.effect_size = effect_size
-        self._background_dependency_status = background_dependency_status
-        self._background_dependency_gene_symbol = background_dependency_gene_symbol
-        self._background_dependency_gene_id = background_dependency_gene_id
-        self.SL = SL # True: synthetic lethal, False: negative control
+        self._background_dependency_status = _share(background_dependency_status)
+        self._background_dependency_gene_symbol = _share(background_dependency_gene_symbol)
+        self._background_dependency_gene_id = _share(background_dependency_gene_id)
+        self.SL = SL  # True: synthetic lethal, False: negative control
         self.maximum_value = False
 
+    @staticmethod
+    def _get_errors(gene_A_symbol, gene_A_id, gene_B_symbol, gene_B_id, gene_A_pert, gene_B_pert, assay, pmid, SL):
+        """
+        Returns the problems of the required arguments of one interaction (the messages of _check_columns for a
+        batch without columns)
+        """
+        values = {'gene_A_symbol': gene_A_symbol, 'gene_A_id': gene_A_id, 'gene_B_symbol': gene_B_symbol,
+                  'gene_B_id': gene_B_id, 'gene_A_pert': gene_A_pert, 'gene_B_pert': gene_B_pert, 'assay': assay,
+                  'pmid': pmid, 'SL': SL}
+        return SyntheticLethalInteraction._check_columns({}, values)
+
+    # the arguments of the constructor with their defaults (None for the required arguments), in the order of
+    # the constructor and of _assign
+    _DEFAULTS = {name: parameter.default for name, parameter in inspect.signature(__init__).parameters.items()
+                 if name != 'self'}
+    _FIELDS = tuple(_DEFAULTS)
+    _REQUIRED = ('gene_A_symbol', 'gene_A_id', 'gene_B_symbol', 'gene_B_id', 'gene_A_pert', 'gene_B_pert', 'assay',
+                 'pmid', 'SL')
+    # the fields that are interned
+    _CATEGORICAL = tuple(name for name in _FIELDS if name not in ('gene_A_symbol', 'gene_A_id', 'gene_B_symbol',
+                                                                  'gene_B_id', 'effect_size', 'SL'))
+
+    @staticmethod
+    def _assign(sli, gene_A_symbol, gene_A_id, gene_B_symbol, gene_B_id, gene_A_pert, gene_B_pert, effect_type,
+                effect_size, species_id, cell_line, cellosaurus_id, cancer_type, ncit_id, assay, pmid,
+                background_dependency_status, background_dependency_gene_symbol, background_dependency_gene_id, SL):
+        """
+        Stores the (checked and interned) arguments of the constructor in the slots of sli and returns sli, as the
+        constructor does (from_columns, which checks the arguments of a whole batch at once)
+        """
+        sli.gene_A_symbol = gene_A_symbol
+        sli.gene_A_id = gene_A_id
+        sli.gene_B_symbol = gene_B_symbol
+        sli.gene_B_id = gene_B_id
+        sli.gene_A_pert = gene_A_pert
+        sli.gene_B_pert = gene_B_pert
+        sli.assay = assay
+        sli.pmid = pmid
+        # The cell line data is not obligatory. If it is not passed, it is the empty string
+        sli.species_id = species_id
+        sli.cell_line = cell_line
+        sli.cellosaurus_id = cellosaurus_id
+        sli.cancer_type = cancer_type
+        sli.ncit_id = ncit_id
+        if effect_type is None or effect_size is None:
+            sli.effect_type = ""
+            sli.effect_size = ""
+        else:
+            sli.effect_type = effect_type
+            sli.effect_size = effect_size
+        sli._background_dependency_status = background_dependency_status
+        sli._background_dependency_gene_symbol = background_dependency_gene_symbol
+        sli._background_dependency_gene_id = background_dependency_gene_id
+        sli.SL = SL  # True: synthetic lethal, False: negative control
+        sli.maximum_value = False
+        return sli
+
+    @staticmethod
+    def from_columns(columns, **fields):
+        """
+        Create a batch of interactions at once. columns is a dictionary from an argument of the constructor to a
+        list with one value per interaction, and fields are arguments with the same value for all interactions
+        (the defaults of the constructor are used for the other arguments), e.g.,
+            from_columns({'gene_B_symbol': symbols, 'gene_B_id': ids, 'effect_size': zscores, 'SL': sl},
+                         gene_A_symbol='KRAS', gene_A_id=SlConstants.KRAS_GENE_ID, ...)
+        The checks of the constructor are applied to whole columns, and all problems are reported together in a
+        single ValueError. The interactions are then created without checking each one again.
+        """
+        values = dict(SyntheticLethalInteraction._DEFAULTS)
+        values.update(fields)
+        errors = SyntheticLethalInteraction._check_columns(columns, values)
+        if len(errors) > 0:
+            raise ValueError("Could not create the interactions:\n - " + "\n - ".join(errors))
+        n = len(next(iter(columns.values()))) if len(columns) > 0 else 0
+        field_values = []
+        for name in SyntheticLethalInteraction._FIELDS:
+            is_categorical = name in SyntheticLethalInteraction._CATEGORICAL
+            if name in columns:
+                field_values.append(map(_share, columns[name]) if is_categorical else columns[name])
+            else:
+                value = values[name]
+                field_values.append(itertools.repeat(_share(value) if is_categorical else value, n))
+        assign = SyntheticLethalInteraction._assign
+        new = object.__new__
+        cls = SyntheticLethalInteraction
+        return [assign(new(cls), *row) for row in zip(*field_values)]
+
+    @staticmethod
+    def _check_columns(columns, values, max_rows=10):
+        """
+        Returns a list with the problems of a batch of from_columns (empty if the batch is valid)
+        """
+        errors = []
+        unknown = set(columns).union(values).difference(SyntheticLethalInteraction._FIELDS)
+        if len(unknown) > 0:
+            errors.append("unknown argument(s) %s" % ", ".join(sorted(unknown)))
+        if len(columns) > 0:
+            lengths = {name: len(column) for name, column in columns.items()}
+            if len(set(lengths.values())) > 1:
+                errors.append("the columns have different lengths (%s)" %
+                              ", ".join("%s: %d" % item for item in lengths.items()))
+                return errors
+
+        def get_rows(column, is_invalid):
+            rows = [i for i, value in enumerate(column) if is_invalid(value)]
+            suffix = ", ..." if len(rows) > max_rows else ""
+            return "%d row(s) (%s%s)" % (len(rows), ", ".join(map(str, rows[:max_rows])), suffix)
+
+        for name in SyntheticLethalInteraction._REQUIRED:
+            column = columns.get(name)
+            if column is None:
+                if values.get(name) is None:
+                    errors.append("%s is required" % name)
+            elif None in column:
+                # the membership test runs in C; the rows are only searched if there is a problem
+                errors.append("%s is None in %s" % (name, get_rows(column, lambda v: v is None)))
+        for name in ('gene_A_id', 'gene_B_id'):
+            column = columns.get(name)
+            # each distinct id is checked once
+            distinct = (values.get(name),) if column is None else set(column)
+            invalid = {v for v in distinct if v is not None and not (v.__class__ is str and v.startswith("NCBIGene:"))}
+            if len(invalid) > 0:
+                rows = "all rows" if column is None else get_rows(column, invalid.__contains__)
+                errors.append("%s does not start with NCBIGene: in %s (e.g., %s)" % (name, rows, next(iter(invalid))))
+        if 'gene_A_id' in columns or 'gene_B_id' in columns:
+            n = len(next(iter(columns.values())))
+            ids_A = columns.get('gene_A_id', itertools.repeat(values.get('gene_A_id'), n))
+            ids_B = columns.get('gene_B_id', itertools.repeat(values.get('gene_B_id'), n))
+            self_loops = list(map(operator.eq, ids_A, ids_B))
+            if True in self_loops:
+                errors.append("self loops (the same gene ID for gene A and gene B) in %s" %
+                              get_rows(self_loops, bool))
+        elif values.get('gene_A_id') is not None and values.get('gene_A_id') == values.get('gene_B_id'):
+            errors.append("self loops (the same gene ID for gene A and gene B) in all rows")
+        return errors
+
     def get_gene_A_symbol(self):
         return self.gene_A_symbol
 
@@ -127,6 +263,15 @@ class SyntheticLethalInteraction:
     def get_effect_size(self):
         return self.effect_size
 
+    def get_background_dependency_status(self):
+        return self._background_dependency_status
+
+    def get_background_dependency_gene_symbol(self):
+        return self._background_dependency_gene_symbol
+
+    def get_background_dependency_gene_id(self):
+        return self._background_dependency_gene_id
+
     def set_maximum(self):
         self.maximum_value = True
 
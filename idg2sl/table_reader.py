@@ -0,0 +1,121 @@
+import csv
+import warnings
+from operator import itemgetter
+from .compressed_input import CompressedInput
+
+
+class TableReader:
+    """
+    Read selected columns of a delimited file with a header line. The header names are resolved to column
+    indexes once, and each row is returned as a tuple with the selected fields (in the order of columns),
+    so that no dictionary is allocated per row as with csv.DictReader. As with csv.DictReader, blank lines are
+    skipped and missing trailing fields are returned as None.
+    If n_fields is given, a ValueError is raised if the header does not have n_fields columns or if a row has
+    more fields than the header.
+    Compressed files are read transparently (see CompressedInput).
+    """
+    def __init__(self, fname, columns, delimiter='\t', n_fields=None, open_function=CompressedInput.open):
+        self.fname = fname
+        self.columns = tuple(columns)
+        self.delimiter = delimiter
+        self.n_fields = n_fields
+        self._open = open_function
+        with self._open(fname) as f:
+            header = next(csv.reader(f, delimiter=delimiter), [])
+        self.header = header
+        if n_fields is not None and len(header) != n_fields:
+            raise ValueError("%s has %d columns (should have %d): %s" % (fname, len(header), n_fields, header))
+        missing = [c for c in self.columns if c not in header]
+        if len(missing) > 0:
+            raise ValueError("Could not find column(s) %s in %s (header: %s)" % (missing, fname, header))
+        self.indexes = tuple(header.index(c) for c in self.columns)
+
+    def __iter__(self):
+        indexes = self.indexes
+        width = max(indexes) + 1
+        n_header = len(self.header)
+        check_extra = self.n_fields is not None
+        if len(indexes) == 1:
+            i = indexes[0]
+
+            def getter(r):
+                return r[i],
+        else:
+            getter = itemgetter(*indexes)
+        with self._open(self.fname) as f:
+            reader = csv.reader(f, delimiter=self.delimiter)
+            next(reader, None)
+            for row in reader:
+                n = len(row)
+                if n < width:
+                    if n == 0:
+                        continue
+                    row = row + [None] * (width - n)
+                elif check_extra and n > n_header:
+                    raise ValueError("Line %d of %s has %d fields (should have %d): %s" %
+                                     (reader.line_num, self.fname, n, n_header, row))
+                yield getter(row)
+
+    def read_columns(self, numeric=()):
+        """
+        Read all selected columns at once. Returns a dictionary from column name to a NumPy float array for the
+        columns in numeric and to a list of strings for the other columns.
+        The table is parsed by numpy.loadtxt, which splits the lines and converts the numeric columns in C. If
+        loadtxt rejects the table (e.g., because a row has missing fields or a numeric field is not a number),
+        the rows are read with the csv module instead, so that the values and errors are the same as with
+        iteration.
+        """
+        # NumPy is only imported here because it dominates the import time of the package
+        import numpy as np
+        try:
+            return self._load_columns(np, numeric)
+        except ValueError:
+            pass
+        values = list(zip(*self))
+        if len(values) == 0:
+            values = [()] * len(self.columns)
+        columns = {}
+        for name, column in zip(self.columns, values):
+            if name in numeric:
+                columns[name] = np.fromiter(map(float, column), dtype=np.float64, count=len(column))
+            else:
+                columns[name] = list(column)
+        return columns
+
+    def _load_columns(self, np, numeric):
+        # With n_fields, all columns are loaded, so that loadtxt rejects rows with a different number of fields
+        usecols = range(len(self.header)) if self.n_fields is not None else sorted(set(self.indexes))
+        dtype = [('f%d' % i, np.float64 if self.header[i] in numeric and i in self.indexes else object)
+                 for i in usecols]
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')  # loadtxt warns about tables without rows
+            with self._open(self.fname) as f:
+                table = np.loadtxt(f, delimiter=self.delimiter, skiprows=1, usecols=usecols, dtype=dtype,
+                                   comments=None, quotechar='"', ndmin=1)
+        columns = {}
+        for name, i in zip(self.columns, self.indexes):
+            if name in numeric:
+                columns[name] = np.ascontiguousarray(table['f%d' % i])
+            else:
+                columns[name] = table['f%d' % i].tolist()
+        return columns
+
+    @staticmethod
+    def select_rows(columns, names, mask=None):
+        """
+        Returns the rows of columns (as returned by read_columns) for which the boolean NumPy array mask is True
+        (all rows if mask is None), as tuples with the values of the columns in names. NumPy values are converted
+        to Python floats and bools, so that the thresholds of a study can be applied to whole columns as
+        vectorized masks and only the rows that pass are materialized as Python objects.
+        """
+        import numpy as np
+        n = len(columns[names[0]]) if len(names) > 0 else 0
+        indexes = np.arange(n) if mask is None else np.flatnonzero(mask)
+        selected = []
+        for name in names:
+            column = columns[name]
+            if isinstance(column, np.ndarray):
+                selected.append(column[indexes].tolist())
+            else:
+                selected.append([column[i] for i in indexes.tolist()])
+        return list(zip(*selected))
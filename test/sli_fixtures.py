@@ -0,0 +1,14 @@
+from idg2sl import SyntheticLethalInteraction
+from idg2sl import SlConstants
+
+
+def make_sli(geneA, geneA_id, geneB, geneB_id, effect_type, effect_size, pmid='1', SL=True, cell_line='', assay=None):
+    """
+    Returns an siRNA interaction of two genes for the tests (by default an SL from PubMed id 1 with an RNA
+    interference assay)
+    """
+    return SyntheticLethalInteraction(gene_A_symbol=geneA, gene_A_id=geneA_id, gene_B_symbol=geneB,
+                                      gene_B_id=geneB_id, gene_A_pert=SlConstants.SI_RNA,
+                                      gene_B_pert=SlConstants.SI_RNA, effect_type=effect_type,
+                                      effect_size=effect_size, cell_line=cell_line,
+                                      assay=assay or SlConstants.RNA_INTERFERENCE_ASSAY, pmid=pmid, SL=SL)
@@ -0,0 +1,72 @@
+from unittest import TestCase
+import contextlib
+import io
+import os.path
+import sys
+import tempfile
+from idg2sl.build_graph import BuildGraph, BuildStage
+
+# copies the file argv[1] to argv[2] and appends a line to the log file build.log
+COPY = "import sys; open(sys.argv[2], 'w').write(open(sys.argv[1]).read()); open('build.log', 'a').write(sys.argv[2] + '\\n')"
+
+
+class TestBuildGraph(TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+        self.write('input.txt', 'A\n')
+        self.write('config.yaml', 'x: 1\n')
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def write(self, fname, text):
+        with open(os.path.join(self.root, fname), 'w') as f:
+            f.write(text)
+
+    def get_graph(self):
+        graph = BuildGraph(self.root)
+        graph.add_stage(BuildStage('first', ['input.txt', '*.yaml'], ['first.txt'],
+                                   [sys.executable, '-c', COPY, 'input.txt', 'first.txt']))
+        graph.add_stage(BuildStage('second', ['first.txt'], ['second.txt'],
+                                   [sys.executable, '-c', COPY, 'first.txt', 'second.txt']))
+        return graph
+
+    def build(self, *args, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return [stage.name for stage in self.get_graph().build(*args, **kwargs)]
+
+    def test_only_stale_stages_are_rebuilt(self):
+        self.assertEqual(['first', 'second'], self.build())
+        self.assertEqual([], self.build())
+        # a change of the configuration reruns the first stage, but its output did not change
+        self.write('config.yaml', 'x: 2\n')
+        self.assertEqual(['first'], self.build())
+        self.write('input.txt', 'B\n')
+        self.assertEqual(['first', 'second'], self.build())
+        os.remove(os.path.join(self.root, 'second.txt'))
+        self.assertEqual(['second'], self.build(['second.txt']))
+        with open(os.path.join(self.root, 'build.log')) as f:
+            self.assertEqual(6, len(f.readlines()))
+
+    def test_dry_run(self):
+        self.build()
+        self.write('input.txt', 'B\n')
+        plan = self.get_graph().get_plan(['second'])
+        self.assertEqual(['first', 'second'], [stage.name for stage, _ in plan])
+        self.assertEqual(['input.txt changed'], plan[0][1])
+        self.assertEqual(['first will be rebuilt'], plan[1][1])
+        self.assertEqual(['first', 'second'], self.build(dry_run=True))
+        with open(os.path.join(self.root, 'first.txt')) as f:
+            self.assertEqual('A\n', f.read())
+
+    def test_invalid_graphs(self):
+        graph = self.get_graph()
+        with self.assertRaises(ValueError):
+            graph.add_stage(BuildStage('third', ['input.txt'], ['first.txt'], ['true']))
+        with self.assertRaises(ValueError):
+            graph.get_stage('unknown.txt')
+        graph.add_stage(BuildStage('failing', ['input.txt'], ['failing.txt'], [sys.executable, '-c', 'exit(1)']))
+        with self.assertRaises(ValueError):
+            with contextlib.redirect_stdout(io.StringIO()):
+                graph.build(['failing'])
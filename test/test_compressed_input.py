@@ -0,0 +1,52 @@
+from unittest import TestCase
+import bz2
+import gzip
+import lzma
+import os.path
+import tempfile
+from idg2sl.compressed_input import CompressedInput
+from idg2sl.table_reader import TableReader
+from idg2sl.sl_dataset_parser import SL_DatasetParser
+
+
+class TestCompressedInput(TestCase):
+    """
+    This class tests that the TableReader reads compressed versions of an input file transparently
+    """
+    def setUp(self) -> None:
+        self.inputfile = os.path.join(os.path.dirname(__file__), 'data', 'steckel-2012-small.tsv')
+        with open(self.inputfile) as f:
+            self.text = f.read()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        # the parsers refer to the plain file name, only the compressed file exists
+        self.fname = os.path.join(self.tmpdir.name, 'steckel.tsv')
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_compressed_tables(self):
+        columns = ['GeneID', 'D.Z-score']
+        expected = list(TableReader(self.inputfile, columns, n_fields=6))
+        for suffix, module in (('.gz', gzip), ('.bz2', bz2), ('.xz', lzma)):
+            with module.open(self.fname + suffix, 'wt') as f:
+                f.write(self.text)
+            self.assertEqual(self.fname + suffix, CompressedInput.find(self.fname))
+            self.assertEqual(expected, list(TableReader(self.fname, columns, n_fields=6)))
+            values = TableReader(self.fname, columns, n_fields=6).read_columns(numeric=['D.Z-score'])
+            self.assertAlmostEqual(7.28, values['D.Z-score'][0])
+            os.remove(self.fname + suffix)
+
+    def test_plain_file_is_preferred(self):
+        with open(self.fname, 'w') as f:
+            f.write(self.text)
+        with gzip.open(self.fname + '.gz', 'wt') as f:
+            f.write('GeneID\n')
+        self.assertEqual(self.fname, CompressedInput.find(self.fname))
+        self.assertEqual(20, len(list(TableReader(self.fname, ['GeneID']))))
+
+    def test_missing_file(self):
+        self.assertIsNone(CompressedInput.find(self.fname))
+        with self.assertRaises(FileNotFoundError):
+            TableReader(self.fname, ['GeneID'])
+        with self.assertRaises(ValueError):
+            SL_DatasetParser(fname=self.fname, pmid='1')
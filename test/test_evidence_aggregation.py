@@ -0,0 +1,76 @@
+from unittest import TestCase
+from idg2sl import SlConstants
+from idg2sl.evidence_aggregation import EvidenceAggregator, EvidenceReducer, EvidenceSummary
+from idg2sl.gene_pair import GenePair
+from .sli_fixtures import make_sli
+
+
+class TestEvidenceAggregator(TestCase):
+    def test_largest_absolute_effect_is_maximum(self):
+        aggregator = EvidenceAggregator()
+        pair = GenePair('A1CF', 'A2M')
+        slis = [make_sli('A1CF', 'NCBIGene:29974', 'A2M', 'NCBIGene:2', SlConstants.ZSCORE, z)
+                for z in (1.5, -4.0, 3.0, 4.0)]
+        for sli in slis:
+            aggregator.add(pair, sli)
+        sli_list = aggregator.mark_maximum_entries()
+        self.assertEqual([-4.0, 1.5, 3.0, 4.0], [sli.get_effect_size() for sli in sli_list])
+        self.assertEqual([True, False, False, False], [sli.is_maximum() for sli in sli_list])
+        summary = aggregator.get_summary(pair)
+        self.assertEqual(4, summary.count)
+        self.assertAlmostEqual(1.125, summary.get_mean())
+
+    def test_smaller_pvalues_and_qvalues_are_better(self):
+        aggregator = EvidenceAggregator()
+        pair = GenePair('A1CF', 'A2M')
+        for q in (0.2, 0.01, 0.5):
+            aggregator.add(pair, make_sli('A1CF', 'NCBIGene:29974', 'A2M', 'NCBIGene:2', SlConstants.QVAL, q))
+        summary = aggregator.get_summary(pair)
+        self.assertEqual(0.01, summary.best.get_effect_size())
+        self.assertEqual(0.01, summary.min_qvalue)
+        self.assertIsNone(summary.min_pvalue)
+
+    def test_non_numeric_effects(self):
+        aggregator = EvidenceAggregator()
+        pair = GenePair('A1CF', 'A2M')
+        aggregator.add(pair, make_sli('A1CF', 'NCBIGene:29974', 'A2M', 'NCBIGene:2', 'confidence.80%', 'true'))
+        aggregator.add(pair, make_sli('A1CF', 'NCBIGene:29974', 'A2M', 'NCBIGene:2', SlConstants.N_A, SlConstants.N_A))
+        self.assertEqual('true', aggregator.get_summary(pair).best.get_effect_size())
+        self.assertIsNone(aggregator.get_summary(pair).get_mean())
+        aggregator.add(pair, make_sli('A1CF', 'NCBIGene:29974', 'A2M', 'NCBIGene:2', SlConstants.ZSCORE, -0.5))
+        self.assertEqual(-0.5, aggregator.get_summary(pair).best.get_effect_size())
+        self.assertIsNone(EvidenceAggregator.get_numeric_effect(float('nan')))
+        self.assertEqual(2.5, EvidenceAggregator.get_numeric_effect('2.5'))
+
+    def test_best_index_agrees_with_the_scores(self):
+        effects = [(SlConstants.N_A, SlConstants.N_A), (SlConstants.ZSCORE, float('nan')), (SlConstants.PVAL, 0.2),
+                   (SlConstants.ZSCORE, -0.1), (SlConstants.PVAL, 0.01), ('confidence.80%', 'true'),
+                   (SlConstants.QVAL, '0.01'), (SlConstants.ZSCORE, 0.3)]
+        slis = [make_sli('A1CF', 'NCBIGene:29974', 'A2M', 'NCBIGene:2', effect_type, effect_size)
+                for effect_type, effect_size in effects]
+        for n in range(1, len(slis) + 1):
+            scores = [EvidenceAggregator.get_score(sli) for sli in slis[:n]]
+            self.assertEqual(scores.index(max(scores)), EvidenceAggregator.get_best_index(slis[:n]))
+        sli_list = EvidenceAggregator.mark_maximum_in_groups([slis])
+        self.assertIs(slis[7], sli_list[0])
+        self.assertEqual(slis[:7], sli_list[1:])
+
+    def test_custom_reducers(self):
+        class PositiveCount(EvidenceReducer):
+            def __init__(self):
+                self.n = 0
+
+            def add(self, sli, value):
+                self.n += sli.is_positive_SLI()
+
+            def get_result(self):
+                return self.n
+        reducers = dict(EvidenceSummary.DEFAULT_REDUCERS, positives=PositiveCount)
+        aggregator = EvidenceAggregator(reducers=reducers)
+        pair = GenePair('A1CF', 'A2M')
+        for z in (1.0, -2.0):
+            aggregator.add(pair, make_sli('A1CF', 'NCBIGene:29974', 'A2M', 'NCBIGene:2', SlConstants.ZSCORE, z))
+        summary = aggregator.get_summary(pair)
+        self.assertEqual(2, summary.get('positives'))
+        self.assertEqual(-2.0, summary.best.get_effect_size())
+        self.assertEqual(-0.5, summary.get_mean())
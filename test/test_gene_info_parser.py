@@ -0,0 +1,35 @@
+from unittest import TestCase
+import os.path
+from idg2sl import GeneInfoParser
+from idg2sl import SL_DatasetParser
+
+
+class TestGeneInfoParser(TestCase):
+    """
+    This class tests the GeneInfoParser with the gzipped NCBI gene_info file
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        inputfile = os.path.join(os.path.dirname(__file__), 'data', 'Homo_sapiens.gene_info.gz')
+        cls.parser = GeneInfoParser(inputfile)
+
+    def tearDown(self) -> None:
+        SL_DatasetParser.set_hgnc_index(None)
+
+    def test_taxa(self):
+        self.assertEqual(['63221', '741158', '9606'], self.parser.get_taxa())
+        with self.assertRaises(ValueError):
+            self.parser.get_taxon_index('10090')
+
+    def test_human_dictionaries(self):
+        entrez = self.parser.get_entrez_dictionary()
+        self.assertEqual('1956', entrez['EGFR'])
+        self.assertEqual('ENSG00000146648', self.parser.get_ensembl_dictionary()['EGFR'])
+        self.assertEqual('EGFR', self.parser.get_synonym_dictionary()['ERBB'])
+        # non-coding genes are not in the HGNC protein-coding file
+        self.assertIn('MALAT1', entrez)
+
+    def test_plugs_into_dataset_parser(self):
+        SL_DatasetParser.set_hgnc_index(self.parser)
+        parser = SL_DatasetParser(fname=None, pmid='1')
+        self.assertEqual('NCBIGene:1956', parser.get_ncbigene_curie(parser.get_current_symbol('ERBB')))
@@ -0,0 +1,44 @@
+from unittest import TestCase
+from idg2sl import SlConstants
+from idg2sl import SliTable
+from idg2sl.gene_pair import GenePairKey, GenePairGroups
+from .sli_fixtures import make_sli
+
+
+class TestGenePairKey(TestCase):
+    def test_keys(self):
+        key = GenePairKey.undirected('NCBIGene:3845', 'NCBIGene:2')
+        self.assertEqual(key, GenePairKey.undirected(2, 3845))
+        self.assertEqual((2, 3845), GenePairKey.unpack(key))
+        self.assertEqual(('NCBIGene:2', 'NCBIGene:3845'), GenePairKey.get_curies(key))
+        self.assertFalse(GenePairKey.is_directed(key))
+        directed = GenePairKey.directed('NCBIGene:3845', 'NCBIGene:2')
+        self.assertTrue(GenePairKey.is_directed(directed))
+        self.assertEqual((3845, 2), GenePairKey.unpack(directed))
+        self.assertNotEqual(directed, GenePairKey.directed('NCBIGene:2', 'NCBIGene:3845'))
+        self.assertNotEqual(GenePairKey.directed(2, 3845), key)
+        with self.assertRaises(ValueError):
+            GenePairKey.undirected('HGNC:6407', 'NCBIGene:2')
+        with self.assertRaises(ValueError):
+            GenePairKey.undirected(2 ** 31, 2)
+        with self.assertRaisesRegex(ValueError, 'NCBI Gene number'):
+            GenePairKey.undirected('NCBIGene:', 2)
+        slis = [make_sli('KRAS', 'NCBIGene:3845', 'A2M', 'NCBIGene:2', SlConstants.ZSCORE, 1.0),
+                make_sli('KRAS', 'NCBIGene:3845', 'A2M', 'NCBIGene:abc', SlConstants.ZSCORE, 1.0)]
+        with self.assertRaisesRegex(ValueError, r'entry KRAS \(NCBIGene:3845\) - A2M \(NCBIGene:abc\)'):
+            GenePairGroups().add_all(slis)
+
+    def test_groups_and_arrays(self):
+        slis = [make_sli('KRAS', 'NCBIGene:3845', 'A2M', 'NCBIGene:2', SlConstants.ZSCORE, 1.0),
+                make_sli('A2M', 'NCBIGene:2', 'KRAS', 'NCBIGene:3845', SlConstants.ZSCORE, 3.0),
+                make_sli('KRAS', 'NCBIGene:3845', 'A2M', 'NCBIGene:2', SlConstants.ZSCORE, 2.0)]
+        groups = GenePairGroups()
+        groups.add_all(slis)
+        self.assertEqual([[1.0, 2.0], [3.0]], [[s.get_effect_size() for s in g] for g in groups.values()])
+        groups = GenePairGroups(directed=False)
+        groups.add_all(slis)
+        self.assertEqual({GenePairKey.undirected(2, 3845): slis}, groups)
+        table = SliTable(slis)
+        self.assertEqual([GenePairKey.from_sli(sli) for sli in slis], table.get_pair_keys().tolist())
+        self.assertEqual([GenePairKey.from_sli(sli, directed=True) for sli in slis],
+                         table.get_pair_keys(directed=True).tolist())
@@ -0,0 +1,78 @@
+from unittest import TestCase
+import os.path
+import shutil
+import tempfile
+from idg2sl import HgncParser
+from idg2sl.hgnc_cache import HgncIndexCache
+
+
+class TestHgncIndexCache(TestCase):
+    """
+    This class tests the on-disk compiled HGNC index
+    """
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.mkdtemp()
+        self.inputfile = os.path.join(self.tmpdir, 'hgnc_small.txt')
+        shutil.copy(os.path.join(os.path.dirname(__file__), 'data', 'hgnc_small.txt'), self.inputfile)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir)
+
+    def test_cache_roundtrip(self):
+        cache = HgncIndexCache(self.inputfile)
+        self.assertIsNone(cache.read())
+        parser = HgncParser.load(self.inputfile)
+        # the mappings, and thus the index, are only built when they are used
+        self.assertFalse(os.path.exists(cache.cache_fname))
+        parser.get_synonym_dictionary()
+        parser.get_ensembl_dictionary()
+        parser.get_entrez_dictionary()
+        sections = cache.read()
+        self.assertIsNotNone(sections)
+        cached = HgncParser.load(self.inputfile)
+        self.assertEqual(dict(parser.get_entrez_dictionary()), dict(cached.get_entrez_dictionary()))
+        self.assertEqual(dict(parser.get_synonym_dictionary()), dict(cached.get_synonym_dictionary()))
+        self.assertEqual('ENSG00000148584', cached.get_ensembl_dictionary()['A1CF'])
+
+    def test_cache_invalidated_by_change(self):
+        HgncParser.load(self.inputfile)
+        with open(self.inputfile) as f:
+            lines = f.readlines()
+        with open(self.inputfile, 'w') as f:
+            f.writelines(lines[:-1])
+        cache = HgncIndexCache(self.inputfile)
+        self.assertIsNone(cache.read())
+        parser = HgncParser.load(self.inputfile)
+        self.assertEqual(9, len(parser.get_entrez_dictionary()))
+        self.assertIsNotNone(cache.read())
+
+    def test_missing_sections_are_built_and_added(self):
+        HgncParser.load(self.inputfile).get_entrez_dictionary()
+        cache = HgncIndexCache(self.inputfile)
+        self.assertEqual({'symbols', 'entrez'}, set(cache.read()))
+        parser = HgncParser.load(self.inputfile)
+        self.assertEqual('A2ML1', parser.get_synonym_dictionary()['CPAMD9'])
+        self.assertEqual({'symbols', 'entrez', 'synonym'}, set(cache.read()))
+        self.assertEqual('29974', parser.get_entrez_dictionary()['A1CF'])
+
+    def test_removed_index_file(self):
+        HgncParser.load(self.inputfile).get_entrez_dictionary()
+        parser = HgncParser.load(self.inputfile)
+        self.assertEqual(10, len(parser.get_entrez_dictionary()))
+        # no file is kept open; sections that were not read yet are built from the HGNC file
+        os.remove(HgncIndexCache(self.inputfile).cache_fname)
+        self.assertEqual('ENSG00000148584', parser.get_ensembl_dictionary()['A1CF'])
+
+    def test_sections_are_loaded_lazily(self):
+        parser = HgncParser.load(self.inputfile)
+        for mapping in (parser.get_entrez_dictionary(), parser.get_ensembl_dictionary(),
+                        parser.get_synonym_dictionary()):
+            self.assertGreater(len(mapping), 0)
+        sections = HgncIndexCache(self.inputfile).read()
+        parser = HgncParser._from_sections(self.inputfile, sections)
+        self.assertEqual('29974', parser.get_entrez_dictionary()['A1CF'])
+        self.assertTrue(sections.is_loaded('entrez'))
+        self.assertFalse(sections.is_loaded('synonym'))
+        self.assertFalse(sections.is_loaded('ensembl'))
+        self.assertEqual('A2ML1', parser.get_synonym_dictionary()['CPAMD9'])
+        self.assertTrue(sections.is_loaded('synonym'))
@@ -12,8 +12,24 @@ class TestHgncParser(TestCase):
     def setUp(self) -> None:
         self.inputfile = os.path.join(os.path.dirname(
             __file__), 'data', 'hgnc_small.txt')
-        hgncparser = HgncParser(self.inputfile)
-        self.d = hgncparser.get_entrez_dictionary()
+        self.hgncparser = HgncParser(self.inputfile)
+        self.d = self.hgncparser.get_entrez_dictionary()
        
     def test_count_entries(self):
         self.assertEqual(10,len(self.d))
+
+    def test_ids(self):
+        self.assertEqual('29974', self.d['A1CF'])
+        self.assertEqual('ENSG00000148584', self.hgncparser.get_ensembl_dictionary()['A1CF'])
+
+    def test_synonyms(self):
+        synonyms = self.hgncparser.get_synonym_dictionary()
+        self.assertEqual('A2ML1', synonyms['CPAMD9'])
+        self.assertEqual('A1CF', synonyms.get('APOBEC1CF'))
+        self.assertIsNone(synonyms.get('NOT_A_GENE'))
+
+    def test_lookups_do_not_add_entries(self):
+        self.assertIsNone(self.d.get('NOT_A_GENE'))
+        with self.assertRaises(KeyError):
+            self.d['NOT_A_GENE']
+        self.assertEqual(10, len(self.d))
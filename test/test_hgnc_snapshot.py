@@ -0,0 +1,74 @@
+from unittest import TestCase
+import hashlib
+import http.server
+import os.path
+import shutil
+import tempfile
+import threading
+from idg2sl.hgnc_snapshot import HgncSnapshotStore
+
+
+class _HgncHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Serves the content of the server's 'hgnc' attribute with an ETag and answers conditional requests with 304
+    """
+    def do_GET(self):
+        self.server.requests += 1
+        etag = '"%s"' % hashlib.sha256(self.server.hgnc).hexdigest()[:16]
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(self.server.hgnc)))
+        self.end_headers()
+        self.wfile.write(self.server.hgnc)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHgncSnapshotStore(TestCase):
+    """
+    This class tests the HGNC snapshot store against a local HTTP server
+    """
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.mkdtemp()
+        self.server = http.server.HTTPServer(('127.0.0.1', 0), _HgncHandler)
+        self.server.hgnc = b'symbol\tentrez_id\nA1CF\t29974\n'
+        self.server.requests = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = 'http://127.0.0.1:%d/protein-coding_gene.txt' % self.server.server_address[1]
+        self.store = HgncSnapshotStore(cache_dir=self.tmpdir, url=self.url, offline=False, timeout=10)
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.tmpdir)
+
+    def test_download_is_reused(self):
+        path = self.store.get()
+        with open(path, 'rb') as f:
+            self.assertEqual(self.server.hgnc, f.read())
+        self.assertEqual(path, HgncSnapshotStore(cache_dir=self.tmpdir, url=self.url).get())
+        self.assertEqual(1, self.server.requests)
+
+    def test_refresh_only_downloads_changes(self):
+        old_path = self.store.get()
+        self.assertEqual(old_path, self.store.get(refresh=True))
+        self.assertEqual(2, self.server.requests)
+        self.server.hgnc += b'A2M\t2\n'
+        new_path = self.store.get(refresh=True)
+        self.assertNotEqual(old_path, new_path)
+        old_sha256 = os.path.basename(old_path)
+        # the previous release can still be used by pinning its checksum
+        self.assertEqual(old_path, self.store.get(ref=old_sha256[:12]))
+
+    def test_offline(self):
+        offline_store = HgncSnapshotStore(cache_dir=self.tmpdir, url=self.url, offline=True)
+        with self.assertRaises(ValueError):
+            offline_store.get()
+        path = self.store.get()
+        self.assertEqual(path, offline_store.get(refresh=True))
+        self.assertEqual(1, self.server.requests)
@@ -0,0 +1,58 @@
+import io
+from contextlib import redirect_stdout
+from unittest import TestCase
+from idg2sl import SlConstants
+from idg2sl import PairEvidenceIndex
+from .sli_fixtures import make_sli
+
+
+class TestPairEvidenceIndex(TestCase):
+    def setUp(self) -> None:
+        self.index = PairEvidenceIndex()
+        # EGFR (1956) and ANXA6 (309) in both orders and from three studies
+        self.index.add_all([make_sli('EGFR', 'NCBIGene:1956', 'ANXA6', 'NCBIGene:309', SlConstants.ZSCORE, -2.5,
+                                     '20858866', cell_line='A-431'),
+                            make_sli('EGFR', 'NCBIGene:1956', 'ANXA6', 'NCBIGene:309', SlConstants.ZSCORE, 3.0,
+                                     '20858866', cell_line='A-431'),
+                            make_sli('EGFR', 'NCBIGene:1956', 'A2M', 'NCBIGene:2', SlConstants.PVAL, 0.2, '1',
+                                     SL=False)])
+        self.index.add_all([make_sli('ANXA6', 'NCBIGene:309', 'EGFR', 'NCBIGene:1956', SlConstants.PVAL, 0.01, '2',
+                                     cell_line='HeLa', assay=SlConstants.CELL_VIABILITY_ASSAY),
+                            make_sli('ANXA6', 'NCBIGene:309', 'EGFR', 'NCBIGene:1956', SlConstants.PVAL, 0.04, '2'),
+                            make_sli('ANXA6', 'NCBIGene:309', 'EGFR', 'NCBIGene:1956', 'n/a', 'n/a', '3', SL=False)])
+
+    def test_evidence(self):
+        self.assertEqual(2, len(self.index))
+        evidence = self.index.get_evidence('NCBIGene:1956', 'NCBIGene:309')
+        self.assertIs(evidence, self.index.get_evidence(309, 1956))
+        self.assertIs(evidence, self.index.get_evidence_by_symbols('ANXA6', 'EGFR'))
+        self.assertEqual(3, evidence.get_study_count())
+        self.assertEqual(['20858866', '2', '3'], evidence.get_pmids())
+        self.assertEqual(['A-431', 'HeLa'], evidence.get_cell_lines())
+        self.assertEqual([SlConstants.RNA_INTERFERENCE_ASSAY, SlConstants.CELL_VIABILITY_ASSAY],
+                         evidence.get_assays())
+        self.assertEqual((4, 1), (evidence.n_positive, evidence.n_negative))
+        self.assertEqual({SlConstants.ZSCORE: 3.0, SlConstants.PVAL: 0.01}, evidence.best_effects)
+        self.assertIsNone(self.index.get_evidence('NCBIGene:2', 'NCBIGene:309'))
+        self.assertIsNone(self.index.get_evidence_by_symbols('EGFR', 'KRAS'))
+
+    def test_tsv(self):
+        lines = [self.index.get_tsv_line(evidence, {'EGFR': 'ENSG00000146648'}).split('\t') for evidence in self.index]
+        self.assertEqual(len(PairEvidenceIndex.get_tsv_header().split('\t')), len(lines[0]))
+        # the gene with the smaller id is gene A
+        self.assertEqual(['ANXA6', 'NCBIGene:309', 'n/a', 'EGFR', 'NCBIGene:1956', 'ENSG00000146648', '3'],
+                         lines[0][:7])
+        self.assertEqual('Z-score=3.0|p-value=0.01', lines[0][-1])
+        self.assertEqual(['A2M', 'NCBIGene:2'], lines[1][:2])
+
+    def test_entries_with_invalid_ids_are_skipped(self):
+        index = PairEvidenceIndex()
+        with redirect_stdout(io.StringIO()) as out:
+            index.add_all([make_sli('EGFR', 'NCBIGene:1956', 'KRAS', 'NCBIGene:', SlConstants.PVAL, 0.01, '4'),
+                           make_sli('EGFR', 'NCBIGene:1956', 'KRAS', 'NCBIGene:abc', SlConstants.PVAL, 0.01, '4'),
+                           make_sli('EGFR', 'NCBIGene:1956', 'A2M', 'NCBIGene:2', SlConstants.PVAL, 0.01, '4')])
+        self.assertEqual(1, len(index))
+        self.assertIsNotNone(index.get_evidence('NCBIGene:2', 'NCBIGene:1956'))
+        warnings = out.getvalue().splitlines()
+        self.assertEqual(2, len(warnings))
+        self.assertIn('KRAS (NCBIGene:abc)', warnings[1])
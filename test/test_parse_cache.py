@@ -0,0 +1,75 @@
+from unittest import TestCase
+import os.path
+import tempfile
+from idg2sl import HgncParser
+from idg2sl import SL_DatasetParser
+from idg2sl import SyntheticLethalInteraction
+from idg2sl import ParseResultCache
+
+
+class CountingParser(SL_DatasetParser):
+    calls = 0
+
+    def __init__(self, fname):
+        super().__init__(fname=fname, pmid='1')
+
+    def parse(self):
+        CountingParser.calls += 1
+        with open(self.fname) as f:
+            geneB = f.read().strip()
+        sli = SyntheticLethalInteraction(gene_A_symbol='A1CF', gene_A_id=self.get_ncbigene_curie('A1CF'),
+                                         gene_B_symbol=geneB, gene_B_id=self.get_ncbigene_curie(geneB),
+                                         gene_A_pert='n/a', gene_B_pert='n/a', effect_type='n/a', effect_size=1.0,
+                                         assay='n/a', pmid=self.pmid, SL=True)
+        return [sli]
+
+
+class TestParseResultCache(TestCase):
+    def setUp(self) -> None:
+        inputfile = os.path.join(os.path.dirname(__file__), 'data', 'hgnc_small.txt')
+        self.hgnc = HgncParser(inputfile)
+        SL_DatasetParser.set_hgnc_index(self.hgnc)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.data_fname = os.path.join(self.tmpdir.name, 'input.txt')
+        with open(self.data_fname, 'w') as f:
+            f.write('A2ML1\n')
+        self.cache = ParseResultCache(os.path.join(self.tmpdir.name, 'cache'))
+        CountingParser.calls = 0
+
+    def tearDown(self) -> None:
+        SL_DatasetParser.set_hgnc_index(None)
+        self.tmpdir.cleanup()
+
+    def test_unchanged_inputs_are_loaded_from_cache(self):
+        sli_list, cached = self.cache.get(CountingParser(self.data_fname), self.hgnc)
+        self.assertFalse(cached)
+        sli_list2, cached = self.cache.get(CountingParser(self.data_fname), self.hgnc)
+        self.assertTrue(cached)
+        self.assertEqual(1, CountingParser.calls)
+        self.assertEqual(sli_list[0].get_tsv_line(), sli_list2[0].get_tsv_line())
+
+    def test_changed_input_is_parsed_again(self):
+        self.cache.get(CountingParser(self.data_fname), self.hgnc)
+        with open(self.data_fname, 'w') as f:
+            f.write('A1BG\n')
+        sli_list, cached = self.cache.get(CountingParser(self.data_fname), self.hgnc)
+        self.assertFalse(cached)
+        self.assertEqual(2, CountingParser.calls)
+        self.assertEqual('A1BG', sli_list[0].get_gene_B_symbol())
+
+    def test_index_without_version_is_not_cached(self):
+        class Index:
+            pass
+        self.assertIsNone(self.cache.get_key(CountingParser(self.data_fname), Index()))
+
+    def test_key_covers_the_modules_imported_by_the_parser(self):
+        from idg2sl import Kessler2012Parser
+        self.assertEqual({'idg2sl.spec_parser'},
+                         ParseResultCache.get_imported_modules('idg2sl.parsers.kessler_2012_parser'))
+        # the modules of the package that the parser imports indirectly (e.g., SL_DatasetParser imports the evidence
+        # aggregation)
+        fnames = {os.path.basename(fname) for fname in self.cache._source_files(Kessler2012Parser)}
+        for fname in ['spec_parser.py', 'sl_dataset_parser.py', 'evidence_aggregation.py', 'compressed_input.py',
+                      'symbol_tables.py', 'table_reader.py']:
+            self.assertIn(fname, fnames)
+        self.assertNotIn('parse_cache.py', fnames)
@@ -0,0 +1,83 @@
+from unittest import TestCase
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import os.path
+from idg2sl import HgncParser
+from idg2sl import SL_DatasetParser
+from idg2sl.parser_registry import ParserRegistry
+
+
+class AnyGeneDictionary(dict):
+    """
+    An entrez dictionary that knows every symbol: the symbols of the small HGNC file keep their ids, and any
+    other symbol gets a new id (above the NCBI Gene ids) the first time it is looked up, so that the parsers
+    can be run on the full data files without the HGNC file
+    """
+    def __init__(self, entrez):
+        super().__init__(entrez.items())
+        self._next_id = itertools.count(900000000)
+
+    def __contains__(self, symbol):
+        return True
+
+    def get(self, symbol, default=None):
+        gene_id = super().get(symbol)
+        if gene_id is None:
+            gene_id = self.setdefault(symbol, str(next(self._next_id)))
+        return gene_id
+
+
+class FixtureIndex:
+    def __init__(self, hgnc):
+        self.entrez = AnyGeneDictionary(hgnc.get_entrez_dictionary())
+        self.ensembl = hgnc.get_ensembl_dictionary()
+        self.synonym = hgnc.get_synonym_dictionary()
+
+    def get_entrez_dictionary(self):
+        return self.entrez
+
+    def get_ensembl_dictionary(self):
+        return self.ensembl
+
+    def get_synonym_dictionary(self):
+        return self.synonym
+
+
+def run_parser(parser):
+    """
+    Returns the output of parser as a list of lines
+    """
+    return [sli.get_tsv_line() + '\t' + str(sli.is_maximum()) for sli in parser.parse()]
+
+
+class TestParserReentrancy(TestCase):
+    """
+    This class tests that parse() can be called again on the same parser object and from several threads at
+    the same time, with the same result
+    """
+    def setUp(self) -> None:
+        inputfile = os.path.join(os.path.dirname(__file__), 'data', 'hgnc_small.txt')
+        SL_DatasetParser.set_hgnc_index(FixtureIndex(HgncParser(inputfile)))
+        self.parsers = [(spec.name, spec.load()()) for spec in ParserRegistry(use_entry_points=False).get_specs()]
+
+    def tearDown(self) -> None:
+        SL_DatasetParser.set_hgnc_index(None)
+
+    def test_parse_twice(self):
+        for name, parser in self.parsers:
+            with self.subTest(parser=name):
+                sli_lines = run_parser(parser)
+                self.assertTrue(len(sli_lines) > 0)
+                self.assertEqual(sli_lines, run_parser(parser))
+
+    def test_parse_concurrently(self):
+        expected = [run_parser(parser) for _, parser in self.parsers]
+        # every parser is run twice, with both calls (and the calls of the other parsers) at the same time
+        tasks = [parser for _, parser in self.parsers for _ in range(2)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(run_parser, tasks))
+        for i, (name, _) in enumerate(self.parsers):
+            with self.subTest(parser=name):
+                self.assertTrue(len(expected[i]) > 0)
+                self.assertEqual(expected[i], results[2 * i])
+                self.assertEqual(expected[i], results[2 * i + 1])
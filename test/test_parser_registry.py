@@ -0,0 +1,77 @@
+from unittest import TestCase
+import importlib
+import inspect
+import os.path
+import re
+import idg2sl
+from idg2sl import HgncParser
+from idg2sl import ParserRegistry
+from idg2sl import SL_DatasetParser
+from idg2sl import register_parser
+from idg2sl.parsers.manual_entry import ManualEntry
+from idg2sl.spec_parser import SpecParser
+
+
+class TestParserRegistry(TestCase):
+    def setUp(self) -> None:
+        self.registry = ParserRegistry(use_entry_points=False)
+
+    def test_builtin_parsers_are_exported(self):
+        for name in self.registry.get_names():
+            self.assertIn(name, idg2sl.__all__)
+        parser_class = getattr(idg2sl, 'Steckel2012Parser')
+        self.assertIs(parser_class, self.registry.get_spec('Steckel2012Parser').load())
+
+    def test_specs_are_not_loaded_before_use(self):
+        spec = self.registry.get_spec('Turner2008Parser')
+        self.assertFalse(spec.is_loaded())
+        self.assertEqual(['data/turner-PARP1-2008.tsv'], list(spec.files))
+        self.assertTrue(issubclass(spec.load(), SL_DatasetParser))
+        self.assertTrue(spec.is_loaded())
+
+    def test_select_by_name_or_pmid(self):
+        specs = self.registry.get_specs(['Luo2009Parser', '18388863'])
+        self.assertEqual(['Luo2009Parser', 'Turner2008Parser'], [s.name for s in specs])
+        with self.assertRaises(ValueError):
+            self.registry.get_specs(['NoSuchParser'])
+
+    def test_builtin_specs_agree_with_the_parsers(self):
+        # the pmid and files of the registry are read from the sources of the parsers without importing them; they
+        # must be the ones of the parser classes (the files are the default file name and the data files named in
+        # the module)
+        inputfile = os.path.join(os.path.dirname(__file__), 'data', 'hgnc_small.txt')
+        SL_DatasetParser.set_hgnc_index(HgncParser(inputfile))
+        try:
+            for spec in self.registry.get_specs():
+                with self.subTest(parser=spec.name):
+                    parser_class = spec.load()
+                    if issubclass(parser_class, ManualEntry):
+                        # the manual entries are added by the constructor, and have many pmids and no files
+                        self.assertIsNone(spec.pmid)
+                        self.assertEqual((), spec.files)
+                        continue
+                    parser = parser_class()
+                    self.assertEqual(parser.pmid, spec.pmid)
+                    if issubclass(parser_class, SpecParser):
+                        self.assertEqual(parser_class.SPEC.label, spec.label)
+                    source = inspect.getsource(importlib.import_module(spec.module))
+                    files = set(re.findall(r"['\"](data/[^'\"]+)['\"]", source))
+                    if parser.fname is not None:
+                        files.add(parser.fname)
+                    self.assertEqual(files, set(spec.files))
+        finally:
+            SL_DatasetParser.set_hgnc_index(None)
+
+    def test_register_parser(self):
+        @register_parser("Registry test", pmid='1')
+        class RegistryTestParser(SL_DatasetParser):
+            def parse(self):
+                return []
+        registry = ParserRegistry.get_default()
+        try:
+            spec = registry.get_spec('RegistryTestParser')
+            self.assertEqual("Registry test", spec.label)
+            self.assertIs(RegistryTestParser, spec.load())
+        finally:
+            registry.unregister('RegistryTestParser')
+        self.assertNotIn('RegistryTestParser', registry.get_names())
@@ -0,0 +1,74 @@
+from unittest import TestCase
+import os.path
+from idg2sl import HgncParser
+from idg2sl import SL_DatasetParser
+from idg2sl import SyntheticLethalInteraction
+from idg2sl import ParserRunner
+from idg2sl.parser_runner import _init_worker
+
+
+class OneSliParser(SL_DatasetParser):
+    geneB = 'A2ML1'
+
+    def __init__(self):
+        super().__init__(fname=None, pmid='1')
+
+    def parse(self):
+        geneB = self.get_current_symbol(self.geneB)
+        sli = SyntheticLethalInteraction(gene_A_symbol='A1CF', gene_A_id=self.get_ncbigene_curie('A1CF'),
+                                         gene_B_symbol=geneB, gene_B_id=self.get_ncbigene_curie(geneB),
+                                         gene_A_pert='n/a', gene_B_pert='n/a', effect_type='n/a', effect_size=1.0,
+                                         assay='n/a', pmid=self.pmid, SL=True)
+        return [sli]
+
+
+class PreviousSymbolParser(OneSliParser):
+    geneB = 'CPAMD9'
+
+
+class FailingParser(OneSliParser):
+    geneB = 'NOTAGENE'
+
+
+class TestParserRunner(TestCase):
+    def setUp(self) -> None:
+        inputfile = os.path.join(os.path.dirname(__file__), 'data', 'hgnc_small.txt')
+        SL_DatasetParser.set_hgnc_index(HgncParser(inputfile))
+
+    def tearDown(self) -> None:
+        SL_DatasetParser.set_hgnc_index(None)
+
+    def test_results_are_in_input_order(self):
+        parsers = [('one', OneSliParser), ('previous', PreviousSymbolParser), ('again', OneSliParser)]
+        results = ParserRunner(parsers, processes=2).run()
+        self.assertEqual(['one', 'previous', 'again'], [r.label for r in results])
+        self.assertEqual('A2ML1', results[1].sli_list[0].get_gene_B_symbol())
+        self.assertEqual(3, results[1].stats.get_lookups())
+        self.assertTrue(all(r.seconds >= 0 for r in results))
+
+    def test_spawned_workers_use_the_injected_index(self):
+        # hgnc_small.txt has A2ML1 but the default HGNC file of a spawned worker would not be loaded
+        parsers = [('one', OneSliParser), ('previous', PreviousSymbolParser)]
+        results = ParserRunner(parsers, processes=2, start_method='spawn').run()
+        self.assertEqual(['A2ML1', 'A2ML1'], [r.sli_list[0].get_gene_B_symbol() for r in results])
+
+    def test_workers_keep_the_memoized_resolutions_of_the_same_index(self):
+        # a forked worker installs the index that it inherited from its parent, with the resolutions of the parent
+        ParserRunner([('one', OneSliParser)], processes=1).run()
+        cache = SL_DatasetParser.get_resolution_cache()
+        _init_worker(SL_DatasetParser.get_hgnc_index())
+        self.assertIs(cache, SL_DatasetParser.get_resolution_cache())
+        self.assertTrue(len(cache.entries) > 0)
+        inputfile = os.path.join(os.path.dirname(__file__), 'data', 'hgnc_small.txt')
+        _init_worker(HgncParser(inputfile))
+        self.assertIsNot(cache, SL_DatasetParser.get_resolution_cache())
+
+    def test_failures_are_reported_together(self):
+        parsers = [('fail', FailingParser), ('one', OneSliParser)]
+        with self.assertRaises(ValueError) as cm:
+            ParserRunner(parsers, processes=2).run()
+        self.assertIn('1 of 2 parsers failed', str(cm.exception))
+        results = ParserRunner(parsers, processes=1).run(raise_on_error=False)
+        self.assertFalse(results[0].is_ok())
+        self.assertIsNone(results[0].sli_list)
+        self.assertEqual(1, len(results[1].sli_list))
@@ -0,0 +1,98 @@
+from unittest import TestCase
+import os.path
+from idg2sl import HgncParser
+from idg2sl import SL_DatasetParser
+
+
+class SmallParser(SL_DatasetParser):
+    def __init__(self):
+        super().__init__(fname=None, pmid='1')
+
+    def parse(self):
+        return []
+
+
+class StreamingParser(SL_DatasetParser):
+    def __init__(self):
+        super().__init__(fname=None, pmid='1')
+
+    def parse_iter(self):
+        for symbol in ('A1CF', 'A2ML1'):
+            yield self.get_ncbigene_curie(symbol)
+
+
+class IncompleteParser(SL_DatasetParser):
+    def __init__(self):
+        super().__init__(fname=None, pmid='1')
+
+
+class TestSharedHgncIndex(TestCase):
+    """
+    This class tests that all parsers share one injected HGNC index
+    """
+    def setUp(self) -> None:
+        self.inputfile = os.path.join(os.path.dirname(
+            __file__), 'data', 'hgnc_small.txt')
+        self.hgnc = HgncParser(self.inputfile)
+        SL_DatasetParser.set_hgnc_index(self.hgnc)
+
+    def tearDown(self) -> None:
+        SL_DatasetParser.set_hgnc_index(None)
+
+    def test_injected_index(self):
+        self.assertIs(self.hgnc, SL_DatasetParser.get_hgnc_index())
+
+    def test_parsers_share_dictionaries(self):
+        parser1 = SmallParser()
+        parser2 = SmallParser()
+        self.assertIs(parser1.entrez_dict, parser2.entrez_dict)
+        self.assertIs(parser1.synonym_dict, parser2.synonym_dict)
+        self.assertEqual('NCBIGene:29974', parser1.get_ncbigene_curie('A1CF'))
+        self.assertEqual('A2ML1', parser2.get_current_symbol('CPAMD9'))
+
+    def test_resolve_symbols(self):
+        parser = SmallParser()
+        report = parser.resolve_symbols(['A1CF', 'CPAMD9', 'APOBEC1CF', 'A1CF', 'NOTAGENE'])
+        self.assertEqual(4, len(report))
+        self.assertEqual('exact', report['A1CF'].path)
+        self.assertEqual('NCBIGene:29974', report['A1CF'].ncbigene_curie)
+        self.assertEqual('previous', report['CPAMD9'].path)
+        self.assertEqual('A2ML1', report['CPAMD9'].current_symbol)
+        self.assertEqual('alias', report['APOBEC1CF'].path)
+        self.assertEqual('A1CF', report['APOBEC1CF'].current_symbol)
+        self.assertEqual('missing', report['NOTAGENE'].path)
+        self.assertFalse(report['NOTAGENE'].is_resolved())
+        with self.assertRaises(ValueError):
+            report.raise_if_unresolved()
+        report.raise_if_unresolved(ignore={'NOTAGENE'})
+
+    def test_resolutions_are_memoized(self):
+        parser1 = SmallParser()
+        parser2 = SmallParser()
+        self.assertIs(parser1.resolver.cache, parser2.resolver.cache)
+        self.assertEqual('A2ML1', parser1.get_current_symbol('CPAMD9'))
+        self.assertEqual('A2ML1', parser2.get_current_symbol('CPAMD9'))
+        with self.assertRaises(ValueError):
+            parser2.get_ncbigene_curie('CPAMD9')
+        stats = SL_DatasetParser.get_resolution_cache().get_stats()['SmallParser']
+        self.assertEqual(1, stats.misses)
+        self.assertEqual(2, stats.hits)
+
+    def test_rescue_candidates(self):
+        parser = SmallParser()
+        report = parser.resolve_symbols(['a1cf', 'A2ML', 'A1BG'], rescue=True)
+        self.assertEqual([], report.get_candidates('A1BG'))
+        self.assertEqual('case', report.get_candidates('a1cf')[0].method)
+        self.assertEqual('A1CF', report.get_candidates('a1cf')[0].current_symbol)
+        self.assertEqual('A2ML1', report.get_candidates('A2ML')[0].current_symbol)
+        with self.assertRaises(ValueError) as cm:
+            report.raise_if_unresolved()
+        self.assertIn('candidates', str(cm.exception))
+
+    def test_parse_and_parse_iter(self):
+        self.assertEqual(['NCBIGene:29974', 'NCBIGene:144568'], StreamingParser().parse())
+        self.assertEqual([], list(SmallParser().parse_iter()))
+        with self.assertRaises(NotImplementedError):
+            IncompleteParser().parse()
+        with self.assertRaises(NotImplementedError):
+            IncompleteParser().parse_iter()
@@ -0,0 +1,66 @@
+from unittest import TestCase
+import math
+from idg2sl import SyntheticLethalInteraction
+from idg2sl import SlConstants
+from idg2sl import SliTable
+
+
+def make_sli(geneB, geneB_id, effect_type, effect_size, pmid='1', SL=True):
+    return SyntheticLethalInteraction(gene_A_symbol='A1CF', gene_A_id='NCBIGene:29974', gene_B_symbol=geneB,
+                                      gene_B_id=geneB_id, gene_A_pert=SlConstants.SI_RNA,
+                                      gene_B_pert=SlConstants.SI_RNA, effect_type=effect_type,
+                                      effect_size=effect_size, assay=SlConstants.RNA_INTERFERENCE_ASSAY,
+                                      pmid=pmid, SL=SL)
+
+
+class TestSliTable(TestCase):
+    def setUp(self) -> None:
+        self.slis = [make_sli('A2M', 'NCBIGene:2', SlConstants.ZSCORE, -3.5),
+                     make_sli('A2M', 'NCBIGene:2', SlConstants.PVAL, 0.01, pmid='2', SL=False),
+                     make_sli('NAT1', 'NCBIGene:9', 'confidence.80%', 'true'),
+                     make_sli('NAT2', 'NCBIGene:10', SlConstants.PENETRANCE_ASSAY, 80, pmid='2')]
+        self.slis[0].set_maximum()
+        self.table = SliTable.from_records(self.slis)
+
+    def test_columns(self):
+        self.assertEqual(4, len(self.table))
+        self.assertEqual([2, 2, 9, 10], self.table.get_column('gene_B_id').tolist())
+        self.assertEqual(['1', '2', '1', '2'], self.table.get_values('pmid').tolist())
+        self.assertEqual(2, len(self.table.get_categories('pmid')))
+        effect_size = self.table.get_column('effect_size')
+        self.assertEqual(-3.5, effect_size[0])
+        self.assertTrue(math.isnan(effect_size[2]))
+        self.assertEqual(80.0, effect_size[3])
+        self.assertEqual([True, False, True, True], self.table.get_column('SL').tolist())
+        self.assertEqual([True, False, False, False], self.table.get_column('maximum').tolist())
+        with self.assertRaises(ValueError):
+            self.table.get_column('unknown')
+
+    def test_round_trip(self):
+        records = self.table.to_records()
+        self.assertEqual([sli.get_tsv_line() for sli in self.slis], [sli.get_tsv_line() for sli in records])
+        self.assertEqual('true', records[2].get_effect_size())
+        self.assertIs(int, type(records[3].get_effect_size()))
+        self.assertTrue(records[0].is_maximum())
+
+    def test_filter_and_append(self):
+        positives = self.table.filter(self.table.get_column('SL') & self.table.equals('pmid', '1'))
+        self.assertEqual(['A2M', 'NAT1'], positives.get_values('gene_B_symbol').tolist())
+        self.assertEqual(0, self.table.equals('pmid', 'unknown').sum())
+        positives.append(make_sli('NAT2', 'NCBIGene:10', SlConstants.ZSCORE, 2.0, pmid='3'))
+        self.assertEqual(['1', '1', '3'], positives.get_values('pmid').tolist())
+        self.assertEqual(4, len(self.table))
+
+    def test_concatenate_and_group_by(self):
+        other = SliTable([make_sli('NAT2', 'NCBIGene:10', SlConstants.ZSCORE, 2.0, pmid='3')])
+        table = SliTable.concatenate([self.table, other])
+        self.assertEqual(['1', '2', '1', '2', '3'], table.get_values('pmid').tolist())
+        groups = table.group_by(['gene_B_id'])
+        self.assertEqual([[0, 1], [2], [3, 4]], [groups[(g,)].tolist() for g in (2, 9, 10)])
+        groups = table.group_by(['pmid', 'SL'])
+        self.assertEqual([0, 2], groups[('1', True)].tolist())
+        self.assertEqual([1], groups[('2', False)].tolist())
+
+    def test_scores(self):
+        scores = self.table.get_scores().tolist()
+        self.assertEqual([3.5, -0.01, -math.inf, 80.0], scores)
@@ -0,0 +1,111 @@
+from unittest import TestCase
+import os.path
+import tempfile
+from idg2sl import HgncParser
+from idg2sl import SL_DatasetParser
+from idg2sl.spec_parser import SpecParser, DatasetSpec, SpecCondition
+
+SPEC = """
+name: SpecTestParser
+pmid: '1'
+file: %s
+gene_a: {symbol: A1CF, perturbation: SlConstants.OVEREXPRESSION}
+gene_b:
+  column: gene
+  perturbation: SlConstants.SI_RNA
+  symbol_map: {A2ML: A2ML1}
+  ignore: [NOTAGENE]
+effect: {type: SlConstants.ZSCORE, column: score}
+fields: {assay: SlConstants.RNA_INTERFERENCE_ASSAY, cell_line: HeLa}
+filters: ['score >= 1']
+sl: ['score >= 3', 'control < 2']
+"""
+
+PAIR_SPEC = """
+name: PairSpecTestParser
+pmid: '1'
+file: %s
+gene_a: {column: drug.target, perturbation: SlConstants.PHARMACEUTICAL, skip_unresolved: true}
+gene_b: {column: gene, perturbation: SlConstants.SI_RNA}
+effect: {type: SlConstants.PVAL, column: p}
+sl: {positive: ['p < 0.01'], negative: ['p >= 0.5']}
+listed:
+  gene_b: [AAAS]
+  effect: {type: SlConstants.N_A, value: SlConstants.N_A}
+"""
+
+
+class TestSpecParser(TestCase):
+    def setUp(self) -> None:
+        inputfile = os.path.join(os.path.dirname(__file__), 'data', 'hgnc_small.txt')
+        SL_DatasetParser.set_hgnc_index(HgncParser(inputfile))
+        self.tmpdir = tempfile.TemporaryDirectory()
+        table = os.path.join(self.tmpdir.name, 'table.tsv')
+        with open(table, 'w') as f:
+            f.write("gene\tscore\tcontrol\n")
+            f.write("A2ML\t4.0\t0.5\n")     # positive (via symbol_map)
+            f.write("A1BG\t3.5\t2.5\n")     # negative (control too high)
+            f.write("A2M\t0.5\t0\n")        # filtered out
+            f.write("NOTAGENE\t5\t0\n")     # ignored
+        self.spec_fname = os.path.join(self.tmpdir.name, 'spec.yaml')
+        with open(self.spec_fname, 'w') as f:
+            f.write(SPEC % table)
+
+    def tearDown(self) -> None:
+        SL_DatasetParser.set_hgnc_index(None)
+        self.tmpdir.cleanup()
+
+    def test_generated_parser(self):
+        parser_class = SpecParser.create_class(self.spec_fname, __name__)
+        self.assertEqual('SpecTestParser', parser_class.__name__)
+        sli_list = parser_class().parse()
+        self.assertEqual(['A2ML1', 'A1BG'], [sli.get_gene_B_symbol() for sli in sli_list])
+        self.assertEqual([True, False], [sli.is_positive_SLI() for sli in sli_list])
+        self.assertEqual(4.0, sli_list[0].get_effect_size())
+        self.assertEqual('HeLa', sli_list[0].get_cell_line())
+        self.assertIn(self.spec_fname, parser_class().get_input_files())
+
+    def test_gene_a_column_and_negative_rule(self):
+        table = os.path.join(self.tmpdir.name, 'pairs.tsv')
+        with open(table, 'w') as f:
+            f.write("drug.target\tgene\tp\n")
+            f.write("A1CF\tA2M\t0.001\n")        # positive
+            f.write("A4GALT\tA2M\t0.8\n")        # negative
+            f.write("A4GALT\tA1BG\t0.1\n")       # neither positive nor negative
+            f.write("A2M\tA2M\t0.9\n")           # self-loop
+            f.write("NOTAGENE\tA2M\t0.9\n")      # unresolved gene A, skipped
+        spec_fname = os.path.join(self.tmpdir.name, 'pairs.yaml')
+        with open(spec_fname, 'w') as f:
+            f.write(PAIR_SPEC % table)
+        # a gene A column does not have a fixed gene for the listed entries
+        with self.assertRaises(ValueError):
+            SpecParser.create_class(spec_fname, __name__)
+        with open(spec_fname, 'w') as f:
+            f.write((PAIR_SPEC % table).split('listed:')[0])
+        sli_list = SpecParser.create_class(spec_fname, __name__)().parse()
+        self.assertEqual([('A1CF', 'A2M', True), ('A4GALT', 'A2M', False)],
+                         [(sli.get_gene_A_symbol(), sli.get_gene_B_symbol(), sli.is_positive_SLI())
+                          for sli in sli_list])
+        self.assertEqual(0.8, sli_list[1].get_effect_size())
+
+    def test_listed_entries(self):
+        table = os.path.join(self.tmpdir.name, 'table.tsv')
+        spec = DatasetSpec({'name': 'ListedTestParser', 'pmid': '1', 'file': table,
+                            'gene_a': {'symbol': 'A1CF', 'perturbation': 'n/a'},
+                            'gene_b': {'column': 'gene', 'perturbation': 'n/a', 'symbol_map': {'A2ML': 'A2ML1'},
+                                       'ignore': ['NOTAGENE']},
+                            'effect': {'type': 'SlConstants.ZSCORE', 'column': 'score'},
+                            'sl': {'negative': ['score < 1']},
+                            'listed': {'gene_b': ['AAAS'], 'effect': {'type': 'n/a'}}})
+        parser_class = type('ListedTestParser', (SpecParser,), {'SPEC': spec, 'SPEC_FILE': self.spec_fname})
+        sli_list = parser_class().parse()
+        self.assertEqual([('A2M', False), ('AAAS', True)],
+                         [(sli.get_gene_B_symbol(), sli.is_positive_SLI()) for sli in sli_list])
+
+    def test_invalid_specs(self):
+        with self.assertRaises(ValueError):
+            SpecCondition.parse('score ~ 3')
+        with self.assertRaises(ValueError):
+            DatasetSpec({'name': 'X', 'pmid': '1'})
+        with self.assertRaises(ValueError):
+            DatasetSpec.constant('SlConstants.NO_SUCH_CONSTANT')
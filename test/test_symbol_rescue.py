@@ -0,0 +1,29 @@
+from unittest import TestCase
+from idg2sl.symbol_rescue import SymbolRescueIndex
+
+
+class TestSymbolRescueIndex(TestCase):
+    """
+    This class tests the repairs and the trigram search of the SymbolRescueIndex
+    """
+    def setUp(self) -> None:
+        entrez = {'MARCHF1': '55016', 'SEPTIN2': '4735', 'TP53': '7157', 'TP63': '8626', 'EGFR': '1956'}
+        synonym = {'MARCH1': 'MARCHF1', 'SEPT2': 'SEPTIN2', 'ERBB': 'EGFR', 'TP73L': 'TP63', 'P53': 'MULTIPLE'}
+        self.index = SymbolRescueIndex(entrez, synonym)
+
+    def test_excel_dates(self):
+        for date in ('1-Mar', '01-Mar', 'Mar-1', '1-MAR-2020'):
+            candidates = self.index.rescue(date)
+            self.assertEqual('MARCHF1', candidates[0].current_symbol)
+            self.assertEqual('excel-date', candidates[0].method)
+        self.assertEqual('SEPTIN2', self.index.rescue('2-Sep')[0].current_symbol)
+
+    def test_case(self):
+        self.assertEqual('EGFR', self.index.rescue('Erbb')[0].current_symbol)
+
+    def test_trigrams(self):
+        candidates = self.index.rescue('TP53X')
+        self.assertEqual('TP53', candidates[0].current_symbol)
+        self.assertEqual('trigram', candidates[0].method)
+        self.assertEqual(len(candidates), len(set(c.current_symbol for c in candidates)))
+        self.assertEqual([], self.index.rescue('ZZZZZZ'))
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from idg2sl import SyntheticLethalInteraction
 
@@ -42,3 +43,53 @@ class TestSyntheticLethalInteraction(unittest.TestCase):
                                  .format(param, getter(), value))
 
 
+
+    def test_compact_records(self):
+        self.assertFalse(hasattr(self.sli, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.sli.unknown_attribute = 1
+        # categorical values that are equal but not identical are stored once
+        parameters = dict(self.parameters, assay=''.join(['this', 'Assay']))
+        other = SyntheticLethalInteraction(**parameters)
+        self.assertIs(self.sli.get_assay(), other.get_assay())
+        # values that are not strings are kept as they are (1 and 1.0 are equal, but not the same value)
+        SyntheticLethalInteraction(**dict(self.parameters, pmid=1))
+        self.assertIs(float, type(SyntheticLethalInteraction(**dict(self.parameters, pmid=1.0)).get_pmid()))
+
+    def test_pickle(self):
+        self.sli.set_maximum()
+        copy = pickle.loads(pickle.dumps(self.sli, protocol=pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(self.sli.get_tsv_line(), copy.get_tsv_line())
+        self.assertTrue(copy.is_maximum())
+
+    def test_from_columns(self):
+        columns = {'gene_B_symbol': ['PTAR1', 'A2M'], 'gene_B_id': ['NCBIGene:375743', 'NCBIGene:2'],
+                   'SL': [True, False]}
+        fields = {k: v for k, v in self.parameters.items() if k not in columns}
+        batch = SyntheticLethalInteraction.from_columns(columns, **fields)
+        other = SyntheticLethalInteraction(**dict(self.parameters, gene_B_symbol='A2M', gene_B_id='NCBIGene:2',
+                                                  SL=False))
+        self.assertEqual([self.sli.get_tsv_line(), other.get_tsv_line()], [sli.get_tsv_line() for sli in batch])
+        self.assertIs(self.sli.get_assay(), batch[1].get_assay())
+        self.assertFalse(batch[0].is_maximum())
+
+    def test_from_columns_errors(self):
+        columns = {'gene_B_symbol': ['PTAR1', None, 'VPS54'],
+                   'gene_B_id': ['NCBIGene:375743', '2', 'NCBIGene:51542'], 'SL': [True, True, False]}
+        fields = {k: v for k, v in self.parameters.items() if k not in columns and k != 'pmid'}
+        with self.assertRaises(ValueError) as context:
+            SyntheticLethalInteraction.from_columns(columns, **fields)
+        message = str(context.exception)
+        self.assertIn("gene_B_symbol is None in 1 row(s) (1)", message)
+        self.assertIn("pmid is required", message)
+        self.assertIn("gene_B_id does not start with NCBIGene: in 1 row(s) (1)", message)
+        self.assertIn("self loops", message)
+
+    def test_constructor_errors(self):
+        parameters = dict(self.parameters, gene_B_id=self.parameters['gene_A_id'])
+        del parameters['assay']
+        with self.assertRaises(ValueError) as context:
+            SyntheticLethalInteraction(**parameters)
+        message = str(context.exception)
+        self.assertIn("assay is required", message)
+        self.assertIn("self loops", message)
@@ -0,0 +1,64 @@
+from unittest import TestCase
+import os.path
+import shutil
+import tempfile
+from idg2sl.table_reader import TableReader
+
+
+class TestTableReader(TestCase):
+    """
+    This class tests reading selected columns with the TableReader
+    """
+    def setUp(self) -> None:
+        self.inputfile = os.path.join(os.path.dirname(__file__), 'data', 'steckel-2012-small.tsv')
+
+    def test_selected_columns(self):
+        reader = TableReader(self.inputfile, ['D.Z-score', 'GeneID'], n_fields=6)
+        rows = list(reader)
+        self.assertEqual(20, len(rows))
+        self.assertEqual(('7.28', 'POLR2A'), rows[0])
+
+    def test_numeric_columns(self):
+        columns = TableReader(self.inputfile, ['GeneID', 'HCT-116.Z-score']).read_columns(numeric=['HCT-116.Z-score'])
+        self.assertEqual('POLR2A', columns['GeneID'][0])
+        self.assertAlmostEqual(9.78, columns['HCT-116.Z-score'][0])
+        self.assertEqual(20, len(columns['HCT-116.Z-score']))
+
+    def test_select_rows(self):
+        columns = TableReader(self.inputfile, ['GeneID', 'D.Z-score'], n_fields=6).read_columns(numeric=['D.Z-score'])
+        rows = TableReader.select_rows(columns, ['GeneID', 'D.Z-score'], columns['D.Z-score'] >= 7)
+        self.assertEqual(('POLR2A', 7.28), rows[0])
+        self.assertIs(float, type(rows[0][1]))
+        self.assertTrue(all(delta >= 7 for _, delta in rows))
+        self.assertEqual(20, len(TableReader.select_rows(columns, ['GeneID'])))
+
+    def test_read_columns_with_missing_fields(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            fname = os.path.join(tmpdir, 'short.tsv')
+            with open(fname, 'w') as f:
+                f.write('a\tb\n1\t2\n\n3\n')
+            columns = TableReader(fname, ['a', 'b']).read_columns(numeric=['a'])
+            self.assertEqual([1.0, 3.0], list(columns['a']))
+            self.assertEqual(['2', None], columns['b'])
+            with self.assertRaises(TypeError):
+                TableReader(fname, ['a', 'b']).read_columns(numeric=['b'])
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            TableReader(self.inputfile, ['NotAColumn'])
+        with self.assertRaises(ValueError):
+            TableReader(self.inputfile, ['GeneID'], n_fields=5)
+        tmpdir = tempfile.mkdtemp()
+        try:
+            fname = os.path.join(tmpdir, 'bad.tsv')
+            with open(fname, 'w') as f:
+                f.write('a\tb\n1\t2\n\n3\n4\t5\t6\n')
+            rows = TableReader(fname, ['b', 'a'], n_fields=2)
+            with self.assertRaises(ValueError):
+                list(rows)
+            self.assertEqual([('2', '1'), (None, '3')], list(TableReader(fname, ['b', 'a']))[:2])
+        finally:
+            shutil.rmtree(tmpdir)